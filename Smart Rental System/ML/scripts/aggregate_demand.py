@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+from csv_partitions import complete_length, read_header, read_range, window_digest
+from daily_counts import DailyCounts
+
+parser = argparse.ArgumentParser(description='Bring the daily demand series up to date with the rows added to the clean data since the last run.')
+parser.add_argument('--rebuild', action='store_true', help='recount the whole clean data instead of just the new rows')
+parser.add_argument('--by-site', action='store_true', help='also write daily counts per Type x GPS_Location')
+parser.add_argument('--by-model', action='store_true', help='also write daily counts per Type x Model')
+parser.add_argument('--weekly', action='store_true', help='also write weekly (Monday to Sunday) totals of each series written')
+args = parser.parse_args()
+
+print(f"--- Starting Demand Aggregation ({'rebuild' if args.rebuild else 'incremental'}) ---")
+
+SOURCE_PATH = '../data/processed/rental_data_clean.csv'
+# Written by preprocess_rentals.py; its generation changes on every full rebuild of SOURCE_PATH
+SOURCE_STATE_PATH = '../data/processed/rental_data_clean.state.json'
+# Running counts of every grain and how far into SOURCE_PATH they have read, saved together so they never disagree
+STATE_PATH = '../data/processed/demand_counts.npz'
+OUTPUT_PATHS = {'type': '../data/processed/demand_timeseries.csv',
+                'site': '../data/processed/demand_timeseries_by_site.csv',
+                'model': '../data/processed/demand_timeseries_by_model.csv'}
+# Every grain is counted in the same pass; the columns of a multi-column key are joined with '_' as in the model file names
+GRAINS = {'type': ['Type'], 'site': ['Type', 'GPS_Location'], 'model': ['Type', 'Model']}
+CHUNK_ROWS = 250_000
+
+
+def count_rows(tables, start, end):
+    rows = 0
+    for chunk in read_range(SOURCE_PATH, start, end, CHUNK_ROWS, usecols=['Type', 'Model', 'GPS_Location', 'CheckOut_Date'], dtype=str):
+        days = pd.to_datetime(chunk['CheckOut_Date'], format='ISO8601', errors='coerce').to_numpy()
+        for grain, columns in GRAINS.items():
+            keys = chunk[columns[0]]
+            for column in columns[1:]: keys = keys + '_' + chunk[column]
+            tables[grain].add(keys, days)
+        rows += len(chunk)
+    return rows
+
+
+def write_csv(frame, path):
+    frame.to_csv(path + '.tmp')
+    os.replace(path + '.tmp', path)
+
+
+def source_generation():
+    """The clean data's generation, or '' when it was not written by preprocess_rentals.py and so cannot be resumed."""
+    try:
+        with open(SOURCE_STATE_PATH) as f:
+            return json.load(f).get('generation') or ''
+    except (OSError, ValueError):
+        return ''
+
+
+# --- Step 1: Load the running counts, unless the clean data was rewritten since they were saved ---
+if not os.path.exists(SOURCE_PATH):
+    print(f"Error: {SOURCE_PATH} not found!")
+    exit()
+start_time = time.perf_counter()
+header, _ = read_header(SOURCE_PATH)
+end = complete_length(SOURCE_PATH)
+generation = source_generation()
+tables, start = None, len(header)
+if not args.rebuild and os.path.exists(STATE_PATH):
+    with np.load(STATE_PATH) as state:
+        offset = int(state['offset'])
+        # A full re-clean can change rows anywhere in the file, which no check of a few windows would catch,
+        # so only a matching generation proves the file was appended to; the header and digest catch other writers
+        if not generation or 'generation' not in state or str(state['generation']) != generation:
+            print(f"The clean data was rebuilt since the last run (or {SOURCE_STATE_PATH} is missing). Recounting it all.")
+        elif str(state['header']) != header.decode() or end < offset or window_digest(SOURCE_PATH, offset) != str(state['digest']):
+            print("The clean data was rewritten, not appended to, since the last run. Recounting it all.")
+        else:
+            tables, start = {grain: DailyCounts.from_arrays(state, grain) for grain in GRAINS}, offset
+if tables is None:
+    tables = {grain: DailyCounts() for grain in GRAINS}
+
+# --- Step 2: Count the rows added since then, on whatever day they checked out ---
+print(f"Reading bytes {start:,} to {end:,} of {SOURCE_PATH}")
+new_rows = count_rows(tables, start, end)
+print(f"Counted {new_rows:,} new rows in {time.perf_counter() - start_time:.2f}s")
+
+state = {'offset': np.int64(end), 'digest': window_digest(SOURCE_PATH, end), 'header': header.decode(), 'generation': generation}
+for grain, table in tables.items():
+    state.update(table.arrays(grain))
+with open(STATE_PATH + '.tmp', 'wb') as f:
+    np.savez(f, **state)
+os.replace(STATE_PATH + '.tmp', STATE_PATH)
+
+# A last row without a newline yet may still be being written, so it is counted in this run's output but not saved
+if os.path.getsize(SOURCE_PATH) > end:
+    tables = {grain: table.copy() for grain, table in tables.items()}
+    count_rows(tables, end, os.path.getsize(SOURCE_PATH))
+
+# --- Step 3: Write the series in preprocess_timeseries.py's format ---
+grains = ['type'] + (['site'] if args.by_site else []) + (['model'] if args.by_model else [])
+for grain in grains:
+    daily = tables[grain].frame(columns_name='Type' if grain == 'type' else None)
+    write_csv(daily, OUTPUT_PATHS[grain])
+    print(f"{len(daily.columns)} daily series from {daily.index.min()} to {daily.index.max()} saved to: {OUTPUT_PATHS[grain]}")
+    if args.weekly:
+        weekly = daily.groupby(daily.index.to_period('W').start_time.rename('Week_Start')).sum()
+        weekly_path = OUTPUT_PATHS[grain].replace('.csv', '_weekly.csv')
+        write_csv(weekly, weekly_path)
+        print(f"Weekly totals saved to: {weekly_path}")
+print("--- Script Finished ---")
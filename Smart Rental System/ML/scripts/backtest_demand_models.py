@@ -0,0 +1,80 @@
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+from seasonal_forecaster import fit_seasonal_trend, forecast_seasonal_trend
+
+print("--- Starting Demand Forecasting Backtest (Prophet vs NumPy engine) ---")
+
+# Rolling-origin backtest: each fold trains on everything before its cutoff and forecasts the next HORIZON days
+HORIZON = 14
+FOLDS = 3
+
+# --- Step 1: Load the Time-Series Data ---
+try:
+    df = pd.read_csv('../data/processed/demand_timeseries.csv', index_col='CheckOut_Date', parse_dates=True)
+    print("Successfully loaded demand_timeseries.csv")
+except FileNotFoundError:
+    print("Error: demand_timeseries.csv not found! Please run preprocess_timeseries.py first.")
+    exit()
+
+equipment_types = list(df.columns)
+errors = {engine: {equipment: [] for equipment in equipment_types} for engine in ('prophet', 'numpy')}
+covered = {engine: {equipment: [] for equipment in equipment_types} for engine in ('prophet', 'numpy')}
+timings = {engine: {'fit_s': 0.0, 'predict_s': 0.0} for engine in ('prophet', 'numpy')}
+
+# --- Step 2: Run the Folds ---
+for fold in range(FOLDS, 0, -1):
+    cutoff = len(df) - fold * HORIZON
+    train, test = df.iloc[:cutoff], df.iloc[cutoff:cutoff + HORIZON]
+    print(f"\nFold: train {train.index.min().date()} .. {train.index.max().date()}, test {test.index.min().date()} .. {test.index.max().date()}")
+
+    # Prophet: one model per type, same settings as train_demand_model.py
+    for equipment in equipment_types:
+        start = time.perf_counter()
+        model = Prophet(daily_seasonality=False, weekly_seasonality=True, yearly_seasonality=False)
+        model.fit(train[[equipment]].reset_index().rename(columns={'CheckOut_Date': 'ds', equipment: 'y'}))
+        timings['prophet']['fit_s'] += time.perf_counter() - start
+        start = time.perf_counter()
+        forecast = model.predict(model.make_future_dataframe(periods=HORIZON, include_history=False))
+        timings['prophet']['predict_s'] += time.perf_counter() - start
+        actual = test[equipment].to_numpy(dtype=float)
+        errors['prophet'][equipment] += list(forecast['yhat'].to_numpy() - actual)
+        covered['prophet'][equipment] += list((forecast['yhat_lower'].to_numpy() <= actual) & (actual <= forecast['yhat_upper'].to_numpy()))
+
+    # NumPy engine: all types in one fit and one forecast
+    start = time.perf_counter()
+    params = fit_seasonal_trend(train)
+    timings['numpy']['fit_s'] += time.perf_counter() - start
+    start = time.perf_counter()
+    _, yhat, lower, upper = forecast_seasonal_trend(params, HORIZON)
+    timings['numpy']['predict_s'] += time.perf_counter() - start
+    for i, equipment in enumerate(equipment_types):
+        actual = test[equipment].to_numpy(dtype=float)
+        errors['numpy'][equipment] += list(yhat[:, i] - actual)
+        covered['numpy'][equipment] += list((lower[:, i] <= actual) & (actual <= upper[:, i]))
+
+# --- Step 3: Summarise ---
+report = {'horizon_days': HORIZON, 'folds': FOLDS, 'interval_width': 0.8, 'engines': {}}
+for engine in ('prophet', 'numpy'):
+    per_type = {}
+    for equipment in equipment_types:
+        e = np.array(errors[engine][equipment])
+        per_type[equipment] = {'mae': float(np.abs(e).mean()), 'rmse': float(np.sqrt((e ** 2).mean())), 'coverage': float(np.mean(covered[engine][equipment]))}
+    report['engines'][engine] = {'mae': float(np.mean([m['mae'] for m in per_type.values()])), 'rmse': float(np.mean([m['rmse'] for m in per_type.values()])),
+                                 'coverage': float(np.mean([m['coverage'] for m in per_type.values()])), 'fit_seconds': timings[engine]['fit_s'],
+                                 'predict_seconds': timings[engine]['predict_s'], 'per_type': per_type}
+
+print(f"\n{'engine':>8} {'MAE':>6} {'RMSE':>6} {'80% cover':>10} {'fit s':>8} {'predict s':>10}")
+for engine, summary in report['engines'].items():
+    print(f"{engine:>8} {summary['mae']:>6.3f} {summary['rmse']:>6.3f} {summary['coverage']:>10.2f} {summary['fit_seconds']:>8.3f} {summary['predict_seconds']:>10.4f}")
+
+# --- Step 4: Save the Report ---
+os.makedirs('../models/metrics', exist_ok=True)
+report_path = '../models/metrics/demand_backtest.json'
+with open(report_path, 'w') as f:
+    json.dump(report, f, indent=2)
+print(f"\nBacktest report saved to: {report_path}")
+print("--- Script Finished ---")
@@ -0,0 +1,116 @@
+import pandas as pd
+import numpy as np
+import joblib
+from sklearn.model_selection import train_test_split
+
+print("--- Starting Tree Model Compilation ---")
+
+# Rows kept in each compiled file so the backend can check it against the original model
+HOLDOUT_ROWS = 500
+
+
+def export_sklearn_forest(model):
+    """Flatten a fitted RandomForestClassifier into contiguous node arrays.
+
+    Leaves point to themselves and never move, so inference can walk every tree
+    in lock-step. A leaf's value is the tree's probability for class 1.
+    """
+    feature, threshold, left, right, value, missing_left, roots = [], [], [], [], [], [], []
+    offset = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        nodes = np.arange(tree.node_count) + offset
+        is_leaf = tree.children_left == -1
+        feature.append(np.where(is_leaf, 0, tree.feature))
+        threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+        left.append(np.where(is_leaf, nodes, tree.children_left + offset))
+        right.append(np.where(is_leaf, nodes, tree.children_right + offset))
+        # Same normalisation as DecisionTreeClassifier.predict_proba
+        proba = tree.value[:, 0, :]
+        normalizer = proba.sum(axis=1)
+        normalizer[normalizer == 0.0] = 1.0
+        value.append(proba[:, 1] / normalizer)
+        missing_left.append(getattr(tree, 'missing_go_to_left', np.zeros(tree.node_count)).astype(bool))
+        roots.append(offset)
+        offset += tree.node_count
+    return {'kind': 'forest_classifier', 'feature': feature, 'threshold': threshold, 'left': left, 'right': right, 'value': value, 'missing_left': missing_left, 'roots': roots,
+            'max_depth': max(estimator.tree_.max_depth for estimator in model.estimators_), 'feature_names': list(model.feature_names_in_),
+            # scikit-learn compares float32 inputs against float64 thresholds
+            'float32_inputs': True, 'nan_as_zero': False}
+
+
+def export_lightgbm(model):
+    """Flatten a fitted LGBMRegressor into the same node-array layout as the forest."""
+    dump = model.booster_.dump_model()
+    for tree_info in dump['tree_info']:
+        stack = [tree_info['tree_structure']]
+        while stack:
+            node = stack.pop()
+            if 'leaf_value' in node: continue
+            if node['decision_type'] != '<=' or node['missing_type'] != 'None':
+                raise ValueError(f"Unsupported LightGBM split ({node['decision_type']}, missing_type={node['missing_type']})")
+            stack += [node['left_child'], node['right_child']]
+
+    feature, threshold, left, right, value, roots = [], [], [], [], [], []
+    max_depth = 0
+    for tree_info in dump['tree_info']:
+        roots.append(len(feature))
+        # Pre-order walk; children are patched in once their index is known
+        stack = [(tree_info['tree_structure'], None, None, 0)]
+        while stack:
+            node, parent, side, depth = stack.pop()
+            index = len(feature)
+            if parent is not None: (left if side == 'left' else right)[parent] = index
+            if 'leaf_value' in node:
+                feature.append(0); threshold.append(np.inf); left.append(index); right.append(index); value.append(node['leaf_value'])
+                max_depth = max(max_depth, depth)
+            else:
+                feature.append(node['split_feature']); threshold.append(node['threshold']); left.append(-1); right.append(-1); value.append(0.0)
+                stack.append((node['right_child'], index, 'right', depth + 1))
+                stack.append((node['left_child'], index, 'left', depth + 1))
+    # LightGBM with missing_type None scores NaN as 0
+    return {'kind': 'boosted_regressor', 'feature': [feature], 'threshold': [threshold], 'left': [left], 'right': [right], 'value': [value], 'missing_left': [np.zeros(len(feature), dtype=bool)], 'roots': roots,
+            'max_depth': max_depth, 'feature_names': list(dump['feature_names']), 'float32_inputs': False, 'nan_as_zero': True}
+
+
+def save_compiled(exported, holdout, path):
+    np.savez(path, kind=exported['kind'], feature=np.concatenate(exported['feature']).astype(np.int32), threshold=np.concatenate(exported['threshold']).astype(np.float64),
+             left=np.concatenate(exported['left']).astype(np.int32), right=np.concatenate(exported['right']).astype(np.int32), value=np.concatenate(exported['value']).astype(np.float64),
+             missing_left=np.concatenate(exported['missing_left']), roots=np.array(exported['roots'], dtype=np.int32), max_depth=exported['max_depth'],
+             feature_names=np.array(exported['feature_names']), float32_inputs=exported['float32_inputs'], nan_as_zero=exported['nan_as_zero'], holdout=holdout)
+
+
+# --- Step 1: Load the Clean Data ---
+try:
+    df = pd.read_csv('../data/processed/rental_data_clean.csv')
+    print("Successfully loaded rental_data_clean.csv")
+except FileNotFoundError:
+    print("Error: rental_data_clean.csv not found!")
+    exit()
+
+# --- Step 2: Compile the Breakdown Model ---
+# Same features and split as train.py, so the holdout rows are its test set
+try:
+    model = joblib.load('../models/rental_predictor.pkl')
+    y = (df['Breakdowns'] > 0).astype(int)
+    X = pd.get_dummies(df.drop(columns=['Equipment_ID', 'Customer_ID', 'CheckOut_Date', 'Planned_Return_Date', 'CheckIn_Date', 'Rental_Status', 'Breakdowns', 'Overdue_Fine_USD', 'Total_Bill_USD']), drop_first=True)
+    X = X.reindex(columns=model.feature_names_in_, fill_value=0)
+    _, X_test = train_test_split(X, test_size=0.2, random_state=42, stratify=y)
+    save_compiled(export_sklearn_forest(model), X_test.to_numpy(dtype=float)[:HOLDOUT_ROWS], '../models/rental_predictor_compiled.npz')
+    print("Breakdown model compiled to: ../models/rental_predictor_compiled.npz")
+except FileNotFoundError:
+    print("Breakdown model not found, skipping. Please run train.py first.")
+
+# --- Step 3: Compile the Price Model ---
+# Same features and split as train_price_model.py
+try:
+    model = joblib.load('../models/price_predictor.pkl')
+    X = pd.get_dummies(df.drop(columns=['Equipment_ID', 'Customer_ID', 'CheckOut_Date', 'Planned_Return_Date', 'CheckIn_Date', 'Rental_Status', 'Breakdowns', 'Rental_Cost_USD', 'Overdue_Fine_USD', 'Total_Bill_USD']), drop_first=True)
+    X = X.reindex(columns=model.feature_name_, fill_value=0)
+    _, X_test = train_test_split(X, test_size=0.2, random_state=42)
+    save_compiled(export_lightgbm(model), X_test.to_numpy(dtype=float)[:HOLDOUT_ROWS], '../models/price_predictor_compiled.npz')
+    print("Price model compiled to: ../models/price_predictor_compiled.npz")
+except FileNotFoundError:
+    print("Price model not found, skipping. Please run train_price_model.py first.")
+
+print("--- Script Finished ---")
@@ -0,0 +1,88 @@
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from csv_partitions import byte_ranges, read_range
+from parallel_training import atomic_dump, configured_n_jobs, resolve_n_jobs
+from running_moments import RunningMoments
+
+# Usage: python compute_feature_stats.py [workers]   (default: train.n_jobs in ML/config.yaml)
+# Writes the breakdown and anomaly statistics in one pass over the clean data:
+#   breakdown_stats.pkl             mean/std of every feature over all rentals
+#   anomaly_detector_<Type>.pkl     mean/std of the anomaly features per equipment type
+#   feature_moments.npz             the per-type running moments behind both, which the backend keeps updating
+WORKERS = int(sys.argv[1]) if len(sys.argv) > 1 else resolve_n_jobs(configured_n_jobs())
+
+DATA_PATH = '../data/processed/rental_data_clean.csv'
+MODELS_DIR = '../models'
+CHUNK_ROWS = 250_000
+
+# Key numerical features checked for extreme outliers by /predict_breakdown
+FEATURES_TO_CHECK = [
+    'Manufacture_Year', 'Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters',
+    'Fuel_Efficiency_L_per_hr', 'Distance_Traveled_km', 'Load_Cycles',
+    'Engine_Temp_Max', 'Hydraulic_Pressure_Max', 'Rental_Cost_USD',
+    'Rental_Duration_Days', 'Planned_Duration_Days', 'Overdue_Days',
+    'Equipment_Age_Years', 'Utilization_Rate'
+]
+# Features /detect_anomaly compares against the stats of the asset's type
+ANOMALY_FEATURES = [
+    'Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters',
+    'Fuel_Efficiency_L_per_hr', 'Load_Cycles', 'Utilization_Rate'
+]
+
+
+def partition_moments(byte_range):
+    """Per-type moments of every feature over one byte range of the clean CSV."""
+    moments = RunningMoments(FEATURES_TO_CHECK)
+    for chunk in read_range(DATA_PATH, *byte_range, CHUNK_ROWS, usecols=['Type'] + FEATURES_TO_CHECK):
+        moments.update(chunk['Type'].to_numpy(), chunk[FEATURES_TO_CHECK].to_numpy(dtype=float))
+    return moments
+
+
+if __name__ == '__main__':
+    print(f"--- Starting Feature Statistics Computation ({WORKERS} worker{'s' if WORKERS != 1 else ''}) ---")
+    start = time.perf_counter()
+
+    # --- Step 1: Summarise each partition of the clean data, in parallel when asked ---
+    try:
+        ranges = byte_ranges(DATA_PATH, WORKERS)
+    except FileNotFoundError:
+        print("Error: rental_data_clean.csv not found!")
+        exit()
+    if WORKERS > 1:
+        with ProcessPoolExecutor(WORKERS) as pool:
+            partitions = list(pool.map(partition_moments, ranges))
+    else:
+        partitions = [partition_moments(byte_range) for byte_range in ranges]
+
+    # --- Step 2: Merge the partitions ---
+    moments = RunningMoments(FEATURES_TO_CHECK)
+    for partition in partitions:
+        moments.merge(partition)
+    rows = int(moments.count.max(axis=1).sum()) if moments.groups else 0
+    print(f"Summarised {rows:,} rows from {len(ranges)} partition(s) in {time.perf_counter() - start:.2f}s")
+
+    # --- Step 3: Save the statistics in the layout the backend loads ---
+    stats_path = f'{MODELS_DIR}/breakdown_stats.pkl'
+    atomic_dump(moments.total().stats(''), stats_path)
+    print(f"\nBreakdown model statistics saved to: {stats_path}")
+
+    stats_saved = []
+    for equipment in moments.groups:
+        if equipment == '': continue
+        if moments.count[moments.groups.index(equipment)].max() < 2:
+            print(f"Not enough data for {equipment}, skipping.")
+            continue
+        stats = moments.stats(equipment)
+        stats = {key: {feature: values[feature] for feature in ANOMALY_FEATURES} for key, values in stats.items()}
+        model_path = f'{MODELS_DIR}/anomaly_detector_{equipment}.pkl'
+        atomic_dump(stats, model_path)
+        stats_saved.append(model_path)
+    print("Anomaly detection statistics saved to:")
+    for path in stats_saved:
+        print(f"- {path}")
+
+    moments_path = f'{MODELS_DIR}/feature_moments.npz'
+    moments.save(moments_path)
+    print(f"Running moments saved to: {moments_path}")
+    print("--- Script Finished ---")
@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import sys
+import numpy as np
+import pandas as pd
+
+print("--- Starting Columnar Conversion ---")
+
+# Usage: python convert_to_columnar.py [source.csv] [target directory]
+SOURCE_PATH = sys.argv[1] if len(sys.argv) > 1 else '../data/processed/rental_data_clean.csv'
+TARGET_PATH = sys.argv[2] if len(sys.argv) > 2 else '../data/processed/rental_data_clean.columnar'
+DATE_COLUMNS = ['CheckOut_Date', 'Planned_Return_Date', 'CheckIn_Date']
+# Rows read per chunk, so memory stays bounded whatever the size of the CSV
+CHUNK_ROWS = 500_000
+# Must match COLUMNAR_FORMAT in backend/columnar_store.py
+COLUMNAR_FORMAT = 'rental-columnar-v1'
+
+
+def column_kind(column, dtype):
+    if column in DATE_COLUMNS: return 'date', 'int64'
+    if pd.api.types.is_integer_dtype(dtype): return 'int', 'int64'
+    if pd.api.types.is_float_dtype(dtype): return 'float', 'float64'
+    return 'category', 'int32'
+
+
+def encode(chunk_values, kind, dtype, dictionary):
+    """One chunk of a column as the raw values written to its file."""
+    if kind == 'date':
+        # Nanoseconds since 1970-01-01 (NaT is the int64 minimum), so the backend maps the file as datetime64[ns] as is
+        return chunk_values.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').astype('datetime64[ns]').view('int64')
+    if kind == 'category':
+        codes, uniques = pd.factorize(chunk_values)
+        global_codes = np.array([dictionary.setdefault(value, len(dictionary)) for value in uniques] + [-1], dtype=np.int32)
+        return global_codes[codes]  # factorize gives -1 for missing values, which picks the trailing -1
+    if kind == 'int' and not pd.api.types.is_integer_dtype(chunk_values.dtype):
+        raise ValueError(f"{chunk_values.name} has missing or non-integer values after the first chunk; it cannot be stored as int64.")
+    return chunk_values.to_numpy(dtype=dtype)
+
+
+# --- Step 1: Stream the CSV into one raw file per column ---
+if not os.path.exists(SOURCE_PATH):
+    print(f"Error: {SOURCE_PATH} not found!")
+    exit()
+staging_path = TARGET_PATH + '.tmp'
+shutil.rmtree(staging_path, ignore_errors=True)
+os.makedirs(staging_path)
+
+layout, files, dictionaries, rows = {}, {}, {}, 0
+for chunk in pd.read_csv(SOURCE_PATH, parse_dates=DATE_COLUMNS, chunksize=CHUNK_ROWS):
+    if not layout:
+        for column in chunk.columns:
+            layout[column] = column_kind(column, chunk[column].dtype)
+            files[column] = open(os.path.join(staging_path, f'{column}.bin'), 'wb')
+            if layout[column][0] == 'category': dictionaries[column] = {}
+    for column, (kind, dtype) in layout.items():
+        files[column].write(encode(chunk[column], kind, dtype, dictionaries.get(column)).tobytes())
+    rows += len(chunk)
+    print(f"Converted {rows} rows...")
+for f in files.values(): f.close()
+
+# --- Step 2: Sort each dictionary and narrow its codes to the smallest integer type ---
+# Sorted categories group and sort like the CSV's strings, so the backend can use the codes as they are
+for column, dictionary in dictionaries.items():
+    dtype = 'int8' if len(dictionary) < 2**7 else 'int16' if len(dictionary) < 2**15 else 'int32'
+    values = list(dictionary)
+    order = sorted(range(len(values)), key=lambda i: str(values[i]))
+    dictionaries[column] = [values[i] for i in order]
+    remap = np.empty(len(values) + 1, dtype=dtype)
+    remap[order] = np.arange(len(values))
+    remap[-1] = -1  # a missing value keeps code -1
+    path = os.path.join(staging_path, f'{column}.bin')
+    remap[np.fromfile(path, dtype=np.int32)].tofile(path)
+    layout[column] = ('category', dtype)
+
+# --- Step 3: Write the manifest and swap the new directory in ---
+manifest = {'format': COLUMNAR_FORMAT, 'rows': rows, 'columns': []}
+for column, (kind, dtype) in layout.items():
+    entry = {'name': column, 'kind': kind, 'dtype': dtype, 'file': f'{column}.bin'}
+    if kind == 'date': entry['unit'] = 'ns'
+    if kind == 'category': entry['categories'] = [str(value) for value in dictionaries[column]]
+    manifest['columns'].append(entry)
+with open(os.path.join(staging_path, 'manifest.json'), 'w') as f:
+    json.dump(manifest, f, indent=2)
+
+previous_path = TARGET_PATH + '.old'
+shutil.rmtree(previous_path, ignore_errors=True)
+if os.path.exists(TARGET_PATH): os.rename(TARGET_PATH, previous_path)
+os.rename(staging_path, TARGET_PATH)
+shutil.rmtree(previous_path, ignore_errors=True)
+
+print(f"\n{rows} rows in {len(layout)} columns written to: {TARGET_PATH}")
+print("--- Script Finished ---")
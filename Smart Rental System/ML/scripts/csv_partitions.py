@@ -0,0 +1,75 @@
+import hashlib
+import io
+import os
+import pandas as pd
+
+# Bytes at the start of a file and just before a resume point that must be unchanged for an incremental reader to trust it
+CHECK_WINDOW = 4096
+
+
+class ByteWindow(io.RawIOBase):
+    """Read-only view of `length` bytes of an open file, from its current position."""
+
+    def __init__(self, f, length):
+        self._file, self._remaining = f, length
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._file.read(min(len(buffer), self._remaining))
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
+def complete_length(path):
+    """Length of the file up to its last newline, so a row still being written is left out."""
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(end - 65536, 0)
+            f.seek(start)
+            block = f.read(end - start)
+            if b'\n' in block: return start + block.rindex(b'\n') + 1
+            end = start
+    return 0
+
+
+def read_header(path):
+    """(header line as bytes, column names) of a CSV file."""
+    with open(path, 'rb') as f:
+        header = f.readline()
+    return header, header.decode().strip().split(',')
+
+
+def byte_ranges(path, parts):
+    """Split the rows of a CSV into up to `parts` (start, end) byte ranges that begin and end on row boundaries."""
+    header, _ = read_header(path)
+    start, end = len(header), os.path.getsize(path)
+    bounds = [start]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(start + (end - start) * i // parts - 1, bounds[-1]))
+            f.readline()  # move to the start of the next row
+            bounds.append(min(f.tell(), end))
+    bounds.append(end)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def read_range(path, start, end, chunksize, **kwargs):
+    """Yield DataFrame chunks of the rows in bytes [start, end) of a CSV, named from its header."""
+    if end <= start: return
+    _, columns = read_header(path)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        yield from pd.read_csv(io.BufferedReader(ByteWindow(f, end - start)), header=None, names=columns, chunksize=chunksize, **kwargs)
+
+
+def window_digest(path, offset):
+    """Hash of the first and last CHECK_WINDOW bytes before `offset`, to spot a file that was rewritten rather than appended to."""
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read(min(offset, CHECK_WINDOW)))
+        f.seek(max(offset - CHECK_WINDOW, 0))
+        digest.update(f.read(min(offset, CHECK_WINDOW)))
+        return digest.hexdigest()
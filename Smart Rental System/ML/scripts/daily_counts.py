@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+
+class DailyCounts:
+    """Event counts per day and key, as a dense (days x keys) table that grows to fit whatever is added.
+
+    add() folds in a chunk of events with one bincount, so a table can be kept
+    up to date from just the new rows. Events for days before the first one
+    seen (late-arriving history) extend the table backwards and land on their
+    own day, the same as if they had arrived in order.
+    """
+
+    def __init__(self, keys=(), first_day=0, counts=None):
+        self.keys = list(keys)
+        # Row 0 of counts is this many days after 1970-01-01
+        self.first_day = int(first_day)
+        self.counts = np.zeros((0, len(self.keys)), dtype=np.int64) if counts is None else np.array(counts, dtype=np.int64)
+
+    def add(self, keys, days):
+        """Count one event per (keys[i], days[i]); events with a missing key or day are skipped."""
+        keys = pd.Series(keys, dtype=object).to_numpy()
+        days = np.asarray(days, dtype='datetime64[D]')
+        present = ~np.isnat(days) & pd.notna(keys)
+        if not present.any(): return
+        codes, uniques = pd.factorize(keys[present])
+        columns = np.array([self._column(key) for key in uniques], dtype=np.int64)[codes]
+        days = days[present].view('int64')
+        self._cover(int(days.min()), int(days.max()))
+        rows, width = self.counts.shape
+        self.counts += np.bincount((days - self.first_day) * width + columns, minlength=rows * width).reshape(rows, width)
+
+    def copy(self):
+        return DailyCounts(self.keys, self.first_day, self.counts)
+
+    def frame(self, index_name='CheckOut_Date', columns_name=None):
+        """The table as a DataFrame indexed by day, one column per key in sorted order."""
+        index = pd.DatetimeIndex(np.arange(self.first_day, self.first_day + len(self.counts)).astype('datetime64[D]').astype('datetime64[ns]'), name=index_name)
+        frame = pd.DataFrame(self.counts, index=index, columns=pd.Index(self.keys, name=columns_name))
+        return frame[sorted(self.keys)]
+
+    def arrays(self, prefix):
+        """The table as named arrays for np.savez; from_arrays() reads them back."""
+        return {f'{prefix}_keys': np.array(self.keys, dtype=str), f'{prefix}_first_day': np.int64(self.first_day), f'{prefix}_counts': self.counts}
+
+    @classmethod
+    def from_arrays(cls, data, prefix):
+        return cls([str(key) for key in data[f'{prefix}_keys']], int(data[f'{prefix}_first_day']), data[f'{prefix}_counts'])
+
+    def _column(self, key):
+        if key not in self.keys:
+            self.keys.append(key)
+            self.counts = np.pad(self.counts, ((0, 0), (0, 1)))
+        return self.keys.index(key)
+
+    def _cover(self, first, last):
+        if not len(self.counts):
+            self.first_day = first
+            self.counts = np.zeros((last - first + 1, len(self.keys)), dtype=np.int64)
+            return
+        before, after = max(self.first_day - first, 0), max(last - (self.first_day + len(self.counts) - 1), 0)
+        if before or after:
+            self.counts = np.pad(self.counts, ((before, after), (0, 0)))
+            self.first_day -= before
@@ -0,0 +1,27 @@
+import json
+import pandas as pd
+
+# Columns that pd.get_dummies one-hot encodes for the breakdown and price models
+CATEGORICAL_FEATURES = ['Type', 'Model', 'GPS_Location', 'Maintenance_Flag']
+
+
+def build_feature_schema(features, encoded_columns):
+    """Describe how `features` was turned into `encoded_columns` by get_dummies(drop_first=True).
+
+    The schema lists the model's column order, its numeric columns, and for every
+    categorical column a category -> column-index map. The category dropped by
+    drop_first maps to None, as do categories with no column of their own.
+    """
+    encoded_columns = list(encoded_columns)
+    slots = {column: i for i, column in enumerate(encoded_columns)}
+    categorical = {}
+    for column in features.columns:
+        if not pd.api.types.is_numeric_dtype(features[column]):
+            categorical[column] = {str(value): slots.get(f'{column}_{value}') for value in sorted(features[column].dropna().unique())}
+    numeric = [column for column in encoded_columns if column in features.columns and column not in categorical]
+    return {'columns': encoded_columns, 'numeric_columns': numeric, 'categorical_columns': categorical}
+
+
+def save_feature_schema(schema, path):
+    with open(path, 'w') as f:
+        json.dump(schema, f, indent=2)
@@ -0,0 +1,108 @@
+import argparse
+import os
+import time
+import numpy as np
+import pandas as pd
+
+parser = argparse.ArgumentParser(description='Write a synthetic rental history in the exact rental_data_clean.csv schema, for testing the backend at scale.')
+parser.add_argument('rows', type=int, help='number of rentals to write, e.g. 100000, 1000000 or 10000000')
+parser.add_argument('--assets', type=int, help='fleet size (default: one asset per 50 rentals)')
+parser.add_argument('--customers', type=int, help='number of customers (default: one per 10 assets)')
+parser.add_argument('--days', type=int, default=730, help='roughly how many days of history each asset gets (default: 730)')
+parser.add_argument('--end-date', default=None, help='latest checkout date, YYYY-MM-DD (default: the latest in the source data)')
+parser.add_argument('--seed', type=int, default=42)
+parser.add_argument('--source', default='../data/processed/rental_data_clean.csv', help='clean data the readings are drawn from')
+parser.add_argument('--output', help='where to write the CSV (default: ../data/synthetic/rental_data_clean_<rows>.csv)')
+args = parser.parse_args()
+
+print(f"--- Generating {args.rows:,} Synthetic Rentals ---")
+
+OUTPUT_PATH = args.output or f'../data/synthetic/rental_data_clean_{args.rows}.csv'
+ASSETS = args.assets or max(args.rows // 50, 1)
+CUSTOMERS = args.customers or max(ASSETS // 10, 1)
+# Assets written per chunk; each chunk holds every rental of its assets
+CHUNK_ROWS = 500_000
+DATE_COLUMNS = ['CheckOut_Date', 'Planned_Return_Date', 'CheckIn_Date']
+# An asset's identity, fixed across its rentals
+ASSET_COLUMNS = ['Type', 'Model', 'Manufacture_Year']
+# Readings, site, billing and durations of one rental, copied together from one source row so they stay consistent
+# (Total_Bill = Rental_Cost + Overdue_Fine, Overdue_Days = Rental_Duration - Planned_Duration, Rental_Status, ...)
+RENTAL_COLUMNS = ['Rental_Status', 'Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters', 'Fuel_Efficiency_L_per_hr', 'Distance_Traveled_km',
+                  'Load_Cycles', 'GPS_Location', 'Maintenance_Flag', 'Breakdowns', 'Engine_Temp_Max', 'Hydraulic_Pressure_Max', 'Rental_Cost_USD',
+                  'Overdue_Fine_USD', 'Total_Bill_USD', 'Rental_Duration_Days', 'Planned_Duration_Days', 'Overdue_Days', 'Utilization_Rate']
+
+
+def generate_chunk(rng, source, first_asset, rentals_per_asset):
+    """Every rental of assets first_asset .. first_asset + len(rentals_per_asset) - 1, newest first per asset."""
+    assets = len(rentals_per_asset)
+    asset_rows = by_model[rng.integers(0, len(by_model), assets)]
+    asset_models = source['Model_Code'].to_numpy()[asset_rows]
+    owner = np.repeat(np.arange(assets), rentals_per_asset)
+    rental_models = asset_models[owner]
+    rows = by_model[model_starts[rental_models] + (rng.random(len(owner)) * model_counts[rental_models]).astype(np.int64)]
+    chunk = source.iloc[rows][RENTAL_COLUMNS].reset_index(drop=True)
+
+    # Rental k of an asset ends before rental k-1 starts: step back by its duration plus an idle gap
+    duration = chunk['Rental_Duration_Days'].to_numpy()
+    step = duration + rng.poisson(gap_mean, len(chunk))
+    first_of_asset = np.r_[0, np.cumsum(rentals_per_asset)[:-1]]
+    step[first_of_asset] = 0
+    steps_back = np.cumsum(step)
+    steps_back -= np.repeat(steps_back[first_of_asset], rentals_per_asset)
+    # Spread the newest rentals over the last gap, so the fleet does not all check out on end_day
+    lead = (rng.random(assets) * (gap_mean + duration.mean() + 1)).astype(np.int64)
+    checkout = end_day - lead[owner] - steps_back
+    chunk['CheckOut_Date'] = checkout.astype('datetime64[D]')
+    chunk['Planned_Return_Date'] = (checkout + chunk['Planned_Duration_Days'].to_numpy()).astype('datetime64[D]')
+    chunk['CheckIn_Date'] = (checkout + duration).astype('datetime64[D]')
+
+    chunk['Equipment_ID'] = asset_ids[first_asset + owner]
+    for column in ASSET_COLUMNS:
+        chunk[column] = source[column].to_numpy()[asset_rows][owner]
+    # An asset is never built after its first rental
+    first_year = pd.Series(chunk['CheckOut_Date'].dt.year.to_numpy()).groupby(owner).transform('min').to_numpy()
+    chunk['Manufacture_Year'] = np.minimum(chunk['Manufacture_Year'].to_numpy(), first_year)
+    chunk['Equipment_Age_Years'] = chunk['CheckOut_Date'].dt.year - chunk['Manufacture_Year']
+    chunk['Customer_ID'] = customer_ids[rng.integers(0, CUSTOMERS, len(chunk))]
+    return chunk[list(source.columns.drop('Model_Code'))]
+
+
+# --- Step 1: Load the clean data the rentals are drawn from ---
+if not os.path.exists(args.source):
+    print(f"Error: {args.source} not found!")
+    exit()
+start_time = time.perf_counter()
+source = pd.read_csv(args.source, parse_dates=DATE_COLUMNS)
+source['Model_Code'], models = pd.factorize(source['Model'])
+# Source rows grouped by Model, so a rental's readings always come from the same kind of machine
+by_model = np.argsort(source['Model_Code'].to_numpy(), kind='stable')
+model_counts = np.bincount(source['Model_Code'], minlength=len(models))
+model_starts = np.r_[0, np.cumsum(model_counts)[:-1]]
+end_date = pd.Timestamp(args.end_date) if args.end_date else source['CheckOut_Date'].max()
+end_day = int(np.datetime64(end_date, 'D').astype(np.int64))
+rentals_per_asset = np.full(ASSETS, args.rows // ASSETS, dtype=np.int64)
+rentals_per_asset[:args.rows % ASSETS] += 1
+# The idle days between rentals that spread each asset's rentals over about --days
+gap_mean = max(args.days / max(args.rows / ASSETS, 1) - source['Rental_Duration_Days'].mean(), 0)
+asset_ids = np.array([f'EQ{i:0{max(4, len(str(ASSETS)))}d}' for i in range(1, ASSETS + 1)], dtype=object)
+customer_ids = np.array([f'CUST{i:0{max(3, len(str(CUSTOMERS)))}d}' for i in range(1, CUSTOMERS + 1)], dtype=object)
+print(f"{len(source):,} source rows, {ASSETS:,} assets, {CUSTOMERS:,} customers, {args.rows / ASSETS:.1f} rentals per asset, {gap_mean:.1f} idle days between rentals")
+
+# --- Step 2: Write the assets' rentals a chunk at a time ---
+os.makedirs(os.path.dirname(OUTPUT_PATH) or '.', exist_ok=True)
+rng = np.random.default_rng(args.seed)
+assets_per_chunk = max(CHUNK_ROWS * ASSETS // max(args.rows, 1), 1)
+written, first_checkout = 0, pd.Timestamp.max
+with open(OUTPUT_PATH + '.tmp', 'w', newline='') as f:
+    for first_asset in range(0, ASSETS, assets_per_chunk):
+        counts = rentals_per_asset[first_asset:first_asset + assets_per_chunk]
+        chunk = generate_chunk(rng, source, first_asset, counts)
+        chunk.to_csv(f, header=written == 0, index=False, date_format='%Y-%m-%d')
+        written += len(chunk)
+        first_checkout = min(first_checkout, chunk['CheckOut_Date'].min())
+        print(f"Wrote {written:,} rows...")
+os.replace(OUTPUT_PATH + '.tmp', OUTPUT_PATH)
+
+print(f"\n{written:,} rentals checked out from {first_checkout:%Y-%m-%d} to {end_date:%Y-%m-%d} saved to: {OUTPUT_PATH} "
+      f"in {time.perf_counter() - start_time:.1f}s")
+print("--- Script Finished ---")
@@ -0,0 +1,94 @@
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import joblib
+
+CONFIG_PATH = '../config.yaml'
+
+
+def configured_n_jobs(path=CONFIG_PATH, default=1):
+    """train.n_jobs from ML/config.yaml, or `default` when the file or PyYAML is missing."""
+    try:
+        import yaml
+        with open(path) as f:
+            config = yaml.safe_load(f) or {}
+    except (ImportError, FileNotFoundError):
+        return default
+    return int((config.get('train') or {}).get('n_jobs', default))
+
+
+def resolve_n_jobs(n_jobs, tasks=None):
+    """Worker processes for n_jobs read as scikit-learn does (-1 is every available core, -2 all but one), at most `tasks`."""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    workers = n_jobs if n_jobs > 0 else cores + 1 + n_jobs
+    return max(1, workers if tasks is None else min(workers, tasks))
+
+
+def atomic_dump(obj, path):
+    """joblib.dump to a temporary file next to `path`, then rename it into place, so readers never see half a model."""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        joblib.dump(obj, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path): os.remove(tmp_path)
+
+
+def _reset_peak_memory():
+    # On Linux, writing 5 to clear_refs resets VmHWM so it measures just the next fit
+    try:
+        with open('/proc/self/clear_refs', 'w') as f: f.write('5')
+    except OSError:
+        pass
+
+
+def _memory_mb(field):
+    """VmRSS (current) or VmHWM (peak) of this process; without /proc, the peak since the process started."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'): return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _fit_and_save(fit, name, path, args):
+    _reset_peak_memory()
+    rss_before = _memory_mb('VmRSS')
+    start = time.perf_counter()
+    model = fit(*args)
+    fit_seconds = time.perf_counter() - start
+    peak = _memory_mb('VmHWM')
+    atomic_dump(model, path)
+    # Memory of child processes (e.g. Prophet's Stan optimizer) is not included
+    return {'name': name, 'path': path, 'fit_seconds': fit_seconds, 'peak_mb': peak, 'fit_mb': max(peak - rss_before, 0.0)}
+
+
+def train_parallel(fit, jobs, n_jobs):
+    """Fit and save one model per (name, path, args) job, up to n_jobs at a time, yielding a report as each finishes.
+
+    fit(*args) runs in a worker process and returns the model, which the worker
+    saves with atomic_dump(), so models never travel back to the parent. `fit`
+    must be a module-level function, and callers need an
+    `if __name__ == '__main__':` guard for platforms that spawn workers.
+    """
+    workers = resolve_n_jobs(n_jobs, len(jobs))
+    if workers == 1:
+        for name, path, args in jobs:
+            yield _fit_and_save(fit, name, path, args)
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(_fit_and_save, fit, name, path, args) for name, path, args in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def print_training_report(reports, wall_seconds):
+    # peak MB is the worker's peak RSS during the fit; fit MB is how far that rose above the worker's RSS before it
+    print(f"\n{'model':<28} {'fit s':>7} {'peak MB':>8} {'fit MB':>7}")
+    for report in sorted(reports, key=lambda report: report['name']):
+        print(f"{report['name']:<28} {report['fit_seconds']:>7.2f} {report['peak_mb']:>8.0f} {report['fit_mb']:>7.1f}")
+    total = sum(report['fit_seconds'] for report in reports)
+    print(f"{len(reports)} models: {total:.2f}s of fitting in {wall_seconds:.2f}s wall time")
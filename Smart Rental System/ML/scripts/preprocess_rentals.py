@@ -0,0 +1,142 @@
+import json
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+import pandas as pd
+from csv_partitions import complete_length, read_header, read_range, window_digest
+
+# Usage: python preprocess_rentals.py [full|append]
+#   full    rebuild rental_data_clean.csv from the whole raw export (rows found only in the old output are not kept)
+#   append  clean only the rows added to the raw export since the last run and add them to the output
+MODE = sys.argv[1] if len(sys.argv) > 1 else 'full'
+if MODE not in ('full', 'append'):
+    print(f"Unknown mode '{MODE}'. Use: python preprocess_rentals.py [full|append]")
+    exit()
+
+print(f"--- Starting Rental Data Preprocessing (mode: {MODE}) ---")
+
+RAW_PATH = '../data/raw/rental_data.csv'
+OUTPUT_PATH = '../data/processed/rental_data_clean.csv'
+REJECTS_PATH = '../data/processed/rental_data_rejected.csv'
+# Where the last run stopped reading the raw export; append mode carries on from there. Its generation changes
+# whenever the output is rewritten rather than appended to, so readers that resume part-way (aggregate_demand.py) start over
+STATE_PATH = '../data/processed/rental_data_clean.state.json'
+# Rows held in memory at a time, whatever the size of the export
+CHUNK_ROWS = 250_000
+
+DATE_COLUMNS = ['CheckOut_Date', 'Planned_Return_Date', 'CheckIn_Date']
+TEXT_COLUMNS = ['Equipment_ID', 'Type', 'Model', 'Customer_ID', 'Rental_Status', 'GPS_Location', 'Maintenance_Flag']
+INTEGER_COLUMNS = ['Manufacture_Year', 'Operating_Hours', 'Idle_Hours', 'Distance_Traveled_km', 'Load_Cycles', 'Breakdowns', 'Engine_Temp_Max', 'Hydraulic_Pressure_Max', 'Rental_Cost_USD', 'Overdue_Fine_USD', 'Total_Bill_USD']
+FLOAT_COLUMNS = ['Fuel_Consumed_Liters', 'Fuel_Efficiency_L_per_hr']
+# Added by this script, in this order (the feature engineering step of ML/notebooks/eda.ipynb)
+DERIVED_COLUMNS = ['Rental_Duration_Days', 'Planned_Duration_Days', 'Overdue_Days', 'Equipment_Age_Years', 'Utilization_Rate']
+OVERDUE_FINE_PER_DAY_USD = 100
+
+
+def clean_chunk(raw):
+    """Derive the feature columns and split the chunk into (clean rows, raw rejected rows with a Reject_Reason)."""
+    chunk = raw.copy()
+    for column in DATE_COLUMNS:
+        chunk[column] = pd.to_datetime(chunk[column], format='%Y-%m-%d', errors='coerce')
+    for column in INTEGER_COLUMNS + FLOAT_COLUMNS:
+        chunk[column] = pd.to_numeric(chunk[column], errors='coerce')
+
+    chunk['Rental_Duration_Days'] = (chunk['CheckIn_Date'] - chunk['CheckOut_Date']).dt.days
+    chunk['Planned_Duration_Days'] = (chunk['Planned_Return_Date'] - chunk['CheckOut_Date']).dt.days
+    chunk['Overdue_Days'] = (chunk['Rental_Duration_Days'] - chunk['Planned_Duration_Days']).clip(lower=0)
+    chunk['Equipment_Age_Years'] = chunk['CheckOut_Date'].dt.year - chunk['Manufacture_Year']
+    chunk['Utilization_Rate'] = chunk['Operating_Hours'] / (chunk['Operating_Hours'] + chunk['Idle_Hours'] + 1e-6)
+
+    # The first failing check names the reason; every check is a vectorized comparison over the chunk
+    checks = [('missing or malformed date', chunk[DATE_COLUMNS].isna().any(axis=1)),
+              ('missing text field', chunk[TEXT_COLUMNS].isna().any(axis=1)),
+              ('missing or non-numeric reading', chunk[INTEGER_COLUMNS + FLOAT_COLUMNS].isna().any(axis=1)),
+              ('negative reading', (chunk[INTEGER_COLUMNS + FLOAT_COLUMNS] < 0).any(axis=1)),
+              ('non-integer value in an integer column', (chunk[INTEGER_COLUMNS] % 1 != 0).any(axis=1)),
+              ('CheckIn_Date before CheckOut_Date', chunk['Rental_Duration_Days'] < 0),
+              ('Planned_Return_Date before CheckOut_Date', chunk['Planned_Duration_Days'] < 0),
+              ('Manufacture_Year after CheckOut_Date', chunk['Equipment_Age_Years'] < 0),
+              ('Overdue_Fine_USD does not match Overdue_Days', chunk['Overdue_Fine_USD'] != chunk['Overdue_Days'] * OVERDUE_FINE_PER_DAY_USD),
+              ('Total_Bill_USD does not match Rental_Cost_USD + Overdue_Fine_USD', chunk['Total_Bill_USD'] != chunk['Rental_Cost_USD'] + chunk['Overdue_Fine_USD'])]
+    reason = pd.Series(None, index=chunk.index, dtype=object)
+    for message, failed in checks:
+        reason = reason.mask(reason.isna() & failed, message)
+
+    clean = chunk[reason.isna()].copy()
+    for column in INTEGER_COLUMNS + DERIVED_COLUMNS[:-1]:
+        clean[column] = clean[column].astype('int64')
+    rejected = raw[reason.notna()].assign(Reject_Reason=reason[reason.notna()])
+    return clean, rejected
+
+
+# --- Step 1: Work out which part of the raw export to read ---
+if not os.path.exists(RAW_PATH):
+    print(f"Error: {RAW_PATH} not found!")
+    exit()
+header, raw_columns = read_header(RAW_PATH)
+missing = [column for column in DATE_COLUMNS + TEXT_COLUMNS + INTEGER_COLUMNS + FLOAT_COLUMNS if column not in raw_columns]
+if missing:
+    print(f"Error: the raw export is missing columns: {', '.join(missing)}")
+    exit()
+end = complete_length(RAW_PATH)
+
+if MODE == 'append':
+    try:
+        with open(STATE_PATH) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        print(f"Error: {STATE_PATH} not found! Run 'python preprocess_rentals.py full' first.")
+        exit()
+    if state['header'] != header.decode() or end < state['raw_offset'] or window_digest(RAW_PATH, state['raw_offset']) != state['raw_digest']:
+        print("Error: the raw export was rewritten, not appended to, since the last run. Run 'python preprocess_rentals.py full'.")
+        exit()
+    if not os.path.exists(OUTPUT_PATH) or os.path.getsize(OUTPUT_PATH) < state['output_size']:
+        print(f"Error: {OUTPUT_PATH} is missing or shorter than the last run left it. Run 'python preprocess_rentals.py full'.")
+        exit()
+    start = state['raw_offset']
+    # Drop anything a run that failed part-way through appended after the last recorded state
+    os.truncate(OUTPUT_PATH, state['output_size'])
+    output_path, rejects_path = OUTPUT_PATH, REJECTS_PATH
+    output_rows, rejected_rows = state['output_rows'], state['rejected_rows']
+    generation = state.get('generation') or uuid.uuid4().hex
+else:
+    start = len(header)
+    # Written next to the old files and swapped in at the end, so a failed run leaves them intact
+    output_path, rejects_path = OUTPUT_PATH + '.tmp', REJECTS_PATH + '.tmp'
+    for path in (output_path, rejects_path):
+        if os.path.exists(path): os.remove(path)
+    output_rows, rejected_rows = 0, 0
+    generation = uuid.uuid4().hex
+print(f"Reading raw bytes {start:,} to {end:,} of {RAW_PATH}")
+
+# --- Step 2: Clean the raw rows chunk by chunk ---
+new_rows, new_rejected = 0, 0
+for chunk in read_range(RAW_PATH, start, end, CHUNK_ROWS, dtype={column: str for column in TEXT_COLUMNS}):
+    clean, rejected = clean_chunk(chunk)
+    clean.to_csv(output_path, mode='a', header=not os.path.exists(output_path), index=False, date_format='%Y-%m-%d')
+    if len(rejected):
+        rejected.to_csv(rejects_path, mode='a', header=not os.path.exists(rejects_path), index=False)
+    output_rows, rejected_rows = output_rows + len(clean), rejected_rows + len(rejected)
+    new_rows, new_rejected = new_rows + len(clean), new_rejected + len(rejected)
+    print(f"Processed {new_rows + new_rejected:,} rows ({new_rejected:,} rejected)...")
+
+# --- Step 3: Publish the output and record where this run stopped ---
+if MODE == 'full':
+    if not os.path.exists(output_path):
+        # No clean rows still gives a CSV with the expected header
+        pd.DataFrame(columns=raw_columns + DERIVED_COLUMNS).to_csv(output_path, index=False)
+    os.replace(output_path, OUTPUT_PATH)
+    if os.path.exists(rejects_path): os.replace(rejects_path, REJECTS_PATH)
+    elif os.path.exists(REJECTS_PATH): os.remove(REJECTS_PATH)
+state = {'raw_path': RAW_PATH, 'generation': generation, 'header': header.decode(), 'raw_offset': end, 'raw_digest': window_digest(RAW_PATH, end),
+         'output_rows': output_rows, 'output_size': os.path.getsize(OUTPUT_PATH), 'rejected_rows': rejected_rows,
+         'updated_at': datetime.now(timezone.utc).isoformat(timespec='seconds')}
+with open(STATE_PATH + '.tmp', 'w') as f:
+    json.dump(state, f, indent=2)
+os.replace(STATE_PATH + '.tmp', STATE_PATH)
+
+print(f"\n{new_rows:,} clean rows written ({output_rows:,} in total) to: {OUTPUT_PATH}")
+if new_rejected: print(f"{new_rejected:,} rows failed validation and were written to: {REJECTS_PATH}")
+print("Run convert_to_columnar.py to refresh the backend's memory-mapped copy, and aggregate_demand.py to add the new rows to the demand series.")
+print("--- Script Finished ---")
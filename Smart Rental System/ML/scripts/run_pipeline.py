@@ -0,0 +1,242 @@
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+import pandas as pd
+import yaml
+from parallel_training import CONFIG_PATH, resolve_n_jobs
+
+# Usage: python run_pipeline.py [stage ...] [--force] [--dry-run] [--max-parallel N]
+# Runs the stages in the `pipeline` section of ML/config.yaml that are out of date, and the stages they depend on,
+# as many at once as their dependencies allow. With no stage names, the whole pipeline is considered.
+ML_DIR = os.path.dirname(CONFIG_PATH)
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Rows read at a time when hashing a CSV column by column
+HASH_CHUNK_ROWS = 250_000
+
+
+def ml_path(path):
+    return os.path.join(ML_DIR, path)
+
+
+def load_stages(path=CONFIG_PATH):
+    """{name: stage} from the config, each stage's `after` set to the stages that produce its inputs."""
+    with open(path) as f:
+        pipeline = (yaml.safe_load(f) or {}).get('pipeline') or {}
+    stages = {}
+    for name, spec in (pipeline.get('stages') or {}).items():
+        inputs = [item if isinstance(item, dict) else {'path': item} for item in spec.get('inputs', [])]
+        stages[name] = {'name': name, 'script': spec['script'], 'args': [str(arg) for arg in spec.get('args', [])],
+                        'code': spec.get('code', []), 'inputs': inputs, 'outputs': spec.get('outputs', [])}
+    for stage in stages.values():
+        producers = {other['name'] for item in stage['inputs'] for other in stages.values()
+                     if other is not stage and any(_matches(item['path'], pattern) for pattern in other['outputs'])}
+        stage['after'] = sorted(producers)
+    _check_acyclic(stages)
+    return pipeline, stages
+
+
+def _matches(path, pattern):
+    return fnmatch.fnmatch(os.path.normpath(path), os.path.normpath(pattern))
+
+
+def _check_acyclic(stages):
+    visiting, done = set(), set()
+    def visit(name, trail):
+        if name in done: return
+        if name in visiting: raise ValueError(f"Pipeline stages depend on each other in a cycle: {' -> '.join(trail + [name])}")
+        visiting.add(name)
+        for dependency in stages[name]['after']: visit(dependency, trail + [name])
+        visiting.discard(name)
+        done.add(name)
+    for name in stages: visit(name, [])
+
+
+def with_dependencies(stages, targets):
+    selected, queue = set(), list(targets)
+    while queue:
+        name = queue.pop()
+        if name in selected: continue
+        selected.add(name)
+        queue.extend(stages[name]['after'])
+    return selected
+
+
+class DigestCache:
+    """Content hashes of files and of CSV columns, reused while a file's size and mtime are unchanged."""
+
+    def __init__(self, entries=None):
+        self.entries = entries if entries is not None else {}
+
+    def file(self, path):
+        def compute():
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''): digest.update(block)
+            return digest.hexdigest()
+        return self._cached(path, 'sha256', compute)
+
+    def columns(self, path):
+        """{column: hash} over the text of every value in each column, so a change to one column changes one hash."""
+        def compute():
+            digests = {column: hashlib.sha256() for column in pd.read_csv(path, nrows=0).columns}
+            for chunk in pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=HASH_CHUNK_ROWS):
+                for column, digest in digests.items():
+                    digest.update(pd.util.hash_pandas_object(chunk[column], index=False).to_numpy().tobytes())
+            return {column: digest.hexdigest() for column, digest in digests.items()}
+        return self._cached(path, 'columns', compute)
+
+    def _cached(self, path, kind, compute):
+        if not os.path.isfile(path): return None
+        info = os.stat(path)
+        entry = self.entries.get(path)
+        if entry is None or entry['size'] != info.st_size or entry['mtime_ns'] != info.st_mtime_ns:
+            entry = self.entries[path] = {'size': info.st_size, 'mtime_ns': info.st_mtime_ns}
+        if kind not in entry: entry[kind] = compute()
+        return entry[kind]
+
+
+def input_digest(item, cache):
+    path = ml_path(item['path'])
+    if 'columns' not in item and 'exclude_columns' not in item: return cache.file(path)
+    columns = cache.columns(path)
+    if columns is None: return None
+    if 'columns' in item: return {column: columns.get(column) for column in item['columns']}
+    return {column: digest for column, digest in columns.items() if column not in item['exclude_columns']}
+
+
+def stage_key(stage, cache):
+    """Hash of everything that decides a stage's outputs: its script and helper code, args and inputs."""
+    parts = {'script': cache.file(os.path.join(SCRIPTS_DIR, stage['script'])),
+             'code': {path: cache.file(os.path.join(SCRIPTS_DIR, path)) for path in stage['code']},
+             'args': stage['args'], 'inputs': {item['path']: input_digest(item, cache) for item in stage['inputs']}}
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def output_files(stage):
+    return {pattern: sorted(glob.glob(ml_path(pattern))) for pattern in stage['outputs']}
+
+
+def output_digests(stage, cache):
+    return {path: cache.file(path) for paths in output_files(stage).values() for path in paths}
+
+
+def is_up_to_date(stage, key, record, cache):
+    if record is None or record['key'] != key: return False
+    if not all(output_files(stage).values()): return False
+    return output_digests(stage, cache) == record['outputs']
+
+
+def run_stage(stage, log_dir):
+    """Run one stage's script from ML/scripts with its output going to a log file; returns an error message or None."""
+    started = time.time_ns()
+    log_path = os.path.join(log_dir, f"{stage['name']}.log")
+    with open(log_path, 'w') as log:
+        result = subprocess.run([sys.executable, stage['script'], *stage['args']], cwd=SCRIPTS_DIR, stdout=log, stderr=subprocess.STDOUT)
+    if result.returncode != 0: return f"exited with status {result.returncode}, see {log_path}"
+    # The scripts print an error and exit normally when an input is missing, so check they actually wrote their outputs
+    for pattern, paths in output_files(stage).items():
+        if not any(os.stat(path).st_mtime_ns >= started for path in paths):
+            return f"did not write {pattern}, see {log_path}"
+    return None
+
+
+def save_state(state, path):
+    with open(path + '.tmp', 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def run_pipeline(pipeline, stages, targets, force=False, dry_run=False, max_parallel=None):
+    """Run the out-of-date stages among `targets` and their dependencies; returns {stage: (status, seconds)}."""
+    state_path, log_dir = ml_path(pipeline.get('state', 'models/pipeline_state.json')), ml_path(pipeline.get('log_dir', 'models/metrics/pipeline'))
+    try:
+        with open(state_path) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        state = {}
+    records = state.setdefault('stages', {})
+    cache = DigestCache(state.setdefault('digests', {}))
+    selected = with_dependencies(stages, targets)
+    forced = set(targets) if force else set()
+    workers = resolve_n_jobs(max_parallel if max_parallel is not None else pipeline.get('max_parallel', 1), len(selected))
+    if not dry_run: os.makedirs(log_dir, exist_ok=True)
+
+    results, running = {}, {}
+    with ThreadPoolExecutor(workers) as pool:
+        while len(results) < len(selected):
+            # --- Start (or skip) every stage whose dependencies have finished ---
+            for name in sorted(selected - set(results) - set(running)):
+                stage = stages[name]
+                if any(dependency not in results for dependency in stage['after']): continue
+                failed = [dependency for dependency in stage['after'] if results[dependency][0] in ('failed', 'blocked')]
+                if failed:
+                    results[name] = ('blocked', 0.0)
+                    print(f"[{name}] not run: {', '.join(failed)} failed")
+                    continue
+                if dry_run and any(results[dependency][0] != 'up to date' for dependency in stage['after']):
+                    results[name] = ('would run if inputs change', 0.0)
+                    continue
+                key = stage_key(stage, cache)
+                if name not in forced and is_up_to_date(stage, key, records.get(name), cache):
+                    results[name] = ('up to date', 0.0)
+                    print(f"[{name}] up to date")
+                    continue
+                if dry_run:
+                    results[name] = ('would run', 0.0)
+                    continue
+                print(f"[{name}] running {stage['script']} {' '.join(stage['args'])}".rstrip())
+                running[name] = (pool.submit(run_stage, stage, log_dir), key, time.perf_counter())
+            if not running: continue
+
+            # --- Record each stage as it finishes, so an interrupted run keeps its progress ---
+            finished, _ = wait([future for future, _, _ in running.values()], return_when=FIRST_COMPLETED)
+            for name in [name for name, (future, _, _) in running.items() if future in finished]:
+                future, key, started = running.pop(name)
+                seconds = time.perf_counter() - started
+                error = future.result()
+                if error:
+                    results[name] = ('failed', seconds)
+                    print(f"[{name}] failed after {seconds:.1f}s: {error}")
+                    continue
+                records[name] = {'key': key, 'outputs': output_digests(stages[name], cache),
+                                 'finished_at': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'seconds': round(seconds, 2)}
+                save_state(state, state_path)
+                results[name] = ('ran', seconds)
+                print(f"[{name}] finished in {seconds:.1f}s")
+    if not dry_run: save_state(state, state_path)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the out-of-date stages of the ML pipeline in ML/config.yaml.')
+    parser.add_argument('stages', nargs='*', help='stages to bring up to date, with their dependencies (default: all)')
+    parser.add_argument('--force', action='store_true', help='rerun the named stages (or all of them) even if up to date')
+    parser.add_argument('--dry-run', action='store_true', help='only report which stages are out of date')
+    parser.add_argument('--max-parallel', type=int, default=None, help='stages run at once (default: pipeline.max_parallel in ML/config.yaml)')
+    args = parser.parse_args()
+
+    pipeline, stages = load_stages()
+    unknown = [name for name in args.stages if name not in stages]
+    if unknown:
+        print(f"Unknown stage(s): {', '.join(unknown)}. Stages: {', '.join(stages)}")
+        exit()
+    targets = args.stages or list(stages)
+    print(f"--- Starting ML Pipeline ({'dry run' if args.dry_run else 'run'}) ---")
+    start = time.perf_counter()
+    results = run_pipeline(pipeline, stages, targets, force=args.force, dry_run=args.dry_run, max_parallel=args.max_parallel)
+
+    print(f"\n{'stage':<18} {'after':<36} {'status':<26} {'s':>7}")
+    for name in [name for name in stages if name in results]:
+        status, seconds = results[name]
+        print(f"{name:<18} {', '.join(stages[name]['after']) or '-':<36} {status:<26} {seconds:>7.1f}")
+    print(f"Pipeline finished in {time.perf_counter() - start:.1f}s")
+    print("--- Script Finished ---")
+    if any(status in ('failed', 'blocked') for status, _ in results.values()): sys.exit(1)
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+
+class RunningMoments:
+    """Count, mean and sum of squared deviations (M2) per group and feature, mergeable across partitions.
+
+    update() folds in a chunk of rows in one vectorized pass and merge() combines
+    two partial results with Chan et al.'s pairwise update, so partitions of the
+    data can be summarised separately (in parallel) and then combined. Missing
+    values are skipped per feature, as pandas does; rows with no group label are
+    kept under the group '' so they still count towards total().
+    """
+
+    def __init__(self, features, groups=()):
+        self.features = list(features)
+        self.groups = list(groups)
+        self.count, self.mean, self.m2 = (np.zeros((len(self.groups), len(self.features))) for _ in range(3))
+
+    def update(self, labels, values):
+        """Fold in rows: labels[i] is the group of row i, values is a (rows x features) float array."""
+        codes, uniques = pd.factorize(pd.Series(labels, dtype=object))
+        uniques = list(uniques)
+        if (codes < 0).any():
+            codes = np.where(codes < 0, len(uniques), codes)  # factorize marks missing labels -1
+            uniques.append('')
+        codes = np.array([self._group(label) for label in uniques], dtype=int)[codes]
+        present = ~np.isnan(values)
+        filled = np.where(present, values, 0.0)
+        groups = len(self.groups)
+        count = np.stack([np.bincount(codes, weights=present[:, j], minlength=groups) for j in range(len(self.features))], axis=1)
+        sums = np.stack([np.bincount(codes, weights=filled[:, j], minlength=groups) for j in range(len(self.features))], axis=1)
+        mean = np.divide(sums, count, out=np.zeros_like(sums), where=count > 0)
+        # M2 of the chunk from deviations about its own mean (two-pass within the chunk)
+        deviations = np.where(present, values - mean[codes], 0.0)
+        m2 = np.stack([np.bincount(codes, weights=deviations[:, j] ** 2, minlength=groups) for j in range(len(self.features))], axis=1)
+        self._combine(np.arange(groups), count, mean, m2)
+
+    def merge(self, other):
+        """Fold another RunningMoments over the same features into this one, matching groups by label."""
+        if other.features != self.features: raise ValueError('Cannot merge moments over different features.')
+        rows = np.array([self._group(label) for label in other.groups], dtype=int)
+        self._combine(rows, other.count, other.mean, other.m2)
+        return self
+
+    def total(self):
+        """Moments of all rows regardless of group, as a single group ''."""
+        result = RunningMoments(self.features, [''])
+        for i in range(len(self.groups)):
+            result._combine(np.array([0]), self.count[i:i + 1], self.mean[i:i + 1], self.m2[i:i + 1])
+        return result
+
+    def stats(self, group):
+        """{'mean': {feature: value}, 'std': {feature: value}} for one group, with pandas' ddof=1 std (NaN below 2 rows)."""
+        i = self.groups.index(group)
+        count = self.count[i]
+        mean = np.where(count > 0, self.mean[i], np.nan)
+        std = np.sqrt(np.divide(self.m2[i], count - 1, out=np.full_like(count, np.nan), where=count > 1))
+        return {'mean': dict(zip(self.features, mean.tolist())), 'std': dict(zip(self.features, std.tolist()))}
+
+    def save(self, path):
+        np.savez(path, features=np.array(self.features), groups=np.array(self.groups), count=self.count, mean=self.mean, m2=self.m2)
+
+    def _group(self, label):
+        if label not in self.groups:
+            self.groups.append(label)
+            self.count, self.mean, self.m2 = (np.vstack([array, np.zeros((1, len(self.features)))]) for array in (self.count, self.mean, self.m2))
+        return self.groups.index(label)
+
+    def _combine(self, rows, count, mean, m2):
+        # Chan et al.: n = na + nb, delta = mb - ma, mean = ma + delta * nb / n, M2 = M2a + M2b + delta^2 * na * nb / n
+        total = self.count[rows] + count
+        weight = np.divide(count, total, out=np.zeros_like(total), where=total > 0)
+        delta = mean - self.mean[rows]
+        self.m2[rows] += m2 + delta ** 2 * self.count[rows] * weight
+        self.mean[rows] += delta * weight
+        self.count[rows] = total
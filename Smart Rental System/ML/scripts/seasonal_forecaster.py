@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# Same interval width as Prophet's default, so the two engines' bands are comparable
+INTERVAL_WIDTH = 0.8
+
+
+def design_matrix(dates, start_date, time_scale):
+    """Rows of [1, scaled time, Tuesday..Sunday indicators] for the given dates (Monday is the baseline)."""
+    dates = pd.DatetimeIndex(dates)
+    t = (dates - start_date).days.to_numpy() / time_scale
+    day_of_week = dates.dayofweek.to_numpy()
+    return np.column_stack([np.ones(len(dates)), t] + [(day_of_week == day).astype(float) for day in range(1, 7)])
+
+
+def fit_seasonal_trend(timeseries, interval_width=INTERVAL_WIDTH):
+    """Fit a linear trend plus day-of-week effects to every column of a daily demand frame at once.
+
+    One least-squares solve covers all equipment types, since they share the same
+    design matrix. Prediction intervals are the usual OLS ones: residual variance
+    plus the coefficient uncertainty at the forecast date.
+    """
+    dates = pd.DatetimeIndex(timeseries.index)
+    start_date = dates.min()
+    time_scale = max((dates.max() - start_date).days, 1)
+    X = design_matrix(dates, start_date, time_scale)
+    Y = timeseries.to_numpy(dtype=float)
+    coef, _, _, _ = np.linalg.lstsq(X, Y, rcond=None)
+    dof = len(X) - X.shape[1]
+    sigma = np.sqrt(((Y - X @ coef) ** 2).sum(axis=0) / dof)
+    return {'types': np.array([str(column) for column in timeseries.columns]), 'coef': coef, 'xtx_inv': np.linalg.pinv(X.T @ X), 'sigma': sigma,
+            't_value': stats.t.ppf((1 + interval_width) / 2, dof), 'start_date': str(start_date.date()), 'last_date': str(dates.max().date()),
+            'time_scale': time_scale, 'interval_width': interval_width}
+
+
+def forecast_seasonal_trend(params, periods):
+    """Forecast all types for the `periods` days after the history. Returns (dates, yhat, lower, upper), each (periods x types)."""
+    dates = pd.date_range(pd.Timestamp(params['last_date']) + pd.Timedelta(days=1), periods=periods, freq='D')
+    X = design_matrix(dates, pd.Timestamp(params['start_date']), params['time_scale'])
+    yhat = X @ params['coef']
+    margin = params['t_value'] * np.outer(np.sqrt(1 + np.einsum('ij,jk,ik->i', X, params['xtx_inv'], X)), params['sigma'])
+    return dates, yhat, yhat - margin, yhat + margin
+
+
+def save_seasonal_trend(params, path):
+    np.savez(path, **params)
@@ -4,6 +4,7 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, classification_report
 import joblib
 import os
+from feature_schema import build_feature_schema, save_feature_schema
 from imblearn.over_sampling import SMOTE
 
 print("--- Starting Model Training Script (Correct Version) ---")
@@ -52,4 +53,11 @@ print(classification_report(y_test, y_pred))
 model_path = '../models/rental_predictor.pkl'
 joblib.dump(model, model_path)
 print(f"\nModel saved successfully to: {model_path}")
+
+# --- Step 9: Save the Feature Schema ---
+# The backend encodes requests straight into the model's column layout using this file,
+# and refuses to serve the model if the two ever disagree.
+schema_path = '../models/rental_predictor_schema.json'
+save_feature_schema(build_feature_schema(features, X.columns), schema_path)
+print(f"Feature schema saved successfully to: {schema_path}")
 print("--- Script Finished ---")
\ No newline at end of file
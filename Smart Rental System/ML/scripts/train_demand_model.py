@@ -1,50 +1,80 @@
+import argparse
+import time
 import pandas as pd
-from prophet import Prophet
-import joblib
-import os
-
-print("--- Starting Demand Forecasting Model Training ---")
-
-# --- Step 1: Load the Time-Series Data ---
-try:
-    df = pd.read_csv('../data/processed/demand_timeseries.csv', index_col='CheckOut_Date', parse_dates=True)
-    print("Successfully loaded demand_timeseries.csv")
-except FileNotFoundError:
-    print("Error: demand_timeseries.csv not found! Please run preprocess_timeseries.py first.")
-    exit()
-
-# Get the list of equipment types from the columns
-equipment_types = df.columns
-models_saved = []
-
-# --- Step 2: Train a Separate Model for Each Equipment Type ---
-for equipment in equipment_types:
-    print(f"\n--- Training model for: {equipment} ---")
-    
-    # Prepare the data for Prophet
-    # Prophet requires the columns to be named 'ds' (datestamp) and 'y' (value)
-    equipment_df = df[[equipment]].reset_index()
-    equipment_df.rename(columns={'CheckOut_Date': 'ds', equipment: 'y'}, inplace=True)
+from seasonal_forecaster import fit_seasonal_trend, forecast_seasonal_trend, save_seasonal_trend
+from parallel_training import configured_n_jobs, print_training_report, resolve_n_jobs, train_parallel
+
 
-    # Initialize and train the Prophet model
+def fit_prophet(series):
+    """One Prophet model on a daily rental-count series indexed by date."""
+    from prophet import Prophet
+    # Prophet requires the columns to be named 'ds' (datestamp) and 'y' (value)
     model = Prophet(daily_seasonality=False, weekly_seasonality=True, yearly_seasonality=False)
-    model.fit(equipment_df)
-    
-    # --- Step 3: Make a Future Prediction (e.g., 30 days) ---
-    future = model.make_future_dataframe(periods=30)
-    forecast = model.predict(future)
-    
-    print(f"Forecast for the next 5 days for {equipment}:")
-    # We show the forecast ('yhat'), and the uncertainty interval ('yhat_lower', 'yhat_upper')
-    print(forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].tail(5))
-
-    # --- Step 4: Save the Trained Model ---
-    model_path = f'../models/demand_forecaster_{equipment}.pkl'
-    joblib.dump(model, model_path)
-    models_saved.append(model_path)
-
-print("\n--- All Demand Forecasting Models Trained Successfully ---")
-print("Models saved to:")
-for path in models_saved:
-    print(f"- {path}")
-print("--- Script Finished ---")
\ No newline at end of file
+    model.fit(pd.DataFrame({'ds': series.index, 'y': series.to_numpy()}))
+    return model
+
+
+def site_timeseries(dates):
+    """Daily rental counts per (Type, GPS_Location) over `dates`, from the clean data."""
+    clean = pd.read_csv('../data/processed/rental_data_clean.csv', usecols=['Type', 'GPS_Location', 'CheckOut_Date'], parse_dates=['CheckOut_Date'])
+    counts = clean.groupby(['Type', 'GPS_Location', 'CheckOut_Date']).size()
+    return {key: group.droplevel([0, 1]).reindex(dates, fill_value=0) for key, group in counts.groupby(level=[0, 1])}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Train the demand forecasting models.')
+    # 'prophet' (one model per type), 'numpy' (trend + day-of-week least squares, all types at once) or 'all'
+    parser.add_argument('engine', nargs='?', default='prophet', choices=['prophet', 'numpy', 'all'])
+    parser.add_argument('--by-site', action='store_true', help='also fit a Prophet model per Type x GPS_Location')
+    parser.add_argument('--n-jobs', type=int, default=None, help='Prophet models fitted at once (default: train.n_jobs in ML/config.yaml)')
+    args = parser.parse_args()
+    ENGINE = args.engine
+
+    print(f"--- Starting Demand Forecasting Model Training (engine: {ENGINE}) ---")
+
+    # --- Step 1: Load the Time-Series Data ---
+    try:
+        df = pd.read_csv('../data/processed/demand_timeseries.csv', index_col='CheckOut_Date', parse_dates=True)
+        print("Successfully loaded demand_timeseries.csv")
+    except FileNotFoundError:
+        print("Error: demand_timeseries.csv not found! Please run preprocess_timeseries.py first.")
+        exit()
+
+    # Get the list of equipment types from the columns
+    equipment_types = df.columns
+    models_saved = []
+
+    # --- Step 2: Train a Separate Prophet Model for Each Equipment Type (and Site), in Parallel ---
+    if ENGINE in ('prophet', 'all'):
+        import prophet  # imported once here, so forked workers start with it loaded
+        jobs = [(equipment, f'../models/demand_forecaster_{equipment}.pkl', (df[equipment],)) for equipment in equipment_types]
+        if args.by_site:
+            for (equipment, site), series in site_timeseries(df.index).items():
+                jobs.append((f'{equipment}_{site}', f'../models/demand_forecaster_{equipment}_{site}.pkl', (series,)))
+        n_jobs = args.n_jobs if args.n_jobs is not None else configured_n_jobs()
+        print(f"\n--- Training {len(jobs)} Prophet models with {resolve_n_jobs(n_jobs, len(jobs))} worker(s) (n_jobs={n_jobs}) ---")
+        start = time.perf_counter()
+        reports = []
+        for report in train_parallel(fit_prophet, jobs, n_jobs):
+            print(f"Model for {report['name']} trained in {report['fit_seconds']:.2f}s and saved.")
+            reports.append(report)
+            models_saved.append(report['path'])
+        print_training_report(reports, time.perf_counter() - start)
+
+    # --- Step 3: Fit the NumPy Engine for All Equipment Types at Once ---
+    if ENGINE in ('numpy', 'all'):
+        print("\n--- Training NumPy seasonal-trend engine for all types ---")
+        params = fit_seasonal_trend(df)
+        dates, yhat, lower, upper = forecast_seasonal_trend(params, 30)
+        for i, equipment in enumerate(params['types']):
+            print(f"Forecast for the next 5 days for {equipment}:")
+            print(pd.DataFrame({'ds': dates, 'yhat': yhat[:, i], 'yhat_lower': lower[:, i], 'yhat_upper': upper[:, i]}).head(5))
+        model_path = '../models/demand_forecaster_numpy.npz'
+        save_seasonal_trend(params, model_path)
+        models_saved.append(model_path)
+
+    print("\n--- All Demand Forecasting Models Trained Successfully ---")
+    print("Models saved to:")
+    for path in models_saved:
+        print(f"- {path}")
+    print("--- Script Finished ---")
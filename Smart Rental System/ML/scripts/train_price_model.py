@@ -4,6 +4,7 @@ from sklearn.metrics import mean_squared_error, r2_score
 import lightgbm as lgb # We will use the LightGBM Regressor
 import joblib
 import os
+from feature_schema import build_feature_schema, save_feature_schema
 import numpy as np
 
 print("--- Starting Price Optimization Model Training Script ---")
@@ -66,4 +67,11 @@ print(f"An R² of {r2:.2f} means our model explains about {r2:.0%} of the varian
 model_path = '../models/price_predictor.pkl'
 joblib.dump(model, model_path)
 print(f"\nPrice prediction model saved successfully to: {model_path}")
+
+# --- Step 8: Save the Feature Schema ---
+# The backend encodes requests straight into the model's column layout using this file,
+# and refuses to serve the model if the two ever disagree.
+schema_path = '../models/price_predictor_schema.json'
+save_feature_schema(build_feature_schema(features, X.columns), schema_path)
+print(f"Feature schema saved successfully to: {schema_path}")
 print("--- Script Finished ---")
\ No newline at end of file
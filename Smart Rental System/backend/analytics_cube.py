@@ -0,0 +1,178 @@
+import numpy as np
+import pandas as pd
+from columnar_store import column_values
+
+
+# Summed per cell and day; avg_utilization is utilization_sum / utilization_count
+MEASURE_COLUMNS = {'rentals': None, 'revenue_usd': 'Total_Bill_USD', 'operating_hours': 'Operating_Hours', 'breakdowns': 'Breakdowns',
+                   'utilization_sum': 'Utilization_Rate', 'utilization_count': 'Utilization_Rate'}
+MEASURES = list(MEASURE_COLUMNS)
+GROUP_COLUMNS = {'type': 'Type', 'model': 'Model', 'site': 'GPS_Location'}
+INTERVALS = {'day': 'D', 'week': 'W', 'month': 'M'}
+
+
+class AnalyticsCube:
+    """Rental rollups by (Type, Model) x GPS_Location x checkout day, as prefix sums over the days.
+
+    cumulative[m, segment, site, d] holds measure m summed over the days before
+    day d, so the total over any date range is one subtraction per cell, and a
+    series by day, week or month is a diff at the period boundaries. A segment
+    is one (Type, Model) pair, so Type and Model slices sum a few segments.
+    Query cost depends on the number of segments, sites and periods returned,
+    never on the number of rentals. replace() moves one rental's values in or
+    out by adding to the prefix sums from its day onwards. Rentals count
+    towards the day they were checked out on. The day axis grows to take a
+    new rental's day, by at most `max_extend_days` on either side per rental,
+    and replace() raises ValueError for a day further out.
+    """
+
+    def __init__(self, df, max_extend_days=366):
+        self.max_extend_days = max_extend_days
+        checkout = df['CheckOut_Date'].to_numpy(dtype='datetime64[D]')
+        known = ~np.isnat(checkout)
+        type_codes, types = pd.factorize(column_values(df['Type'])[known], use_na_sentinel=False)
+        model_codes, models = pd.factorize(column_values(df['Model'])[known], use_na_sentinel=False)
+        segment_codes, pairs = pd.factorize(type_codes * len(models) + model_codes)
+        site_codes, sites = pd.factorize(column_values(df['GPS_Location'])[known], use_na_sentinel=False)
+        self.segments = [(types[pair // len(models)], models[pair % len(models)]) for pair in pairs]
+        self.sites = list(sites)
+        days = checkout[known].view('int64')
+        self.first_day = int(days.min()) if len(days) else 0
+        day_codes = days - self.first_day
+        shape = (len(self.segments), len(self.sites), int(day_codes.max()) + 1 if len(days) else 0)
+        cells = (segment_codes * shape[1] + site_codes) * shape[2] + day_codes
+        values = self._values({column: df[column].to_numpy(dtype=float)[known] for column in set(filter(None, MEASURE_COLUMNS.values()))}, len(cells))
+        daily = np.stack([np.bincount(cells, weights=values[m], minlength=int(np.prod(shape))).reshape(shape) for m in range(len(MEASURES))])
+        self.cumulative = np.concatenate([np.zeros(daily.shape[:3] + (1,)), np.cumsum(daily, axis=3)], axis=3)
+
+    @property
+    def days(self):
+        return self.cumulative.shape[3] - 1
+
+    def date_range(self):
+        """(first day, last day) covered, or (None, None) when empty."""
+        if not self.days: return None, None
+        return self._date(0), self._date(self.days - 1)
+
+    def replace(self, old=None, new=None):
+        """Take a rental's previous values out (if given) and put its current values in (if given)."""
+        changes = []
+        # Every cell is found (and checked) before any sum changes, so a rejected day leaves the cube as it was
+        for rental, sign in ((old, -1.0), (new, 1.0)):
+            if rental is None or pd.isna(rental['CheckOut_Date']): continue
+            day = self._day(pd.Timestamp(rental['CheckOut_Date']))
+            segment = self._index('segments', (rental['Type'], rental['Model']), axis=1)
+            site = self._index('sites', rental['GPS_Location'], axis=2)
+            values = self._values({column: np.array([rental[column]], dtype=float) for column in set(filter(None, MEASURE_COLUMNS.values()))}, 1)[:, 0]
+            changes.append((segment, site, day, sign * values))
+        for segment, site, day, values in changes:
+            self.cumulative[:, segment, site, day + 1:] += values[:, None]
+
+    def query(self, types=None, models=None, sites=None, since=None, until=None, group_by=(), interval=None):
+        """Measures over checkout days [since, until] for the matching cells, one row per group and period.
+
+        group_by is any of 'type', 'model' and 'site'; interval is None for one
+        total per group, or 'day', 'week' (starting Monday) or 'month', each
+        row's 'period' being its first day within the range. Groups with no
+        rentals in the range are left out. Returns (rows, totals).
+        """
+        segment_mask = np.array([(types is None or t in types) and (models is None or m in models) for t, m in self.segments], dtype=bool)
+        site_mask = np.array([sites is None or s in sites for s in self.sites], dtype=bool)
+        start = 0 if since is None else min(max((pd.Timestamp(since) - self._date(0)).days, 0), self.days)
+        stop = self.days if until is None else min(max((pd.Timestamp(until) - self._date(0)).days + 1, start), self.days)
+        bounds = [start]
+        if interval is not None and stop > start:
+            dates = pd.date_range(self._date(start), periods=stop - start, freq='D')
+            period_starts = np.flatnonzero(dates.to_period(INTERVALS[interval]).start_time == dates)
+            bounds += [start + int(i) for i in period_starts if i > 0]
+        bounds.append(stop)
+
+        # Boundaries first, so the masks only ever copy a few days of the cube
+        cumulative = self.cumulative[:, :, :, bounds][:, segment_mask][:, :, site_mask]
+        sums = np.diff(cumulative, axis=3)  # (measures, segments, sites, periods)
+        segment_keys = [self._group_key(segment, group_by) for segment, keep in zip(self.segments, segment_mask) if keep]
+        site_keys = [site if 'site' in group_by else None for site, keep in zip(self.sites, site_mask) if keep]
+        segment_groups, segment_codes = self._one_hot(segment_keys)
+        site_groups, site_codes = self._one_hot(site_keys)
+        grouped = np.einsum('mgsp,gh,sk->mhkp', sums, segment_codes, site_codes)
+
+        labels = np.datetime_as_string(np.array(bounds[:-1], dtype=np.int64).astype('datetime64[D]') + np.timedelta64(self.first_day, 'D')).tolist()
+        rows = []
+        for h, (equipment_type, model) in enumerate(segment_groups):
+            for k, site in enumerate(site_groups):
+                if not grouped[0, h, k].sum(): continue
+                key = {column: value for column, value in (('Type', equipment_type), ('Model', model), ('GPS_Location', site)) if value is not None}
+                measures = self._measures(grouped[:, h, k])
+                if interval is None:
+                    rows.append(dict(key, **measures[0]))
+                else:
+                    rows.extend(dict(key, period=label, **values) for label, values in zip(labels, measures))
+        total = self._measures(grouped.sum(axis=(1, 2, 3))[:, None])[0]
+        return rows, total
+
+    @staticmethod
+    def _values(columns, rows):
+        # One row of every measure per rental; missing readings add nothing, and utilization counts only where present
+        utilization = columns['Utilization_Rate']
+        values = [np.ones(rows)]
+        for measure, column in MEASURE_COLUMNS.items():
+            if measure == 'rentals': continue
+            if measure == 'utilization_count': values.append((~np.isnan(utilization)).astype(float))
+            else: values.append(np.nan_to_num(columns[column]))
+        return np.stack(values)
+
+    @staticmethod
+    def _group_key(segment, group_by):
+        equipment_type, model = segment
+        return (equipment_type if 'type' in group_by or 'model' in group_by else None, model if 'model' in group_by else None)
+
+    @staticmethod
+    def _one_hot(keys):
+        """(distinct keys in sorted order, len(keys) x len(distinct) 0/1 matrix mapping each key to its group)."""
+        distinct = sorted(dict.fromkeys(keys), key=str)
+        return distinct, np.eye(len(distinct))[[distinct.index(key) for key in keys]].reshape(len(keys), len(distinct))
+
+    @staticmethod
+    def _measures(values):
+        """One dict of output measures per column of a (measures x periods) array."""
+        totals = dict(zip(MEASURES, values))
+        columns = {measure: np.rint(totals[measure]).astype(np.int64).tolist() for measure in ('rentals', 'revenue_usd', 'operating_hours', 'breakdowns')}
+        present = totals['utilization_count'] >= 0.5
+        average = np.round(np.divide(totals['utilization_sum'], totals['utilization_count'], out=np.zeros_like(totals['utilization_sum']), where=present), 4)
+        columns['avg_utilization'] = [value if keep else None for value, keep in zip(average.tolist(), present.tolist())]
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def _date(self, day):
+        return pd.Timestamp(np.datetime64(self.first_day + day, 'D'))
+
+    def covers(self, date):
+        """Whether replace() accepts a rental checked out on `date`."""
+        day = int(np.datetime64(pd.Timestamp(date).normalize(), 'D').view('int64')) - self.first_day
+        return not self.days or -self.max_extend_days <= day < self.days + self.max_extend_days
+
+    def _day(self, date):
+        """Index of `date` on the day axis, growing the axis to cover it (by at most max_extend_days)."""
+        if not self.covers(date):
+            raise ValueError(f"{date.strftime('%Y-%m-%d')} is more than {self.max_extend_days} days outside the analytics cube's "
+                             f"{self._date(0).strftime('%Y-%m-%d')} to {self._date(max(self.days - 1, 0)).strftime('%Y-%m-%d')}")
+        date_day = int(np.datetime64(date.normalize(), 'D').view('int64'))
+        if not self.days: self.first_day = date_day
+        day = date_day - self.first_day
+        if day < 0:
+            # Days before the first one start from zero, and every later prefix sum is unchanged
+            self.cumulative = np.pad(self.cumulative, ((0, 0), (0, 0), (0, 0), (-day, 0)))
+            self.first_day += day
+            day = 0
+        if day >= self.days:
+            extra = np.repeat(self.cumulative[:, :, :, -1:], day - self.days + 1, axis=3)
+            self.cumulative = np.concatenate([self.cumulative, extra], axis=3)
+        return day
+
+    def _index(self, name, key, axis):
+        keys = getattr(self, name)
+        if key not in keys:
+            keys.append(key)
+            padding = [(0, 0)] * 4
+            padding[axis] = (0, 1)
+            self.cumulative = np.pad(self.cumulative, padding)
+        return keys.index(key)
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+from feature_encoding import numeric_matrix
+
+
+class AnomalyScorer:
+    """Per-type anomaly z-scores for many telemetry rows at once.
+
+    The per-type means and standard deviations from compute_feature_stats.py
+    are held as (types x features) matrices, so a chunk of rows is scored by
+    gathering each row's type and doing one subtract/divide. Rules match
+    /detect_anomaly: a missing value counts as the mean, a feature with zero
+    variance is never anomalous, and |z| above the threshold is an anomaly.
+    """
+
+    def __init__(self, detectors, features, threshold=3.0):
+        self.types = list(detectors)
+        self.features = list(features)
+        self.threshold = threshold
+        self.means = np.array([[detectors[t]['mean'][f] for f in self.features] for t in self.types], dtype=float)
+        stds = np.array([[detectors[t]['std'][f] for f in self.features] for t in self.types], dtype=float)
+        # Zero-variance features get an infinite scale, so their z-score is always 0
+        self.scales = np.where(stds == 0, np.inf, stds)
+        self._codes = {t: i for i, t in enumerate(self.types)}
+
+    def update_type(self, equipment_type, stats):
+        """Replace one type's row of the stats matrices, e.g. after new rentals were folded into its stats."""
+        i = self._codes[equipment_type]
+        self.means[i] = [stats['mean'][f] for f in self.features]
+        stds = np.array([stats['std'][f] for f in self.features], dtype=float)
+        self.scales[i] = np.where(stds == 0, np.inf, stds)
+
+    def type_codes(self, types):
+        """Row index into the stats matrices for each type, -1 where the type is unknown or missing."""
+        codes, categories = pd.factorize(pd.Series(types, dtype=object))
+        lookup = np.array([self._codes.get(category, -1) for category in categories] + [-1])
+        return lookup[codes]  # factorize marks missing values as -1, which picks the trailing -1
+
+    def z_scores(self, codes, values):
+        """(rows x features) z-scores; rows with an unknown type (code -1) are all NaN."""
+        known = codes >= 0
+        rows = np.where(known, codes, 0)
+        z = (values - self.means[rows]) / self.scales[rows]
+        z[np.isnan(values) & known[:, None]] = 0.0
+        z[~known] = np.nan
+        return z
+
+    def score_frame(self, frame):
+        """Return (type codes, z-scores, anomalous mask) for a DataFrame of telemetry records."""
+        types = frame['Type'] if 'Type' in frame.columns else pd.Series([None] * len(frame))
+        codes = self.type_codes(types.to_numpy())
+        z = self.z_scores(codes, numeric_matrix(frame, self.features))
+        with np.errstate(invalid='ignore'):
+            anomalous = np.abs(z) > self.threshold
+        return codes, z, anomalous
+
+    def offending(self, z_row, anomalous_row):
+        """{feature: z-score} for every anomalous feature of one scored row, in feature order."""
+        return {self.features[j]: round(float(z_row[j]), 4) for j in np.flatnonzero(anomalous_row)}
@@ -1,276 +1,669 @@
-from flask import Flask, request, jsonify
-import joblib
-import pandas as pd
-import os
-from datetime import timedelta
-from flask_cors import CORS
-
-
-app = Flask(__name__)
-CORS(app)
-
-# --- 1. Load All Models & Data ---
-print("--- Loading all models and data ---")
-breakdown_model, price_model, df, LATEST_DATE = None, None, None, None
-demand_forecasters, anomaly_detectors = {}, {}
-
-# ... (all model and data loading code remains the same)
-try:
-    BREAKDOWN_MODEL_PATH = os.path.join('..', 'ml', 'models', 'rental_predictor.pkl')
-    breakdown_model = joblib.load(BREAKDOWN_MODEL_PATH)
-    print("Breakdown model loaded.")
-except Exception as e: print(f"Error loading breakdown model: {e}")
-try:
-    PRICE_MODEL_PATH = os.path.join('..', 'ml', 'models', 'price_predictor.pkl')
-    price_model = joblib.load(PRICE_MODEL_PATH)
-    print("Price model loaded.")
-except Exception as e: print(f"Error loading price model: {e}")
-
-EQUIPMENT_TYPES = ['Bulldozer', 'Crane', 'DumpTruck', 'Excavator', 'Loader']
-for equipment in EQUIPMENT_TYPES:
-    path = f'../ml/models/demand_forecaster_{equipment}.pkl'
-    try:
-        demand_forecasters[equipment] = joblib.load(path)
-        print(f"Demand forecaster for {equipment} loaded.")
-    except Exception as e: print(f"Could not load demand forecaster for {equipment}: {e}")
-for equipment in EQUIPMENT_TYPES:
-    path = f'../ml/models/anomaly_detector_{equipment}.pkl'
-    try:
-        anomaly_detectors[equipment] = joblib.load(path)
-        print(f"Anomaly detector for {equipment} loaded.")
-    except Exception as e: print(f"Could not load anomaly detector for {equipment}: {e}")
-
-# ... (after loading other models)
-breakdown_stats = None
-try:
-    STATS_PATH = os.path.join('..', 'ml', 'models', 'breakdown_stats.pkl')
-    breakdown_stats = joblib.load(STATS_PATH)
-    print("Breakdown stats loaded.")
-except Exception as e: print(f"Could not load breakdown stats: {e}")
-
-try:
-    DATA_PATH = os.path.join('..', 'ml', 'data', 'processed', 'rental_data_clean.csv')
-    df = pd.read_csv(DATA_PATH, parse_dates=['CheckOut_Date', 'CheckIn_Date', 'Planned_Return_Date'])
-    LATEST_DATE = df['CheckOut_Date'].max()
-    print(f"Logic will be based on the latest data point: {LATEST_DATE.strftime('%Y-%m-%d')}")
-except Exception as e: print(f"Could not load data for asset status: {e}")
-print("--- Loading complete ---")
-
-
-# --- 2. Define Model Columns ---
-# ... (model column lists are unchanged)
-BREAKDOWN_MODEL_COLUMNS = ['Manufacture_Year', 'Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters', 'Fuel_Efficiency_L_per_hr', 'Distance_Traveled_km', 'Load_Cycles', 'Engine_Temp_Max', 'Hydraulic_Pressure_Max', 'Rental_Cost_USD', 'Rental_Duration_Days', 'Planned_Duration_Days', 'Overdue_Days', 'Equipment_Age_Years', 'Utilization_Rate', 'Type_Crane', 'Type_DumpTruck', 'Type_Excavator', 'Type_Loader', 'Model_320D2', 'Model_323D3', 'Model_330C', 'Model_336D2', 'Model_350C', 'Model_773G', 'Model_775G', 'Model_777G', 'Model_950GC', 'Model_966GC', 'Model_980M', 'Model_D6R2', 'Model_D7R2', 'Model_D8T', 'GPS_Location_Site_B', 'GPS_Location_Site_C', 'GPS_Location_Site_D', 'GPS_Location_Site_E', 'GPS_Location_Site_F', 'Maintenance_Flag_Yes']
-PRICE_MODEL_COLUMNS = ['Manufacture_Year', 'Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters', 'Fuel_Efficiency_L_per_hr', 'Distance_Traveled_km', 'Load_Cycles', 'Engine_Temp_Max', 'Hydraulic_Pressure_Max', 'Rental_Duration_Days', 'Planned_Duration_Days', 'Overdue_Days', 'Equipment_Age_Years', 'Utilization_Rate', 'Type_Crane', 'Type_DumpTruck', 'Type_Excavator', 'Type_Loader', 'Model_320D2', 'Model_323D3', 'Model_330C', 'Model_336D2', 'Model_350C', 'Model_773G', 'Model_775G', 'Model_777G', 'Model_950GC', 'Model_966GC', 'Model_980M', 'Model_D6R2', 'Model_D7R2', 'Model_D8T', 'GPS_Location_Site_B', 'GPS_Location_Site_C', 'GPS_Location_Site_D', 'GPS_Location_Site_E', 'GPS_Location_Site_F', 'Maintenance_Flag_Yes']
-ANOMALY_FEATURES = ['Operating_Hours','Idle_Hours','Fuel_Consumed_Liters','Fuel_Efficiency_L_per_hr','Load_Cycles','Utilization_Rate']
-
-
-# --- 3. API Endpoints ---
-@app.route('/')
-def home():
-    return "Smart Rental API is running. All features are implemented."
-
-# ... (all previous endpoints are unchanged)
-@app.route('/asset_status', methods=['GET'])
-def asset_status():
-    if df is None: return jsonify({'error': 'Data not available.'}), 500
-    last_rentals = df.sort_values('CheckOut_Date').groupby('Equipment_ID').last()
-    statuses = []
-    for index, row in last_rentals.iterrows():
-        status = 'Idle'; customer_id = 'N/A'; planned_return = 'N/A'; last_returned_on = row['CheckIn_Date'].strftime('%Y-%m-%d')
-        if LATEST_DATE < row['CheckIn_Date']:
-            status = 'Active'; customer_id = row['Customer_ID']; planned_return = row['Planned_Return_Date'].strftime('%Y-%m-%d'); last_returned_on = 'N/A'
-        statuses.append({'Equipment_ID': row.name,'Status': status,'Type': row['Type'],'Model': row['Model'],'Equipment_Age_Years': row['Equipment_Age_Years'],'Last_Known_Location': row['GPS_Location'],'Current_Customer_ID': customer_id,'Planned_Return_Date': planned_return,'Last_Returned_On': last_returned_on,'Last_Operating_Hours': row['Operating_Hours'],'Last_Utilization_Rate': f"{row['Utilization_Rate']:.2%}",'Breakdowns_on_Last_Rental': row['Breakdowns']})
-    return jsonify({'status_date': LATEST_DATE.strftime('%Y-%m-%d'),'asset_count': len(statuses),'assets': statuses})
-
-@app.route('/asset_history/<equipment_id>', methods=['GET'])
-def asset_history(equipment_id):
-    if df is None: return jsonify({'error': 'Data not available.'}), 500
-    asset_df = df[df['Equipment_ID'] == equipment_id]
-    if asset_df.empty: return jsonify({'error': f'No history for ID: {equipment_id}'}), 404
-    summary = {'total_rentals': len(asset_df), 'total_rental_days': int(asset_df['Rental_Duration_Days'].sum()), 'total_operating_hours': int(asset_df['Operating_Hours'].sum()), 'total_idle_hours': int(asset_df['Idle_Hours'].sum()), 'total_fuel_consumed_liters': round(float(asset_df['Fuel_Consumed_Liters'].sum()), 2), 'lifetime_breakdowns': int(asset_df['Breakdowns'].sum()), 'rentals_per_site': asset_df.groupby('GPS_Location').size().to_dict()}
-    rental_history = asset_df.sort_values('CheckOut_Date', ascending=False).to_dict(orient='records')
-    for record in rental_history:
-        for key, value in record.items():
-            if isinstance(value, pd.Timestamp): record[key] = value.strftime('%Y-%m-%d')
-    return jsonify({'equipment_id': equipment_id, 'summary': summary, 'rental_history': rental_history})
-
-@app.route('/underutilized_assets', methods=['GET'])
-def underutilized_assets():
-    if df is None: return jsonify({'error': 'Data not available.'}), 500
-    try:
-        threshold = float(request.args.get('threshold', 0.5))
-    except ValueError: return jsonify({'error': 'Invalid threshold value.'}), 400
-    avg_utilization = df.groupby('Equipment_ID')['Utilization_Rate'].mean().reset_index()
-    underutilized = avg_utilization[avg_utilization['Utilization_Rate'] < threshold]
-    last_known_details = df.sort_values('CheckOut_Date').groupby('Equipment_ID').last().reset_index()
-    result_df = pd.merge(underutilized, last_known_details[['Equipment_ID', 'Type', 'Model', 'GPS_Location']], on='Equipment_ID')
-    result_df.rename(columns={'Utilization_Rate': 'Average_Utilization_Rate'}, inplace=True)
-    result_df['Average_Utilization_Rate'] = result_df['Average_Utilization_Rate'].apply(lambda x: f"{x:.2%}")
-    return jsonify({'threshold': f"<{threshold:.0%}",'count': len(result_df),'underutilized_assets': result_df.to_dict(orient='records')})
-
-# --- NEW Endpoint for Return Reminders ---
-@app.route('/returns_due_soon', methods=['GET'])
-def returns_due_soon():
-    if df is None:
-        return jsonify({'error': 'Data for calculation not available.'}), 500
-
-    try:
-        # Get the reminder window in days from the query parameters, default to 7
-        days_out = int(request.args.get('days_out', 7))
-    except ValueError:
-        return jsonify({'error': 'Invalid days_out value. Must be an integer.'}), 400
-
-    # Define the time window for reminders
-    start_date = LATEST_DATE
-    end_date = LATEST_DATE + timedelta(days=days_out)
-
-    # Find all "Active" rentals first
-    active_rentals = df[df['CheckIn_Date'] > LATEST_DATE]
-    
-    # Now, filter those for the ones due back in our time window
-    due_soon = active_rentals[
-        (active_rentals['Planned_Return_Date'] >= start_date) &
-        (active_rentals['Planned_Return_Date'] <= end_date)
-    ]
-    
-    # Select and format the relevant columns for the response
-    result = due_soon[[
-        'Equipment_ID', 'Type', 'Model', 'Customer_ID', 'GPS_Location', 'Planned_Return_Date'
-    ]].copy()
-    
-    result['Planned_Return_Date'] = result['Planned_Return_Date'].dt.strftime('%Y-%m-%d')
-    
-    return jsonify({
-        'reminder_window_days': days_out,
-        'from_date': start_date.strftime('%Y-%m-%d'),
-        'to_date': end_date.strftime('%Y-%m-%d'),
-        'count': len(result),
-        'assets_due_for_return': result.to_dict(orient='records')
-    })
-
-
-@app.route('/predict_breakdown', methods=['POST'])
-def predict_breakdown():
-    if breakdown_model is None: return jsonify({'error': 'Breakdown model not loaded.'}), 500
-    if breakdown_stats is None: return jsonify({'error': 'Breakdown stats not loaded.'}), 500
-
-    json_data = request.get_json()
-    
-    # --- NEW Blended Approach ---
-    # 1. Calculate the statistical risk score
-    means = breakdown_stats['mean']
-    stds = breakdown_stats['std']
-    max_z_score = 0.0
-
-    for feature, value in json_data.items():
-        if feature in means and feature in stds and stds[feature] > 0:
-            z_score = abs((value - means[feature]) / stds[feature])
-            if z_score > max_z_score:
-                max_z_score = z_score
-
-    # Convert the max_z_score to a probability (0% at z=2.5, 95% at z=5.0)
-    stat_prob = 0.0
-    if max_z_score > 2.5:
-        # Scale the probability between a Z-score of 2.5 and 5.0
-        stat_prob = (max_z_score - 2.5) / (5.0 - 2.5)
-        stat_prob = min(stat_prob, 1.0) # Ensure it doesn't exceed 1.0
-        stat_prob = stat_prob * 0.95 # Cap the influence at 95%
-
-    # 2. Calculate the ML model's risk score
-    data = pd.DataFrame(json_data, index=[0])
-    data_encoded = pd.get_dummies(data)
-    data_processed = data_encoded.reindex(columns=BREAKDOWN_MODEL_COLUMNS, fill_value=0)
-    ml_prob = breakdown_model.predict_proba(data_processed)[0][1]
-    
-    # 3. The final probability is the HIGHER of the two scores
-    final_prob = max(ml_prob, stat_prob)
-
-    # 4. Return the blended result
-    prediction = 1 if final_prob > 0.5 else 0
-    prediction_text = 'Likely Breakdown' if prediction == 1 else 'No Breakdown Likely'
-    
-    return jsonify({
-        'prediction': prediction,
-        'prediction_text': prediction_text,
-        'breakdown_probability': f'{final_prob:.2%}'
-    })
-
-@app.route('/predict_price', methods=['POST'])
-# ...
-def predict_price():
-    if price_model is None: return jsonify({'error': 'Price model not loaded.'}), 500
-    try:
-        json_data = request.get_json()
-        data = pd.DataFrame(json_data, index=[0])
-        data_encoded = pd.get_dummies(data)
-        data_processed = data_encoded.reindex(columns=PRICE_MODEL_COLUMNS, fill_value=0)
-        prediction = price_model.predict(data_processed)
-        return jsonify({'predicted_price_usd': round(prediction[0], 2)})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/forecast_demand', methods=['POST'])
-# ...
-def forecast_demand():
-    try:
-        json_data = request.get_json()
-        equipment_type = json_data.get('equipment_type')
-        periods = int(json_data.get('periods', 30))
-        if not equipment_type or equipment_type not in demand_forecasters:
-            return jsonify({'error': 'Invalid or missing equipment_type.'}), 400
-        model = demand_forecasters[equipment_type]
-        future = model.make_future_dataframe(periods=periods)
-        forecast = model.predict(future)
-        forecast_data = forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].tail(periods)
-        forecast_data['ds'] = forecast_data['ds'].dt.strftime('%Y-%m-%d')
-        forecast_data = forecast_data.to_dict(orient='records')
-        return jsonify({'equipment_type': equipment_type,'forecast': forecast_data})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-
-@app.route('/detect_anomaly', methods=['POST'])
-def detect_anomaly():
-    try:
-        json_data = request.get_json()
-        equipment_type = json_data.get('Type')
-        
-        if not equipment_type or equipment_type not in anomaly_detectors:
-            return jsonify({'error': 'Invalid or missing equipment_Type.'}), 400
-
-        # Load the pre-calculated statistics (mean and std dev)
-        stats = anomaly_detectors[equipment_type]
-        means = stats['mean']
-        stds = stats['std']
-        
-        # Define the threshold for anomaly (3 standard deviations from the mean)
-        Z_SCORE_THRESHOLD = 3.0
-
-        for feature in ANOMALY_FEATURES:
-            value = json_data.get(feature, means[feature]) # Default to mean if missing
-            
-            # Avoid division by zero if a feature has no variance
-            if stds[feature] == 0:
-                continue
-
-            # Calculate the Z-score
-            z_score = (value - means[feature]) / stds[feature]
-            
-            # If ANY feature is an outlier, it's an anomaly
-            if abs(z_score) > Z_SCORE_THRESHOLD:
-                return jsonify({
-                    'equipment_type': equipment_type,
-                    'is_anomaly': True,
-                    'result_text': f'Anomalous Usage Detected: {feature} is abnormal'
-                })
-
-        # If all features are within the normal range
-        return jsonify({
-            'equipment_type': equipment_type,
-            'is_anomaly': False,
-            'result_text': 'Normal Usage'
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 400
-    
-if __name__ == '__main__':
+from flask import Flask, request, jsonify
+import joblib
+import json
+import numpy as np
+import pandas as pd
+import os
+import threading
+from functools import wraps
+from datetime import timedelta
+from flask_cors import CORS
+from fleet_state import FleetState
+from asset_index import AssetHistoryIndex
+from utilization_index import UtilizationIndex
+from returns_index import ReturnsIndex
+from forecast_cache import ForecastCache
+from demand_engine import SeasonalTrendForecaster
+from anomaly_scoring import AnomalyScorer
+from columnar_store import load_columnar
+from live_rentals import LiveRentals, EventLog, RentalEventError
+from feature_stats import OnlineFeatureStats
+from analytics_cube import AnalyticsCube, GROUP_COLUMNS, INTERVALS
+from request_metrics import RequestMetrics
+from artifact_loader import ArtifactLoader
+from response_cache import ResponseCache
+from tree_engine import CompiledTreeEnsemble
+from price_optimizer import PriceOptimizer
+from feature_encoding import FeatureLayout, RowEncoder, load_feature_schema, check_feature_schema, numeric_matrix, array_inputs
+
+
+app = Flask(__name__)
+CORS(app)
+# Per-route latency and handler spans, served at /metrics; PROFILE_SAMPLE_RATE > 0 also writes cProfile stats for that share of requests
+metrics = RequestMetrics(profile_sample_rate=float(os.environ.get('PROFILE_SAMPLE_RATE', 0)), profile_dir=os.environ.get('PROFILE_DIR', 'profiles'))
+# Encoded bodies of the read endpoints, valid until the next rental event; RESPONSE_CACHE_MB=0 turns it off (ETags still work)
+response_cache = ResponseCache(max_bytes=int(float(os.environ.get('RESPONSE_CACHE_MB', 64)) * 2**20))
+
+# --- 1. Load All Models & Data ---
+print("--- Loading all models and data ---")
+breakdown_model, price_model, df, LATEST_DATE = None, None, None, None
+fleet_state, asset_index, utilization_index, returns_index, analytics_cube, live_rentals = None, None, None, None, None, None
+# Held while an event updates the history and indexes, and by readers so they never see half an event
+data_lock = threading.RLock()
+EVENT_LOG_PATH = os.environ.get('RENTAL_EVENT_LOG', os.path.join('..', 'ml', 'data', 'events', 'rental_events.ndjson'))
+demand_forecasters, anomaly_detectors = {}, {}
+# Artifacts load concurrently, each once its inputs are ready; LOAD_THREADS=1 loads them one after another
+loader = ArtifactLoader(max_workers=int(os.environ.get('LOAD_THREADS', 8)))
+
+EQUIPMENT_TYPES = ['Bulldozer', 'Crane', 'DumpTruck', 'Excavator', 'Loader']
+# Forecasts up to this many days are precomputed at load; longer ones are cached on first request
+FORECAST_MAX_HORIZON = int(os.environ.get('FORECAST_MAX_HORIZON', 90))
+FORECAST_CACHE_SIZE = int(os.environ.get('FORECAST_CACHE_SIZE', 32))
+forecast_cache = ForecastCache(max_horizon=FORECAST_MAX_HORIZON, max_entries=FORECAST_CACHE_SIZE)
+# Default /forecast_demand engine: 'prophet', or 'numpy' (which also skips loading the Prophet pickles)
+DEMAND_ENGINE = os.environ.get('DEMAND_ENGINE', 'prophet')
+numpy_demand_engine = None
+
+def load_pickle(path, message):
+    artifact = joblib.load(path)
+    print(message)
+    return artifact
+
+BREAKDOWN_MODEL_PATH = os.path.join('..', 'ml', 'models', 'rental_predictor.pkl')
+loader.add('breakdown_model', lambda: load_pickle(BREAKDOWN_MODEL_PATH, "Breakdown model loaded."))
+PRICE_MODEL_PATH = os.path.join('..', 'ml', 'models', 'price_predictor.pkl')
+loader.add('price_model', lambda: load_pickle(PRICE_MODEL_PATH, "Price model loaded."))
+
+def load_numpy_demand_engine():
+    engine = SeasonalTrendForecaster.load(os.path.join('..', 'ml', 'models', 'demand_forecaster_numpy.npz'))
+    print(f"NumPy demand engine loaded for {len(engine.types)} equipment types.")
+    return engine
+loader.add('numpy_demand_engine', load_numpy_demand_engine, required=DEMAND_ENGINE == 'numpy')
+
+def load_demand_forecaster(equipment):
+    model = forecast_cache.add(equipment, f'../ml/models/demand_forecaster_{equipment}.pkl')
+    print(f"Demand forecaster for {equipment} loaded, {FORECAST_MAX_HORIZON}-day forecast precomputed.")
+    return model
+for equipment in (EQUIPMENT_TYPES if DEMAND_ENGINE != 'numpy' else []):
+    loader.add(f'demand_forecaster_{equipment}', lambda equipment=equipment: load_demand_forecaster(equipment))
+for equipment in EQUIPMENT_TYPES:
+    loader.add(f'anomaly_detector_{equipment}', lambda equipment=equipment: load_pickle(f'../ml/models/anomaly_detector_{equipment}.pkl', f"Anomaly detector for {equipment} loaded."))
+# The per-type detectors as one dict, which feature_stats keeps updating in place
+detector_names = [f'anomaly_detector_{equipment}' for equipment in EQUIPMENT_TYPES]
+loader.add('anomaly_detectors', lambda *detectors: {equipment: detector for equipment, detector in zip(EQUIPMENT_TYPES, detectors) if detector is not None},
+           after=detector_names, allow_missing=detector_names)
+
+STATS_PATH = os.path.join('..', 'ml', 'models', 'breakdown_stats.pkl')
+loader.add('breakdown_stats', lambda: load_pickle(STATS_PATH, "Breakdown stats loaded."))
+# Running moments behind breakdown_stats and the anomaly detectors; checked-in rentals are folded into them
+def load_feature_stats(breakdown_stats, anomaly_detectors):
+    stats = OnlineFeatureStats.load(os.path.join('..', 'ml', 'models', 'feature_moments.npz'), breakdown_stats=breakdown_stats, anomaly_detectors=anomaly_detectors)
+    print(f"Feature moments loaded for {len(stats.groups)} equipment types; stats will update as rentals are checked in.")
+    return stats
+loader.add('feature_stats', load_feature_stats, after=['breakdown_stats', 'anomaly_detectors'], required=False, allow_missing=['breakdown_stats'])
+
+# RENTAL_DATA_PATH points the backend at another clean CSV, e.g. one from ML/scripts/generate_synthetic_rentals.py
+DATA_PATH = os.environ.get('RENTAL_DATA_PATH', os.path.join('..', 'ml', 'data', 'processed', 'rental_data_clean.csv'))
+# Written by ML/scripts/convert_to_columnar.py next to the CSV; memory-mapped, so startup skips the CSV parse
+COLUMNAR_DATA_PATH = os.path.splitext(DATA_PATH)[0] + '.columnar'
+COLUMNAR_MANIFEST = os.path.join(COLUMNAR_DATA_PATH, 'manifest.json')
+def load_rental_data():
+    if os.path.exists(COLUMNAR_MANIFEST) and (not os.path.exists(DATA_PATH) or os.path.getmtime(COLUMNAR_MANIFEST) >= os.path.getmtime(DATA_PATH)):
+        df = load_columnar(COLUMNAR_DATA_PATH)
+        print(f"Rental data memory-mapped from {COLUMNAR_DATA_PATH}.")
+    else:
+        if os.path.exists(COLUMNAR_MANIFEST): print("Columnar rental data is older than the CSV; rerun convert_to_columnar.py. Reading the CSV.")
+        df = pd.read_csv(DATA_PATH, parse_dates=['CheckOut_Date', 'CheckIn_Date', 'Planned_Return_Date'])
+    print(f"Logic will be based on the latest data point: {df['CheckOut_Date'].max().strftime('%Y-%m-%d')}")
+    return df
+loader.add('rental_data', load_rental_data)
+
+# The indexes only read the history, so they are built side by side
+def build_index(build, describe):
+    def load(df):
+        index = build(df)
+        print(describe(index))
+        return index
+    return load
+loader.add('fleet_state', build_index(lambda df: FleetState.from_frame(df, df['CheckOut_Date'].max()), lambda index: f"Fleet state built for {len(index)} assets."), after=['rental_data'])
+loader.add('asset_index', build_index(AssetHistoryIndex, lambda index: "Asset history index built."), after=['rental_data'])
+loader.add('utilization_index', build_index(UtilizationIndex, lambda index: "Utilization index built."), after=['rental_data'])
+loader.add('returns_index', build_index(lambda df: ReturnsIndex(df, df['CheckOut_Date'].max()), lambda index: f"Returns index built for {len(index)} active rentals."), after=['rental_data'])
+loader.add('analytics_cube', build_index(AnalyticsCube, lambda cube: f"Analytics cube built: {len(cube.segments)} type/model pairs x {len(cube.sites)} sites x {cube.days} days."), after=['rental_data'])
+
+def load_live_rentals(df, fleet_state, asset_index, utilization_index, returns_index, analytics_cube, feature_stats):
+    # Events ingested since the CSV was written are replayed from the log, then new ones are appended to it
+    event_log = EventLog(EVENT_LOG_PATH)
+    live = LiveRentals(asset_index, fleet_state, utilization_index, returns_index, df['CheckOut_Date'].max(), stats=feature_stats, cube=analytics_cube, first_date=df['CheckOut_Date'].min())
+    replayed = 0
+    for event, data in event_log.replay():
+        try:
+            live.apply(event, data); replayed += 1
+        # Logs written before events were checked up front can hold ones that fail part-way; skip those too
+        except Exception as e: print(f"Skipping logged {event} event: {e}")
+    live.log = event_log
+    print(f"Replayed {replayed} rental events from {EVENT_LOG_PATH}; status date is {live.latest_date.strftime('%Y-%m-%d')}.")
+    return live
+# Without feature_stats the events still apply; the stats just stay as trained
+loader.add('live_rentals', load_live_rentals, after=['rental_data', 'fleet_state', 'asset_index', 'utilization_index', 'returns_index', 'analytics_cube', 'feature_stats'], allow_missing=['feature_stats'])
+
+loaded = loader.run()
+breakdown_model, price_model, numpy_demand_engine, breakdown_stats, feature_stats = (loaded[name] for name in ('breakdown_model', 'price_model', 'numpy_demand_engine', 'breakdown_stats', 'feature_stats'))
+demand_forecasters = {equipment: loaded[f'demand_forecaster_{equipment}'] for equipment in EQUIPMENT_TYPES if loaded.get(f'demand_forecaster_{equipment}') is not None}
+anomaly_detectors = loaded['anomaly_detectors'] or {}
+df, fleet_state, asset_index, utilization_index, returns_index, analytics_cube, live_rentals = (loaded[name] for name in ('rental_data', 'fleet_state', 'asset_index', 'utilization_index', 'returns_index', 'analytics_cube', 'live_rentals'))
+if live_rentals is not None: LATEST_DATE = live_rentals.latest_date
+elif df is not None: LATEST_DATE = df['CheckOut_Date'].max()
+print("--- Loading complete ---")
+
+
+# --- 2. Define Model Columns ---
+# Fallback layouts for models saved before training wrote a feature schema
+BREAKDOWN_MODEL_COLUMNS = ['Manufacture_Year', 'Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters', 'Fuel_Efficiency_L_per_hr', 'Distance_Traveled_km', 'Load_Cycles', 'Engine_Temp_Max', 'Hydraulic_Pressure_Max', 'Rental_Cost_USD', 'Rental_Duration_Days', 'Planned_Duration_Days', 'Overdue_Days', 'Equipment_Age_Years', 'Utilization_Rate', 'Type_Crane', 'Type_DumpTruck', 'Type_Excavator', 'Type_Loader', 'Model_320D2', 'Model_323D3', 'Model_330C', 'Model_336D2', 'Model_350C', 'Model_773G', 'Model_775G', 'Model_777G', 'Model_950GC', 'Model_966GC', 'Model_980M', 'Model_D6R2', 'Model_D7R2', 'Model_D8T', 'GPS_Location_Site_B', 'GPS_Location_Site_C', 'GPS_Location_Site_D', 'GPS_Location_Site_E', 'GPS_Location_Site_F', 'Maintenance_Flag_Yes']
+PRICE_MODEL_COLUMNS = ['Manufacture_Year', 'Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters', 'Fuel_Efficiency_L_per_hr', 'Distance_Traveled_km', 'Load_Cycles', 'Engine_Temp_Max', 'Hydraulic_Pressure_Max', 'Rental_Duration_Days', 'Planned_Duration_Days', 'Overdue_Days', 'Equipment_Age_Years', 'Utilization_Rate', 'Type_Crane', 'Type_DumpTruck', 'Type_Excavator', 'Type_Loader', 'Model_320D2', 'Model_323D3', 'Model_330C', 'Model_336D2', 'Model_350C', 'Model_773G', 'Model_775G', 'Model_777G', 'Model_950GC', 'Model_966GC', 'Model_980M', 'Model_D6R2', 'Model_D7R2', 'Model_D8T', 'GPS_Location_Site_B', 'GPS_Location_Site_C', 'GPS_Location_Site_D', 'GPS_Location_Site_E', 'GPS_Location_Site_F', 'Maintenance_Flag_Yes']
+ANOMALY_FEATURES = ['Operating_Hours','Idle_Hours','Fuel_Consumed_Liters','Fuel_Efficiency_L_per_hr','Load_Cycles','Utilization_Rate']
+
+# --- Feature encoders: built from the schema written at training time, checked against each model ---
+breakdown_encoder, price_encoder = None, None
+if breakdown_model is not None:
+    try:
+        breakdown_schema = load_feature_schema(os.path.join('..', 'ml', 'models', 'rental_predictor_schema.json'), BREAKDOWN_MODEL_COLUMNS)
+        check_feature_schema(breakdown_schema, breakdown_model)
+        breakdown_encoder = RowEncoder(breakdown_schema)
+    except Exception as e:
+        print(f"Breakdown model disabled: {e}"); breakdown_model = None; loader.disable('breakdown_model', str(e))
+if price_model is not None:
+    try:
+        price_schema = load_feature_schema(os.path.join('..', 'ml', 'models', 'price_predictor_schema.json'), PRICE_MODEL_COLUMNS)
+        check_feature_schema(price_schema, price_model)
+        price_encoder = RowEncoder(price_schema)
+    except Exception as e:
+        print(f"Price model disabled: {e}"); price_model = None; loader.disable('price_model', str(e))
+
+# --- Compiled tree engines for single-record scoring (written by ML/scripts/compile_tree_models.py) ---
+def load_compiled_engine(name, model, columns):
+    engine = CompiledTreeEnsemble.load(os.path.join('..', 'ml', 'models', f'{name}_compiled.npz'))
+    if engine.feature_names != columns: raise ValueError('its feature layout differs from the model schema')
+    with array_inputs():
+        error = engine.max_holdout_error(model)
+    if error > 1e-9: raise ValueError(f'its outputs differ from the original model by up to {error:g}')
+    print(f"Compiled engine for {name} loaded and verified on {len(engine.holdout)} holdout rows.")
+    return engine
+
+# Optional: without an engine the model itself scores single records
+for name, file_name, model, encoder in (('breakdown_engine', 'rental_predictor', breakdown_model, breakdown_encoder), ('price_engine', 'price_predictor', price_model, price_encoder)):
+    if model is not None and os.path.exists(os.path.join('..', 'ml', 'models', f'{file_name}_compiled.npz')):
+        loader.add(name, lambda file_name=file_name, model=model, encoder=encoder: load_compiled_engine(file_name, model, encoder.columns), required=False)
+loaded = loader.run()
+breakdown_engine, price_engine = loaded.get('breakdown_engine'), loaded.get('price_engine')
+# Price grids for /optimize_price; the compiled engine's split points let it skip candidates the model cannot tell apart
+price_optimizer = PriceOptimizer(price_model, price_encoder, price_schema, price_engine) if price_model is not None else None
+
+BREAKDOWN_LAYOUT = FeatureLayout(breakdown_encoder.columns if breakdown_encoder else BREAKDOWN_MODEL_COLUMNS)
+# Per-type anomaly means/stds as (types x features) matrices, for batch scoring
+anomaly_scorer = AnomalyScorer(anomaly_detectors, ANOMALY_FEATURES) if anomaly_detectors else None
+if feature_stats is not None: feature_stats.scorer = anomaly_scorer
+
+# Batch scoring reads and scores its input this many records at a time
+BATCH_CHUNK_ROWS = 10000
+CATEGORICAL_COLUMNS = {'Equipment_ID': str, 'Customer_ID': str, 'Type': str, 'Model': str, 'GPS_Location': str, 'Maintenance_Flag': str}
+
+
+def iter_batch_frames(chunk_rows=BATCH_CHUNK_ROWS):
+    """Yield the records of a batch request as DataFrames of at most chunk_rows rows.
+
+    Accepts a JSON array of records (or {"records": [...]}) in the body, or an
+    uploaded 'file' in CSV or NDJSON format.
+    """
+    upload = request.files.get('file')
+    if upload is not None:
+        if upload.filename.lower().endswith('.csv'):
+            yield from pd.read_csv(upload.stream, dtype=CATEGORICAL_COLUMNS, chunksize=chunk_rows)
+            return
+        records = []
+        for line in upload.stream:
+            if line.strip(): records.append(json.loads(line))
+            if len(records) == chunk_rows:
+                yield pd.DataFrame(records); records = []
+        if records: yield pd.DataFrame(records)
+        return
+    json_data = request.get_json()
+    records = json_data.get('records') if isinstance(json_data, dict) else json_data
+    if not isinstance(records, list): raise ValueError('Expected a JSON array of records or an uploaded CSV/NDJSON file.')
+    for start in range(0, len(records), chunk_rows):
+        yield pd.DataFrame(records[start:start + chunk_rows])
+
+
+def breakdown_stat_probability(frame):
+    """Vectorized form of the z-score risk in predict_breakdown(), one value per row."""
+    means, stds = breakdown_stats['mean'], breakdown_stats['std']
+    features = [feature for feature in means if feature in stds and stds[feature] > 0]
+    values = numeric_matrix(frame, features)
+    z_scores = np.abs((values - np.array([means[f] for f in features])) / np.array([stds[f] for f in features]))
+    # Missing features are skipped, exactly like the per-record loop
+    max_z_scores = np.where(np.isnan(z_scores), 0.0, z_scores).max(axis=1, initial=0.0)
+    stat_probs = np.minimum((max_z_scores - 2.5) / (5.0 - 2.5), 1.0) * 0.95
+    return np.where(max_z_scores > 2.5, stat_probs, 0.0)
+
+
+def cached_read(view):
+    """Serve a read endpoint's encoded JSON from response_cache while the data is unchanged, with an ETag for conditional polls.
+
+    Entries are tied to live_rentals.version, which every applied event bumps;
+    the version is read before the view runs, so a body computed while an event
+    lands can only be stored under the older version and is never served after
+    it. Only 200 responses are cached. A request whose If-None-Match has the
+    current ETag gets an empty 304.
+    """
+    @wraps(view)
+    def cached_view(*args, **kwargs):
+        key = ResponseCache.key(request.path, request.args)
+        version = live_rentals.version if live_rentals is not None else 0
+        entry = response_cache.get(key, version)
+        if entry is None:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200: return response
+            entry = response_cache.put(key, version, response.get_data())
+        if request.if_none_match.contains(entry.etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.response_class(entry.body, mimetype='application/json')
+        response.set_etag(entry.etag)
+        # Browsers may keep the body but must check back every time, which the ETag makes cheap
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    return cached_view
+
+
+# --- 3. API Endpoints ---
+@app.before_request
+def start_request_metrics():
+    # Labelled by the route pattern, so /asset_history/<equipment_id> is one series however many IDs are asked for
+    metrics.start_request(request.url_rule.rule if request.url_rule is not None else 'unmatched')
+
+@app.before_request
+def catch_up_on_events():
+    # Workers forked by gunicorn share the event log; apply whatever the others appended before answering
+    global LATEST_DATE
+    if live_rentals is None: return
+    with data_lock:
+        if live_rentals.sync(): LATEST_DATE = live_rentals.latest_date
+
+@app.after_request
+def finish_request_metrics(response):
+    metrics.finish_request(request.method, response.status_code)
+    return response
+
+@app.teardown_request
+def abandon_request_metrics(error):
+    # after_request is skipped when an exception escapes a handler; such a request is counted as a 500
+    metrics.finish_request(request.method, 500)
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    return app.response_class(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/metrics/profiling', methods=['GET', 'POST'])
+def profiling_settings():
+    if request.method == 'POST':
+        try:
+            sample_rate = float((request.get_json(silent=True) or {}).get('sample_rate'))
+            if not 0 <= sample_rate <= 1: raise ValueError
+        except (TypeError, ValueError): return jsonify({'error': 'sample_rate must be a number from 0 (off) to 1 (every request).'}), 400
+        metrics.profile_sample_rate = sample_rate
+    return jsonify({'sample_rate': metrics.profile_sample_rate, 'profile_dir': os.path.abspath(metrics.profile_dir), 'profiles_written': metrics.profiles_written})
+
+@app.route('/')
+def home():
+    return "Smart Rental API is running. All features are implemented."
+
+# Liveness: the process answers. Readiness: every required model and index loaded (503 otherwise)
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    return jsonify({'status': 'ok', 'pid': os.getpid(), 'artifacts': loader.status()})
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    artifacts = loader.status()
+    not_ready = sorted(name for name, artifact in artifacts.items() if artifact['required'] and artifact['status'] != 'loaded')
+    return jsonify({'ready': not not_ready, 'not_ready': not_ready, 'artifacts': artifacts}), 200 if not not_ready else 503
+
+# ... (all previous endpoints are unchanged)
+@app.route('/asset_status', methods=['GET'])
+@cached_read
+def asset_status():
+    if fleet_state is None: return jsonify({'error': 'Data not available.'}), 500
+    with data_lock, metrics.span('aggregate'):
+        statuses, status_date = fleet_state.snapshot(), fleet_state.latest_date
+    with metrics.span('serialize'):
+        return jsonify({'status_date': status_date.strftime('%Y-%m-%d'),'asset_count': len(statuses),'assets': statuses})
+
+@app.route('/asset_history/<equipment_id>', methods=['GET'])
+@cached_read
+def asset_history(equipment_id):
+    if asset_index is None: return jsonify({'error': 'Data not available.'}), 500
+    try:
+        limit, offset = request.args.get('limit'), int(request.args.get('offset', 0))
+        limit = int(limit) if limit else None
+        since, until = request.args.get('since'), request.args.get('until')
+        if (limit is not None and limit < 0) or offset < 0: raise ValueError
+        since = pd.Timestamp(since) if since else None
+        until = pd.Timestamp(until) if until else None
+    except ValueError: return jsonify({'error': 'Invalid pagination or date range. Use non-negative limit/offset and YYYY-MM-DD dates.'}), 400
+    with data_lock, metrics.span('aggregate'):
+        if equipment_id not in asset_index: return jsonify({'error': f'No history for ID: {equipment_id}'}), 404
+        matching, rental_history = asset_index.history(equipment_id, limit=limit, offset=offset, since=since, until=until)
+        summary = asset_index.summary(equipment_id)
+    pagination = {'offset': offset, 'limit': limit, 'since': request.args.get('since'), 'until': request.args.get('until'), 'matching_rentals': matching, 'returned': len(rental_history)}
+    with metrics.span('serialize'):
+        return jsonify({'equipment_id': equipment_id, 'summary': summary, 'pagination': pagination, 'rental_history': rental_history})
+
+@app.route('/underutilized_assets', methods=['GET'])
+@cached_read
+def underutilized_assets():
+    if utilization_index is None: return jsonify({'error': 'Data not available.'}), 500
+    try:
+        top, bottom = request.args.get('top'), request.args.get('bottom')
+        top = int(top) if top else None
+        bottom = int(bottom) if bottom else None
+        # Top/bottom-N rank the whole fleet unless a threshold is also given
+        threshold = request.args.get('threshold')
+        threshold = float(threshold) if threshold else (None if top is not None or bottom is not None else 0.5)
+        min_rentals = int(request.args.get('min_rentals', 0))
+        if (top is not None and bottom is not None) or (top or 0) < 0 or (bottom or 0) < 0: raise ValueError
+    except ValueError: return jsonify({'error': 'Invalid threshold, min_rentals, top or bottom value.'}), 400
+    with data_lock, metrics.span('aggregate'):
+        assets = utilization_index.query(threshold=threshold, equipment_type=request.args.get('type'), site=request.args.get('site'), min_rentals=min_rentals, top=top, bottom=bottom)
+    with metrics.span('serialize'):
+        return jsonify({'threshold': f"<{threshold:.0%}" if threshold is not None else None,'count': len(assets),'underutilized_assets': assets})
+
+# --- NEW Endpoint for Return Reminders ---
+@app.route('/returns_due_soon', methods=['GET'])
+@cached_read
+def returns_due_soon():
+    if returns_index is None:
+        return jsonify({'error': 'Data for calculation not available.'}), 500
+
+    try:
+        # Get the reminder window in days from the query parameters, default to 7
+        days_out = int(request.args.get('days_out', 7))
+    except ValueError:
+        return jsonify({'error': 'Invalid days_out value. Must be an integer.'}), 400
+
+    # Optional narrowing for the per-site / per-customer reminder runs
+    customer_id = request.args.get('customer')
+    site = request.args.get('site')
+
+    with data_lock, metrics.span('aggregate'):
+        # Define the time window for reminders
+        start_date = returns_index.latest_date
+        end_date = start_date + timedelta(days=days_out)
+
+        # Active rentals due back in the window, and those already past their planned return
+        due_soon, overdue = returns_index.query(days_out, customer=customer_id, site=site)
+
+    # Group both lists by customer so one reminder can cover all of a customer's assets
+    by_customer = {}
+    for key, rentals in (('assets_due_for_return', due_soon), ('overdue_assets', overdue)):
+        for rental in rentals:
+            by_customer.setdefault(rental['Customer_ID'], {'assets_due_for_return': [], 'overdue_assets': []})[key].append(rental['Equipment_ID'])
+
+    with metrics.span('serialize'):
+        return jsonify({
+            'reminder_window_days': days_out,
+            'from_date': start_date.strftime('%Y-%m-%d'),
+            'to_date': end_date.strftime('%Y-%m-%d'),
+            'count': len(due_soon),
+            'assets_due_for_return': due_soon,
+            'overdue_count': len(overdue),
+            'overdue_assets': overdue,
+            'by_customer': by_customer
+        })
+
+# --- Dashboard rollups: slice/dice/range-sum queries answered from the analytics cube ---
+@app.route('/analytics', methods=['GET'])
+@cached_read
+def analytics():
+    if analytics_cube is None: return jsonify({'error': 'Data not available.'}), 500
+    def listed(name):
+        # Filters and group_by take comma-separated values
+        value = request.args.get(name)
+        return [item for item in value.split(',') if item] if value else None
+    try:
+        group_by, interval = listed('group_by') or [], request.args.get('interval')
+        if any(dimension not in GROUP_COLUMNS for dimension in group_by) or (interval is not None and interval not in INTERVALS): raise ValueError
+        since, until = request.args.get('since'), request.args.get('until')
+        since = pd.Timestamp(since) if since else None
+        until = pd.Timestamp(until) if until else None
+    except ValueError: return jsonify({'error': f"Invalid query. group_by takes {', '.join(GROUP_COLUMNS)}; interval is {', '.join(INTERVALS)}; dates are YYYY-MM-DD."}), 400
+    filters = {'type': listed('type'), 'model': listed('model'), 'site': listed('site')}
+    with data_lock, metrics.span('aggregate'):
+        rows, totals = analytics_cube.query(types=filters['type'], models=filters['model'], sites=filters['site'], since=since, until=until, group_by=group_by, interval=interval)
+        first, last = analytics_cube.date_range()
+    since, until = since or first, until or last
+    with metrics.span('serialize'):
+        return jsonify({'since': since.strftime('%Y-%m-%d') if since is not None else None, 'until': until.strftime('%Y-%m-%d') if until is not None else None,
+                        'filters': {key: value for key, value in filters.items() if value}, 'group_by': group_by, 'interval': interval, 'count': len(rows), 'rows': rows, 'totals': totals})
+
+# --- Live rental events: logged, then applied to the in-memory history and indexes ---
+def ingest_event(event):
+    global LATEST_DATE
+    if live_rentals is None: return jsonify({'error': 'Data not available.'}), 500
+    try:
+        # The log lock keeps workers from accepting conflicting events; each first catches up on the others' events
+        with data_lock, live_rentals.log.lock(), metrics.span('apply_event'):
+            live_rentals.sync()
+            position = live_rentals.apply(event, request.get_json(silent=True))
+            LATEST_DATE = live_rentals.latest_date
+            rental = asset_index.records([position])[0]
+    except RentalEventError as e:
+        return jsonify({'error': str(e)}), e.status
+    with metrics.span('serialize'):
+        return jsonify({'event': event, 'status_date': LATEST_DATE.strftime('%Y-%m-%d'), 'rental': rental})
+
+@app.route('/events/checkout', methods=['POST'])
+def checkout_event():
+    return ingest_event('checkout')
+
+@app.route('/events/checkin', methods=['POST'])
+def checkin_event():
+    return ingest_event('checkin')
+
+@app.route('/events/telemetry', methods=['POST'])
+def telemetry_event():
+    return ingest_event('telemetry')
+
+
+@app.route('/predict_breakdown', methods=['POST'])
+def predict_breakdown():
+    if breakdown_model is None: return jsonify({'error': 'Breakdown model not loaded.'}), 500
+    if breakdown_stats is None: return jsonify({'error': 'Breakdown stats not loaded.'}), 500
+
+    json_data = request.get_json()
+    
+    # --- NEW Blended Approach ---
+    # 1. Calculate the statistical risk score
+    means = breakdown_stats['mean']
+    stds = breakdown_stats['std']
+    max_z_score = 0.0
+
+    with metrics.span('stats'):
+        for feature, value in json_data.items():
+            if feature in means and feature in stds and stds[feature] > 0:
+                z_score = abs((value - means[feature]) / stds[feature])
+                if z_score > max_z_score:
+                    max_z_score = z_score
+
+    # Convert the max_z_score to a probability (0% at z=2.5, 95% at z=5.0)
+    stat_prob = 0.0
+    if max_z_score > 2.5:
+        # Scale the probability between a Z-score of 2.5 and 5.0
+        stat_prob = (max_z_score - 2.5) / (5.0 - 2.5)
+        stat_prob = min(stat_prob, 1.0) # Ensure it doesn't exceed 1.0
+        stat_prob = stat_prob * 0.95 # Cap the influence at 95%
+
+    # 2. Calculate the ML model's risk score
+    with metrics.span('encode'):
+        data_processed = breakdown_encoder.encode(json_data)
+    with metrics.span('model'), array_inputs():
+        ml_prob = (breakdown_engine or breakdown_model).predict_proba(data_processed)[0][1]
+    
+    # 3. The final probability is the HIGHER of the two scores
+    final_prob = max(ml_prob, stat_prob)
+
+    # 4. Return the blended result
+    prediction = 1 if final_prob > 0.5 else 0
+    prediction_text = 'Likely Breakdown' if prediction == 1 else 'No Breakdown Likely'
+    
+    with metrics.span('serialize'):
+        return jsonify({
+            'prediction': prediction,
+            'prediction_text': prediction_text,
+            'breakdown_probability': f'{final_prob:.2%}'
+        })
+
+@app.route('/predict_breakdown/batch', methods=['POST'])
+def predict_breakdown_batch():
+    if breakdown_model is None: return jsonify({'error': 'Breakdown model not loaded.'}), 500
+    if breakdown_stats is None: return jsonify({'error': 'Breakdown stats not loaded.'}), 500
+    try:
+        results = []
+        for frame in iter_batch_frames():
+            # One encode and one model call per chunk; same blend as the single-record endpoint
+            with metrics.span('encode'):
+                data_processed = BREAKDOWN_LAYOUT.encode_frame(frame)
+            with metrics.span('model'), array_inputs():
+                ml_probs = breakdown_model.predict_proba(data_processed)[:, 1]
+            with metrics.span('stats'):
+                final_probs = np.maximum(ml_probs, breakdown_stat_probability(frame))
+            equipment_ids = frame['Equipment_ID'].tolist() if 'Equipment_ID' in frame.columns else [None] * len(frame)
+            for equipment_id, final_prob in zip(equipment_ids, final_probs.tolist()):
+                prediction = 1 if final_prob > 0.5 else 0
+                result = {'prediction': prediction, 'prediction_text': 'Likely Breakdown' if prediction == 1 else 'No Breakdown Likely', 'breakdown_probability': f'{final_prob:.2%}'}
+                if isinstance(equipment_id, str): result['Equipment_ID'] = equipment_id
+                results.append(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+    with metrics.span('serialize'):
+        return jsonify({'count': len(results), 'results': results})
+
+@app.route('/predict_price', methods=['POST'])
+# ...
+def predict_price():
+    if price_model is None: return jsonify({'error': 'Price model not loaded.'}), 500
+    try:
+        json_data = request.get_json()
+        with metrics.span('encode'):
+            data_processed = price_encoder.encode(json_data)
+        with metrics.span('model'), array_inputs():
+            prediction = (price_engine or price_model).predict(data_processed)
+        with metrics.span('serialize'):
+            return jsonify({'predicted_price_usd': round(prediction[0], 2)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/optimize_price', methods=['POST'])
+def optimize_price():
+    if price_optimizer is None: return jsonify({'error': 'Price model not loaded.'}), 500
+    try:
+        json_data = request.get_json()
+        profile = json_data.get('profile')
+        if not isinstance(profile, dict): return jsonify({'error': 'Missing profile: the equipment and rental fields /predict_price takes.'}), 400
+        axes = price_optimizer.grid(json_data.get('grid'))
+        # The whole grid is encoded and scored in one model call
+        with metrics.span('model'):
+            prices, scored = price_optimizer.score(profile, axes)
+        with metrics.span('serialize'):
+            result = price_optimizer.summarize(axes, prices, json_data.get('objective', 'max_price_per_day'), json_data.get('top', 10), json_data.get('surface', True))
+            result['scored_rows'] = scored
+            return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/forecast_demand', methods=['POST'])
+# ...
+def forecast_demand():
+    try:
+        json_data = request.get_json()
+        equipment_type = json_data.get('equipment_type')
+        periods = int(json_data.get('periods', 30))
+        engine = json_data.get('engine', DEMAND_ENGINE)
+        if engine == 'numpy':
+            if numpy_demand_engine is None or not equipment_type or equipment_type not in numpy_demand_engine:
+                return jsonify({'error': 'Invalid or missing equipment_type, or the NumPy engine is not loaded.'}), 400
+            with metrics.span('model'):
+                forecast_data = numpy_demand_engine.forecast(equipment_type, periods)
+        elif engine == 'prophet':
+            if not equipment_type or equipment_type not in forecast_cache:
+                return jsonify({'error': 'Invalid or missing equipment_type.'}), 400
+            with metrics.span('model'):
+                forecast_data = forecast_cache.get(equipment_type, periods)
+        else:
+            return jsonify({'error': "Invalid engine. Use 'prophet' or 'numpy'."}), 400
+        with metrics.span('serialize'):
+            return jsonify({'equipment_type': equipment_type, 'engine': engine, 'forecast': forecast_data})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/detect_anomaly', methods=['POST'])
+def detect_anomaly():
+    try:
+        json_data = request.get_json()
+        equipment_type = json_data.get('Type')
+        
+        if not equipment_type or equipment_type not in anomaly_detectors:
+            return jsonify({'error': 'Invalid or missing equipment_Type.'}), 400
+
+        # Load the pre-calculated statistics (mean and std dev)
+        stats = anomaly_detectors[equipment_type]
+        means = stats['mean']
+        stds = stats['std']
+        
+        # Define the threshold for anomaly (3 standard deviations from the mean)
+        Z_SCORE_THRESHOLD = 3.0
+
+        for feature in ANOMALY_FEATURES:
+            value = json_data.get(feature, means[feature]) # Default to mean if missing
+            
+            # Avoid division by zero if a feature has no variance
+            if stds[feature] == 0:
+                continue
+
+            # Calculate the Z-score
+            z_score = (value - means[feature]) / stds[feature]
+            
+            # If ANY feature is an outlier, it's an anomaly
+            if abs(z_score) > Z_SCORE_THRESHOLD:
+                return jsonify({
+                    'equipment_type': equipment_type,
+                    'is_anomaly': True,
+                    'result_text': f'Anomalous Usage Detected: {feature} is abnormal'
+                })
+
+        # If all features are within the normal range
+        return jsonify({
+            'equipment_type': equipment_type,
+            'is_anomaly': False,
+            'result_text': 'Normal Usage'
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/detect_anomaly/batch', methods=['POST'])
+def detect_anomaly_batch():
+    if anomaly_scorer is None: return jsonify({'error': 'Anomaly detectors not loaded.'}), 500
+    try:
+        results, anomaly_count = [], 0
+        for frame in iter_batch_frames():
+            # All z-scores of a chunk in one pass; every offending feature is reported, not just the first
+            with metrics.span('model'):
+                codes, z_scores, anomalous = anomaly_scorer.score_frame(frame)
+            any_anomalous = anomalous.any(axis=1)
+            equipment_ids = frame['Equipment_ID'].tolist() if 'Equipment_ID' in frame.columns else [None] * len(frame)
+            for i, (equipment_id, code) in enumerate(zip(equipment_ids, codes.tolist())):
+                if code < 0:
+                    result = {'error': 'Invalid or missing equipment_Type.'}
+                else:
+                    anomalies = anomaly_scorer.offending(z_scores[i], anomalous[i]) if any_anomalous[i] else {}
+                    result = {'equipment_type': anomaly_scorer.types[code], 'is_anomaly': bool(anomalies),
+                              'result_text': f'Anomalous Usage Detected: {next(iter(anomalies))} is abnormal' if anomalies else 'Normal Usage', 'anomalies': anomalies}
+                    anomaly_count += bool(anomalies)
+                if isinstance(equipment_id, str): result['Equipment_ID'] = equipment_id
+                results.append(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+    with metrics.span('serialize'):
+        return jsonify({'count': len(results), 'anomaly_count': anomaly_count, 'results': results})
+    
+if __name__ == '__main__':
     app.run(debug=True, port=5000)
\ No newline at end of file
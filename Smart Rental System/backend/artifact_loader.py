@@ -0,0 +1,75 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class ArtifactLoader:
+    """Loads the backend's models and data on a thread pool, each artifact once the ones it is built from are done.
+
+    add() registers a loader function under a name; run() calls every pending
+    one, passing it the results of the artifacts named in `after`, and returns
+    all results by name. A loader that raises is reported with its message and
+    its artifact is None. An artifact whose inputs failed is skipped, except
+    for inputs listed in its allow_missing, which it gets as None (as the
+    sequential loading did). status() gives each artifact's state and load
+    time for /healthz and /readyz; the backend is ready once every required
+    artifact loaded. run() can be called again for artifacts added later. Its
+    threads are gone by the time it returns, so it is safe to fork afterwards.
+    """
+
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+        self.results = {}
+        self._tasks = {}   # name -> (function, after, required), in the order added
+        self._status = {}  # name -> {'status', 'required', 'seconds', 'error'}
+
+    def add(self, name, function, after=(), required=True, allow_missing=()):
+        self._tasks[name] = (function, tuple(after), set(allow_missing))
+        self._status[name] = {'status': 'pending', 'required': required, 'seconds': None, 'error': None}
+
+    def disable(self, name, reason):
+        """Mark a loaded artifact as unusable, e.g. a model that fails a check made after loading."""
+        self.results[name] = None
+        self._status[name].update(status='failed', error=reason)
+
+    def run(self):
+        pending = {name: task for name, task in self._tasks.items() if self._status[name]['status'] == 'pending'}
+        unknown = {dependency for _, after, _ in pending.values() for dependency in after if dependency not in self._tasks}
+        if unknown: raise ValueError(f"Unknown artifacts: {', '.join(sorted(unknown))}")
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                # Start everything whose inputs are done; skipping one artifact can unblock others, so repeat until nothing changes
+                startable = True
+                while startable:
+                    done_names = {name for name, status in self._status.items() if status['status'] in ('loaded', 'failed', 'skipped')}
+                    startable = [name for name, (_, after, _) in pending.items() if set(after) <= done_names]
+                    for name in startable:
+                        function, after, allow_missing = pending.pop(name)
+                        missing = [dependency for dependency in after if self._status[dependency]['status'] != 'loaded' and dependency not in allow_missing]
+                        if missing:
+                            self.results[name] = None
+                            self._status[name].update(status='skipped', error=f"needs {', '.join(missing)}")
+                            continue
+                        self._status[name]['status'] = 'loading'
+                        running[pool.submit(self._load, name, function, [self.results.get(dependency) for dependency in after])] = name
+                if not running:
+                    if pending: raise ValueError(f"Artifacts waiting on each other: {', '.join(pending)}")
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    running.pop(future)
+        return self.results
+
+    def _load(self, name, function, inputs):
+        start = time.perf_counter()
+        try:
+            self.results[name] = function(*inputs)
+            self._status[name].update(status='loaded')
+        except Exception as e:
+            self.results[name] = None
+            self._status[name].update(status='failed', error=str(e) or type(e).__name__)
+            print(f"Could not load {name}: {e}")
+        self._status[name]['seconds'] = round(time.perf_counter() - start, 4)
+
+    def status(self):
+        return {name: dict(status) for name, status in self._status.items()}
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+from columnar_store import column_values
+from rental_table import RentalTable
+
+
+DATE_COLUMNS = ['CheckOut_Date', 'Planned_Return_Date', 'CheckIn_Date']
+# Per-rental columns summed into each asset's lifetime summary
+SUMMARY_COLUMNS = ['Rental_Duration_Days', 'Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters', 'Breakdowns']
+
+
+class AssetHistoryIndex:
+    """Maps each Equipment_ID to its rental rows, ordered by CheckOut_Date.
+
+    The rows live in a RentalTable built from `df`. Only row positions and
+    checkout days are kept per asset, so a lookup is a dict access plus a binary
+    search, and only the requested page of rows is ever materialised. Lifetime
+    summaries are aggregated at build time and kept current by add_rental() and
+    update_rental().
+    """
+
+    def __init__(self, df):
+        self.table = RentalTable(df)
+        self._positions = {}      # Equipment_ID -> int64 row positions, ascending CheckOut_Date
+        self._checkout_days = {}  # Equipment_ID -> datetime64[D] CheckOut_Dates, parallel to _positions
+        self._totals = {}         # Equipment_ID -> raw sums of SUMMARY_COLUMNS
+        self._sites = {}          # Equipment_ID -> {GPS_Location: rental count}
+        self._summaries = {}      # Equipment_ID -> lifetime summary dict
+        self._build(df)
+
+    def __contains__(self, equipment_id):
+        return equipment_id in self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def _build(self, df):
+        checkout_days = df['CheckOut_Date'].to_numpy().astype('datetime64[D]')
+        by_date = np.argsort(checkout_days, kind='stable')
+        # On a Categorical column (columnar_store.py) this works on the codes, without materialising the IDs
+        codes, equipment_ids = pd.factorize(column_values(df['Equipment_ID'])[by_date])
+        # Stable sort by asset keeps each asset's rows in CheckOut_Date order
+        by_asset = np.argsort(codes, kind='stable')
+        positions = by_date[by_asset]
+        bounds = np.cumsum(np.bincount(codes, minlength=len(equipment_ids)))[:-1]
+        for equipment_id, asset_positions in zip(equipment_ids, np.split(positions, bounds)):
+            self._positions[equipment_id] = asset_positions
+            self._checkout_days[equipment_id] = checkout_days[asset_positions]
+
+        totals = df.groupby('Equipment_ID', observed=True)[SUMMARY_COLUMNS].sum()
+        rentals_per_site = df.groupby(['Equipment_ID', 'GPS_Location'], observed=True).size()
+        for (equipment_id, site), count in rentals_per_site.items():
+            self._sites.setdefault(equipment_id, {})[site] = int(count)
+        for equipment_id, row in zip(totals.index, totals.to_dict(orient='records')):
+            self._totals[equipment_id] = row
+            self._summarize(equipment_id)
+
+    def _summarize(self, equipment_id):
+        row = self._totals[equipment_id]
+        self._summaries[equipment_id] = {'total_rentals': len(self._positions[equipment_id]), 'total_rental_days': int(row['Rental_Duration_Days']), 'total_operating_hours': int(row['Operating_Hours']), 'total_idle_hours': int(row['Idle_Hours']), 'total_fuel_consumed_liters': round(float(row['Fuel_Consumed_Liters']), 2), 'lifetime_breakdowns': int(row['Breakdowns']), 'rentals_per_site': dict(self._sites[equipment_id])}
+
+    def summary(self, equipment_id):
+        return self._summaries[equipment_id]
+
+    def positions(self, equipment_id):
+        """Row positions of one asset's rentals in the table, oldest CheckOut_Date first."""
+        return self._positions[equipment_id]
+
+    def add_rental(self, record):
+        """Append a rental to the table and to its asset's history; returns its row position."""
+        position = self.table.append(record)
+        row = self.table.row(position)
+        equipment_id, checkout_day = row['Equipment_ID'], np.datetime64(row['CheckOut_Date'], 'D')
+        positions = self._positions.get(equipment_id, np.array([], dtype=np.int64))
+        checkout_days = self._checkout_days.get(equipment_id, np.array([], dtype='datetime64[D]'))
+        at = np.searchsorted(checkout_days, checkout_day, side='right')
+        self._positions[equipment_id] = np.insert(positions, at, position)
+        self._checkout_days[equipment_id] = np.insert(checkout_days, at, checkout_day)
+        totals = self._totals.setdefault(equipment_id, {column: 0 for column in SUMMARY_COLUMNS})
+        for column in SUMMARY_COLUMNS: totals[column] += row[column]
+        sites = self._sites.setdefault(equipment_id, {})
+        sites[row['GPS_Location']] = sites.get(row['GPS_Location'], 0) + 1
+        self._summarize(equipment_id)
+        return position
+
+    def update_rental(self, position, values):
+        """Change fields of an existing rental (not its Equipment_ID or CheckOut_Date) and refresh its asset's summary."""
+        before = self.table.row(position)
+        self.table.update(position, values)
+        after = self.table.row(position)
+        equipment_id = after['Equipment_ID']
+        totals = self._totals[equipment_id]
+        for column in SUMMARY_COLUMNS: totals[column] += after[column] - before[column]
+        if after['GPS_Location'] != before['GPS_Location']:
+            sites = self._sites[equipment_id]
+            sites[before['GPS_Location']] -= 1
+            if sites[before['GPS_Location']] == 0: del sites[before['GPS_Location']]
+            sites[after['GPS_Location']] = sites.get(after['GPS_Location'], 0) + 1
+        self._summarize(equipment_id)
+
+    def history(self, equipment_id, limit=None, offset=0, since=None, until=None):
+        """Return (matching_count, records) for one asset, newest rental first.
+
+        `since`/`until` bound CheckOut_Date (inclusive); `offset`/`limit` page
+        through the matching rentals.
+        """
+        checkout_days = self._checkout_days[equipment_id]
+        lo = 0 if since is None else np.searchsorted(checkout_days, np.datetime64(since, 'D'), side='left')
+        hi = len(checkout_days) if until is None else np.searchsorted(checkout_days, np.datetime64(until, 'D'), side='right')
+        matching = int(max(hi - lo, 0))
+        # Newest first: count the page back from the end of the matching range
+        stop = hi - offset
+        start = lo if limit is None else max(stop - limit, lo)
+        if stop <= start:
+            return matching, []
+        return matching, self.records(self._positions[equipment_id][start:stop][::-1])
+
+    def records(self, positions):
+        """The rentals at the given table positions as JSON-ready dicts, in that order."""
+        columns = {}
+        for column, values in self.table.take_columns(positions).items():
+            if column in DATE_COLUMNS:
+                # An open rental has no CheckIn_Date yet
+                columns[column] = [None if missing else day for day, missing in zip(np.datetime_as_string(values, unit='D').tolist(), np.isnat(values).tolist())]
+            else:
+                columns[column] = values.tolist()
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
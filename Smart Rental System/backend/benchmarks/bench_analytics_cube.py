@@ -0,0 +1,53 @@
+# Compares dashboard rollups computed with groupbys over the rental history against AnalyticsCube queries,
+# and times folding one rental into the cube.
+# Run from backend/benchmarks:  python bench_analytics_cube.py [copies ...]
+import sys
+import pandas as pd
+from common import load_clean_data, tile_history, time_call
+from analytics_cube import AnalyticsCube
+
+
+def groupby_rollup(df, types=None, sites=None, since=None, until=None, by=(), freq=None):
+    # What an /analytics query costs without the cube: filter the history, then group and sum
+    rows = df
+    if types is not None: rows = rows[rows['Type'].isin(types)]
+    if sites is not None: rows = rows[rows['GPS_Location'].isin(sites)]
+    if since is not None: rows = rows[rows['CheckOut_Date'] >= since]
+    if until is not None: rows = rows[rows['CheckOut_Date'] <= until]
+    keys = list(by) + ([rows['CheckOut_Date'].dt.to_period(freq).dt.start_time.rename('period')] if freq else [])
+    grouped = rows.groupby(keys) if keys else rows.groupby(lambda _: 0)
+    return grouped.agg(rentals=('Type', 'size'), revenue_usd=('Total_Bill_USD', 'sum'), operating_hours=('Operating_Hours', 'sum'),
+                       breakdowns=('Breakdowns', 'sum'), avg_utilization=('Utilization_Rate', 'mean'))
+
+
+def check(cube, df, since, until):
+    # Totals per type and site over a range match the groupby exactly (utilization to 4 places)
+    rows, _ = cube.query(since=since, until=until, group_by=('type', 'site'))
+    expected = groupby_rollup(df, since=since, until=until, by=('Type', 'GPS_Location'))
+    for row in rows:
+        values = expected.loc[(row['Type'], row['GPS_Location'])]
+        assert [row[m] for m in ('rentals', 'revenue_usd', 'operating_hours', 'breakdowns')] == [int(values[m]) for m in ('rentals', 'revenue_usd', 'operating_hours', 'breakdowns')]
+        assert abs(row['avg_utilization'] - values['avg_utilization']) < 1e-4
+    assert len(rows) == len(expected)
+
+
+if __name__ == '__main__':
+    copies_list = [int(arg) for arg in sys.argv[1:]] or [1, 10, 100]
+    base = load_clean_data()
+    rental = base.iloc[-1].to_dict()
+    print(f"{'rows':>10} {'days':>6} {'build ms':>9} {'groupby ms':>11} {'cube ms':>8} {'weekly gb ms':>13} {'weekly cube ms':>15} {'add rental ms':>14}")
+    for copies in copies_list:
+        df = tile_history(base, copies)
+        build_ms = time_call(lambda: AnalyticsCube(df), repeat=1)
+        cube = AnalyticsCube(df)
+        last = df['CheckOut_Date'].max()
+        since, until = last - pd.Timedelta(days=90), last - pd.Timedelta(days=30)
+        check(cube, df, since, until)
+        check(cube, df, None, None)
+        query = dict(types=['Crane', 'Loader'], sites=['Site_A', 'Site_B'], since=since, until=until)
+        groupby_ms = time_call(lambda: groupby_rollup(df, by=('Type', 'GPS_Location'), **query))
+        cube_ms = time_call(lambda: cube.query(group_by=('type', 'site'), **query), repeat=50)
+        weekly_groupby_ms = time_call(lambda: groupby_rollup(df, by=('Type',), freq='W'))
+        weekly_cube_ms = time_call(lambda: cube.query(group_by=('type',), interval='week'), repeat=20)
+        add_ms = time_call(lambda: cube.replace(None, rental), repeat=50)
+        print(f"{len(df):>10} {cube.days:>6} {build_ms:>9.1f} {groupby_ms:>11.2f} {cube_ms:>8.3f} {weekly_groupby_ms:>13.2f} {weekly_cube_ms:>15.3f} {add_ms:>14.4f}")
@@ -0,0 +1,65 @@
+# Compares the per-record /detect_anomaly loop with AnomalyScorer on in-memory chunks,
+# and times the score_anomalies.py CLI end to end on CSV and NDJSON files.
+# Run from backend/benchmarks:  python bench_anomaly_scoring.py [rows]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import joblib
+import numpy as np
+from common import BACKEND_DIR, load_clean_data, time_call
+from score_anomalies import ANOMALY_FEATURES, EQUIPMENT_TYPES
+from anomaly_scoring import AnomalyScorer
+
+MODELS_DIR = os.path.join(BACKEND_DIR, '..', 'ml', 'models')
+
+
+def legacy_detect_anomaly(record, detectors):
+    # The loop in detect_anomaly(): first offending feature, or None
+    stats = detectors[record['Type']]
+    means, stds = stats['mean'], stats['std']
+    for feature in ANOMALY_FEATURES:
+        value = record.get(feature, means[feature])
+        if stds[feature] == 0: continue
+        if abs((value - means[feature]) / stds[feature]) > 3.0: return feature
+    return None
+
+
+def telemetry(rows, seed=0):
+    """`rows` telemetry records resampled from the clean data, with ~2% of values pushed far out."""
+    base = load_clean_data()[['Equipment_ID', 'Type'] + ANOMALY_FEATURES]
+    rng = np.random.default_rng(seed)
+    frame = base.iloc[rng.integers(0, len(base), rows)].reset_index(drop=True)
+    for feature in ANOMALY_FEATURES:
+        spikes = rng.random(rows) < 0.02
+        frame.loc[spikes, feature] = frame.loc[spikes, feature] * 4 + 10
+    return frame
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    detectors = {equipment: joblib.load(os.path.join(MODELS_DIR, f'anomaly_detector_{equipment}.pkl')) for equipment in EQUIPMENT_TYPES}
+    scorer = AnomalyScorer(detectors, ANOMALY_FEATURES)
+    frame = telemetry(rows)
+
+    sample = frame.iloc[:20000]
+    records = sample.to_dict(orient='records')
+    legacy_ms = time_call(lambda: [legacy_detect_anomaly(r, detectors) for r in records], repeat=1)
+    codes, z_scores, anomalous = scorer.score_frame(sample)
+    first = [scorer.features[row.argmax()] if row.any() else None for row in anomalous]
+    assert first == [legacy_detect_anomaly(r, detectors) for r in records]
+    print(f"legacy loop: {len(records) / legacy_ms * 1000 * 60:>14,.0f} rows/min (20k rows, first offending feature matches)")
+
+    scorer_ms = time_call(lambda: scorer.score_frame(frame), repeat=3)
+    print(f"scorer only: {rows / scorer_ms * 1000 * 60:>14,.0f} rows/min ({rows} rows in {scorer_ms:.0f} ms)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, write in [('telemetry.csv', lambda p: frame.to_csv(p, index=False)), ('telemetry.ndjson', lambda p: frame.to_json(p, orient='records', lines=True))]:
+            path, output = os.path.join(tmp, name), os.path.join(tmp, 'anomalies.ndjson')
+            write(path)
+            start = time.perf_counter()
+            subprocess.run([sys.executable, 'score_anomalies.py', path, '--output', output], cwd=BACKEND_DIR, check=True, stderr=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+            with open(output) as f: reported = sum(1 for _ in f)
+            print(f"CLI {name:>17}: {rows / elapsed * 60:>14,.0f} rows/min including startup ({reported} anomalous rows written)")
@@ -0,0 +1,35 @@
+# Compares the old per-request /asset_history computation with AssetHistoryIndex lookups.
+# Run from backend/benchmarks:  python bench_asset_index.py [copies ...]
+import sys
+import pandas as pd
+from common import load_clean_data, tile_history, time_call
+from asset_index import AssetHistoryIndex
+
+
+def legacy_asset_history(df, equipment_id):
+    # The body of asset_history() before the index was introduced
+    asset_df = df[df['Equipment_ID'] == equipment_id]
+    summary = {'total_rentals': len(asset_df), 'total_rental_days': int(asset_df['Rental_Duration_Days'].sum()), 'total_operating_hours': int(asset_df['Operating_Hours'].sum()), 'total_idle_hours': int(asset_df['Idle_Hours'].sum()), 'total_fuel_consumed_liters': round(float(asset_df['Fuel_Consumed_Liters'].sum()), 2), 'lifetime_breakdowns': int(asset_df['Breakdowns'].sum()), 'rentals_per_site': asset_df.groupby('GPS_Location').size().to_dict()}
+    rental_history = asset_df.sort_values('CheckOut_Date', ascending=False, kind='stable').to_dict(orient='records')
+    for record in rental_history:
+        for key, value in record.items():
+            if isinstance(value, pd.Timestamp): record[key] = value.strftime('%Y-%m-%d')
+    return summary, rental_history
+
+
+if __name__ == '__main__':
+    copies_list = [int(arg) for arg in sys.argv[1:]] or [1, 10, 100]
+    base = load_clean_data()
+    equipment_id = 'EQ0001'
+    print(f"{'rows':>10} {'legacy ms':>10} {'build ms':>9} {'lookup us':>10} {'page(20) us':>12}")
+    for copies in copies_list:
+        df = tile_history(base, copies)
+        legacy_ms = time_call(lambda: legacy_asset_history(df, equipment_id))
+        build_ms = time_call(lambda: AssetHistoryIndex(df), repeat=1)
+        index = AssetHistoryIndex(df)
+        summary, rental_history = legacy_asset_history(df, equipment_id)
+        assert index.summary(equipment_id) == summary and index.history(equipment_id) == (len(rental_history), rental_history)
+        assert index.history(equipment_id, limit=5, offset=1)[1] == rental_history[1:6]
+        lookup_us = time_call(lambda: (index.summary(equipment_id), index.history(equipment_id, limit=0)), repeat=200) * 1000
+        page_us = time_call(lambda: index.history(equipment_id, limit=20), repeat=200) * 1000
+        print(f"{len(df):>10} {legacy_ms:>10.2f} {build_ms:>9.1f} {lookup_us:>10.1f} {page_us:>12.1f}")
@@ -0,0 +1,25 @@
+# Scores the same records through /predict_breakdown one by one and through /predict_breakdown/batch.
+# Run from backend/benchmarks:  python bench_breakdown_batch.py [records]
+import json
+import sys
+import time
+from common import load_clean_data, load_app
+
+if __name__ == '__main__':
+    n_records = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    records = json.loads(load_clean_data().sample(n_records, replace=True, random_state=42).to_json(orient='records', date_format='iso'))
+    client = load_app().app.test_client()
+
+    sample = records[:1000]
+    start = time.perf_counter()
+    single = [client.post('/predict_breakdown', json=record).get_json() for record in sample]
+    single_s = (time.perf_counter() - start) * n_records / len(sample)
+
+    start = time.perf_counter()
+    batch = client.post('/predict_breakdown/batch', json=records).get_json()['results']
+    batch_s = time.perf_counter() - start
+
+    assert [{k: v for k, v in result.items() if k != 'Equipment_ID'} for result in batch[:len(sample)]] == single
+    print(f"records: {n_records}")
+    print(f"single-record endpoint (extrapolated from {len(sample)}): {single_s:8.2f} s  ({n_records / single_s:10.0f} records/s)")
+    print(f"batch endpoint:                                 {batch_s:8.2f} s  ({n_records / batch_s:10.0f} records/s)")
@@ -0,0 +1,92 @@
+# Startup cost of the rental data at scale: the CSV parse against the memory-mapped columnar files
+# written by ML/scripts/convert_to_columnar.py. Every load runs in a fresh process and touches a
+# numeric column, a text column and a date column, like the index builds do. RSS is split into
+# anonymous memory (private to the process) and file-backed pages, which stay in the page cache
+# and are shared by every worker that maps the same files. Both loads read from a warm page cache.
+# Run from backend/benchmarks:  python bench_columnar_store.py [rows ...]
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import pandas as pd
+from common import BACKEND_DIR, DATE_COLUMNS, load_clean_data
+
+SCRIPTS_DIR = os.path.join(BACKEND_DIR, '..', 'ML', 'scripts')
+
+LOAD_AND_MEASURE = '''
+import json, sys, time
+sys.path.insert(0, {backend!r})
+import pandas as pd
+from columnar_store import load_columnar
+start = time.perf_counter()
+df = pd.read_csv({csv!r}, parse_dates={dates!r}) if {mode!r} == 'csv' else load_columnar({columnar!r})
+load_ms = (time.perf_counter() - start) * 1000
+df['Operating_Hours'].sum(); df.groupby('Type').size(); df['CheckOut_Date'].max()
+ready_ms = (time.perf_counter() - start) * 1000
+memory = {{}}
+for line in open('/proc/self/smaps_rollup'):
+    if line.split(':')[0] in ('Rss', 'Anonymous'): memory[line.split(':')[0]] = int(line.split()[1]) / 1024
+print(json.dumps({{'load_ms': load_ms, 'ready_ms': ready_ms, 'rss_mb': memory['Rss'], 'anon_mb': memory['Anonymous']}}))
+'''
+
+
+def write_dataset(df, rows, path):
+    """Write `rows` rows of history to a CSV one tile at a time, like tile_history() but without holding it all."""
+    copies = -(-rows // len(df))
+    days_per_copy = max(1, min(120, 40_000 // copies))  # keep the oldest dates inside the datetime64[ns] range
+    written = 0
+    for i in range(copies):
+        shifted = df.iloc[:rows - written].copy()
+        for column in DATE_COLUMNS:
+            shifted[column] = shifted[column] - pd.Timedelta(days=days_per_copy * (copies - 1 - i))
+        shifted.to_csv(path, mode='a', header=i == 0, index=False, date_format='%Y-%m-%d')
+        written += len(shifted)
+
+
+def measure(mode, csv_path, columnar_path):
+    """Load results from a fresh process, or None if it was killed (out of memory)."""
+    code = LOAD_AND_MEASURE.format(backend=BACKEND_DIR, csv=csv_path, columnar=columnar_path, dates=DATE_COLUMNS, mode=mode)
+    process = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    if process.returncode == -9: return None
+    if process.returncode: raise RuntimeError(process.stderr)
+    return json.loads(process.stdout)
+
+
+def available_mb():
+    for line in open('/proc/meminfo'):
+        if line.startswith('MemAvailable:'): return int(line.split()[1]) / 1024
+
+
+def report(label, result):
+    if result is None:
+        print(f"  {label:<9} killed: out of memory ({available_mb():,.0f} MB available)")
+        return
+    print(f"  {label:<9} load {result['load_ms']:>9,.0f} ms   ready {result['ready_ms']:>9,.0f} ms   RSS {result['rss_mb']:>7,.0f} MB ({result['anon_mb']:,.0f} MB anonymous, {result['rss_mb'] - result['anon_mb']:,.0f} MB file-backed)")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000, 10_000_000]
+    df = load_clean_data()
+    csv_mb_per_row = None
+    for rows in sizes:
+        workdir = tempfile.mkdtemp()
+        csv_path, columnar_path = os.path.join(workdir, 'rental_data_clean.csv'), os.path.join(workdir, 'rental_data_clean.columnar')
+        write_dataset(df, rows, csv_path)
+        start = time.perf_counter()
+        subprocess.run([sys.executable, 'convert_to_columnar.py', csv_path, columnar_path], cwd=SCRIPTS_DIR, check=True, capture_output=True)
+        convert_s = time.perf_counter() - start
+        columnar_mb = sum(os.path.getsize(os.path.join(columnar_path, name)) for name in os.listdir(columnar_path)) / 2**20
+        print(f"{rows:,} rows: CSV {os.path.getsize(csv_path) / 2**20:,.0f} MB, columnar {columnar_mb:,.0f} MB (one-off conversion {convert_s:,.1f} s)")
+
+        # The CSV path holds every text cell as its own str; skip it where that would not fit in memory
+        if csv_mb_per_row is not None and csv_mb_per_row * rows > 0.8 * available_mb():
+            print(f"  csv       skipped: needs ~{csv_mb_per_row * rows:,.0f} MB, {available_mb():,.0f} MB available")
+        else:
+            result = measure('csv', csv_path, columnar_path)
+            if result is not None: csv_mb_per_row = result['rss_mb'] / rows
+            report('csv', result)
+        report('columnar', measure('columnar', csv_path, columnar_path))
+        shutil.rmtree(workdir)
@@ -0,0 +1,23 @@
+# Single-record encoding cost: the old get_dummies + reindex path against RowEncoder.
+# Run from backend/benchmarks:  python bench_feature_encoding.py
+import json
+import os
+import numpy as np
+import pandas as pd
+from common import BACKEND_DIR, time_call
+from feature_encoding import RowEncoder, load_feature_schema
+
+MODELS_DIR = os.path.join(BACKEND_DIR, '..', 'ml', 'models')
+
+if __name__ == '__main__':
+    with open(os.path.join(BACKEND_DIR, '..', 'ml', 'scripts', 'sample_payload.json')) as f:
+        record = json.load(f)
+    for name in ['rental_predictor', 'price_predictor']:
+        schema = load_feature_schema(os.path.join(MODELS_DIR, f'{name}_schema.json'), [])
+        if not schema['columns']: continue
+        encoder = RowEncoder(schema)
+        old = lambda: pd.get_dummies(pd.DataFrame(record, index=[0])).reindex(columns=schema['columns'], fill_value=0)
+        assert np.array_equal(old().to_numpy(dtype=float), encoder.encode(record))
+        old_us = time_call(old, repeat=200) * 1000
+        new_us = time_call(lambda: encoder.encode(record), repeat=2000) * 1000
+        print(f"{name:<17} get_dummies+reindex: {old_us:8.1f} us   RowEncoder: {new_us:6.1f} us")
@@ -0,0 +1,35 @@
+# Compares the old per-request /asset_status computation with the FleetState snapshot.
+# Run from backend/benchmarks:  python bench_fleet_state.py [copies ...]
+import sys
+from common import load_clean_data, tile_history, time_call
+from fleet_state import FleetState
+
+
+def legacy_asset_status(df, latest_date):
+    # The body of asset_status() before the fleet state was introduced
+    last_rentals = df.sort_values('CheckOut_Date').groupby('Equipment_ID').last()
+    statuses = []
+    for index, row in last_rentals.iterrows():
+        status = 'Idle'; customer_id = 'N/A'; planned_return = 'N/A'; last_returned_on = row['CheckIn_Date'].strftime('%Y-%m-%d')
+        if latest_date < row['CheckIn_Date']:
+            status = 'Active'; customer_id = row['Customer_ID']; planned_return = row['Planned_Return_Date'].strftime('%Y-%m-%d'); last_returned_on = 'N/A'
+        statuses.append({'Equipment_ID': row.name,'Status': status,'Type': row['Type'],'Model': row['Model'],'Equipment_Age_Years': row['Equipment_Age_Years'],'Last_Known_Location': row['GPS_Location'],'Current_Customer_ID': customer_id,'Planned_Return_Date': planned_return,'Last_Returned_On': last_returned_on,'Last_Operating_Hours': row['Operating_Hours'],'Last_Utilization_Rate': f"{row['Utilization_Rate']:.2%}",'Breakdowns_on_Last_Rental': row['Breakdowns']})
+    return statuses
+
+
+if __name__ == '__main__':
+    copies_list = [int(arg) for arg in sys.argv[1:]] or [1, 10, 50]
+    base = load_clean_data()
+    print(f"{'rows':>10} {'assets':>7} {'legacy ms':>10} {'build ms':>9} {'snapshot ms':>12} {'apply ms':>9}")
+    for copies in copies_list:
+        df = tile_history(base, copies)
+        latest_date = df['CheckOut_Date'].max()
+        legacy_ms = time_call(lambda: legacy_asset_status(df, latest_date), repeat=1 if copies > 10 else 3)
+        build_ms = time_call(lambda: FleetState.from_frame(df, latest_date), repeat=1)
+        state = FleetState.from_frame(df, latest_date)
+        assert state.snapshot() == legacy_asset_status(base, latest_date)
+        snapshot_ms = time_call(state.snapshot, repeat=20)
+        # Cost of keeping the snapshot current: fold in one new rental, then serve again
+        rental = df.iloc[-1].to_dict()
+        apply_ms = time_call(lambda: (state.apply_rental(rental), state.snapshot()), repeat=20)
+        print(f"{len(df):>10} {len(state):>7} {legacy_ms:>10.1f} {build_ms:>9.1f} {snapshot_ms:>12.4f} {apply_ms:>9.2f}")
@@ -0,0 +1,56 @@
+# Compares per-request Prophet forecasting with ForecastCache slices and LRU hits,
+# and checks that rewriting a model pickle invalidates its cached forecasts.
+# Run from backend/benchmarks:  python bench_forecast_cache.py [max_horizon]
+import os
+import shutil
+import sys
+import tempfile
+import time
+import joblib
+from common import BACKEND_DIR, time_call
+from forecast_cache import ForecastCache
+
+MODELS_DIR = os.path.join(BACKEND_DIR, '..', 'ml', 'models')
+EQUIPMENT_TYPES = ['Bulldozer', 'Crane', 'DumpTruck', 'Excavator', 'Loader']
+
+
+def legacy_forecast(model, periods):
+    # forecast_demand() before the cache
+    future = model.make_future_dataframe(periods=periods)
+    forecast = model.predict(future)
+    forecast_data = forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].tail(periods)
+    forecast_data['ds'] = forecast_data['ds'].dt.strftime('%Y-%m-%d')
+    return forecast_data.to_dict(orient='records')
+
+
+if __name__ == '__main__':
+    max_horizon = int(sys.argv[1]) if len(sys.argv) > 1 else 90
+    cache = ForecastCache(max_horizon=max_horizon, max_entries=8)
+    start = time.perf_counter()
+    models = {equipment: cache.add(equipment, os.path.join(MODELS_DIR, f'demand_forecaster_{equipment}.pkl')) for equipment in EQUIPMENT_TYPES}
+    print(f"load + precompute {len(models)} types: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    print(f"{'type':>10} {'periods':>8} {'legacy ms':>10} {'cached ms':>10} {'max |dyhat|':>12}")
+    for equipment, model in models.items():
+        for periods in [30, max_horizon, max_horizon * 2]:
+            legacy_ms = time_call(lambda: legacy_forecast(model, periods), repeat=3)
+            cache.get(equipment, periods)  # first long-horizon request fills the LRU
+            cached_ms = time_call(lambda: cache.get(equipment, periods), repeat=200)
+            expected, cached = legacy_forecast(model, periods), cache.get(equipment, periods)
+            assert [r['ds'] for r in cached] == [r['ds'] for r in expected]
+            error = max(abs(a['yhat'] - b['yhat']) for a, b in zip(cached, expected))
+            print(f"{equipment:>10} {periods:>8} {legacy_ms:>10.1f} {cached_ms:>10.4f} {error:>12.2e}")
+
+    # Invalidation: touching the pickle keeps the cache, rewriting it reloads the model
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'demand_forecaster.pkl')
+        shutil.copy(os.path.join(MODELS_DIR, 'demand_forecaster_Crane.pkl'), path)
+        cache.add('Crane', path)
+        before = cache.get('Crane', 30)
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        assert cache.get('Crane', 30) == before  # intervals are sampled, so equal means not recomputed
+        joblib.dump(models['Bulldozer'], path)
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 2 * 10**9))
+        after = cache.get('Crane', 30)
+        assert after != before and after[0]['yhat'] == legacy_forecast(models['Bulldozer'], 30)[0]['yhat']
+    print("touch keeps the cached forecast, rewrite reloads it: ok")
@@ -0,0 +1,84 @@
+# Measures live event ingestion through the Flask app: events/s on their own, read latency
+# idle and while events stream in, and what a restart-to-refresh (CSV parse + index build) costs.
+# Run from backend/benchmarks:  python bench_live_events.py [seconds]
+import os
+import sys
+import tempfile
+import threading
+import time
+import numpy as np
+
+os.environ['RENTAL_EVENT_LOG'] = os.path.join(tempfile.mkdtemp(), 'rental_events.ndjson')
+from common import load_app, load_clean_data, time_call
+from fleet_state import FleetState
+from asset_index import AssetHistoryIndex
+from utilization_index import UtilizationIndex
+from returns_index import ReturnsIndex
+
+READ_URLS = ['/asset_history/EQ0001?limit=20', '/returns_due_soon?days_out=7', '/underutilized_assets?bottom=20', '/underutilized_assets?type=Crane&site=Site_A']
+
+
+def event_stream(app, seed=0):
+    """Endless realistic mix: mostly telemetry, plus check-in/checkout cycles on random assets."""
+    rng = np.random.default_rng(seed)
+    equipment_ids = sorted(app.asset_index._positions)
+    day = 0
+    while True:
+        equipment_id = equipment_ids[rng.integers(len(equipment_ids))]
+        kind = rng.random()
+        if kind < 0.8:
+            yield 'telemetry', {'Equipment_ID': equipment_id, 'Operating_Hours': int(rng.integers(0, 200)), 'Idle_Hours': int(rng.integers(0, 50)), 'Fuel_Consumed_Liters': float(rng.uniform(0, 2000))}
+        elif kind < 0.9:
+            yield 'checkin', {'Equipment_ID': equipment_id}
+        else:
+            day += 1
+            checkout = app.LATEST_DATE + np.timedelta64(day // 200, 'D')
+            yield 'checkout', {'Equipment_ID': equipment_id, 'Customer_ID': f'CUST{rng.integers(1000)}', 'CheckOut_Date': checkout.strftime('%Y-%m-%d'), 'Planned_Return_Date': (checkout + np.timedelta64(14, 'D')).strftime('%Y-%m-%d')}
+
+
+def ingest(client, events, stop_at, counts):
+    while time.perf_counter() < stop_at:
+        event, data = next(events)
+        status = client.post(f'/events/{event}', json=data).status_code
+        counts[status] = counts.get(status, 0) + 1
+
+
+def read(client, stop_at, latencies):
+    i = 0
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        assert client.get(READ_URLS[i % len(READ_URLS)]).status_code == 200
+        latencies.append((time.perf_counter() - start) * 1000)
+        i += 1
+
+
+def percentiles(latencies):
+    return f"p50 {np.percentile(latencies, 50):.2f} ms, p99 {np.percentile(latencies, 99):.2f} ms ({len(latencies)} reads)"
+
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    app = load_app()
+    events = event_stream(app)
+
+    counts = {}
+    ingest(app.app.test_client(), events, time.perf_counter() + seconds, counts)
+    print(f"ingest only:  {sum(counts.values()) / seconds:,.0f} events/s (responses: {counts})")
+
+    latencies = []
+    read(app.app.test_client(), time.perf_counter() + seconds, latencies)
+    print(f"reads idle:   {percentiles(latencies)}")
+
+    counts, latencies = {}, []
+    stop_at = time.perf_counter() + seconds
+    threads = [threading.Thread(target=ingest, args=(app.app.test_client(), events, stop_at, counts))]
+    threads += [threading.Thread(target=read, args=(app.app.test_client(), stop_at, latencies)) for _ in range(2)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    print(f"mixed load:   {sum(counts.values()) / seconds:,.0f} events/s with 2 reader threads; reads {percentiles(latencies)}")
+
+    def rebuild():
+        df = load_clean_data()
+        latest_date = df['CheckOut_Date'].max()
+        FleetState.from_frame(df, latest_date); AssetHistoryIndex(df); UtilizationIndex(df); ReturnsIndex(df, latest_date)
+    print(f"restart-to-refresh equivalent (CSV parse + index build): {time_call(rebuild, repeat=3):.0f} ms for {len(load_clean_data())} rows")
@@ -0,0 +1,263 @@
+# Starts the backend against a rental history (by default the real clean CSV; pass one written by
+# ML/scripts/generate_synthetic_rentals.py to test at scale), drives every route with concurrent clients
+# and reports throughput and p50/p95/p99 latency per route, plus startup time and memory, as JSON.
+# Run from backend/benchmarks:  python bench_load.py [--data CSV] [--columnar] [--concurrency N] [--duration S]
+#                                                    [--server dev|gunicorn] [--workers N]
+#                                                    [--output results.json] [--baseline results.json]
+import argparse
+import collections
+import http.client
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import numpy as np
+import pandas as pd
+from common import BACKEND_DIR, DATA_PATH
+
+# A route's p95 latency may grow by this fraction over the baseline before it counts as a regression
+DEFAULT_TOLERANCE = 0.25
+BATCH_RECORDS = 100
+
+
+class RouteLoad:
+    """One benchmarked route: `make(rng)` returns (method, path, body) for the next request, or None when out of work."""
+
+    def __init__(self, name, make):
+        self.name, self.make = name, make
+
+
+def build_routes(records, equipment_ids, types, status_date):
+    # Checkouts open rentals on new asset IDs, which the check-ins then close; both go last, after the read routes
+    opened, new_ids = collections.deque(), itertools.count(1)
+    def checkout(rng):
+        record, equipment_id = records[rng.integers(len(records))], f'LOAD{next(new_ids):07d}'
+        opened.append(equipment_id)
+        planned_return = (status_date + pd.Timedelta(days=record['Planned_Duration_Days'])).strftime('%Y-%m-%d')
+        return 'POST', '/events/checkout', {'Equipment_ID': equipment_id, 'Customer_ID': record['Customer_ID'], 'Planned_Return_Date': planned_return,
+                                            **{column: record[column] for column in ('Type', 'Model', 'Manufacture_Year', 'GPS_Location', 'Maintenance_Flag', 'Rental_Cost_USD')}}
+    def checkin(rng):
+        try:
+            equipment_id = opened.popleft()
+        except IndexError:
+            return None
+        return 'POST', '/events/checkin', {'Equipment_ID': equipment_id, 'Operating_Hours': int(rng.integers(10, 180)), 'Idle_Hours': int(rng.integers(0, 40))}
+    def record(rng): return records[rng.integers(len(records))]
+    def batch(rng): return [records[i] for i in rng.integers(len(records), size=BATCH_RECORDS)]
+    def asset(rng): return equipment_ids[rng.integers(len(equipment_ids))]
+    return [RouteLoad('GET /', lambda rng: ('GET', '/', None)),
+            RouteLoad('GET /asset_status', lambda rng: ('GET', '/asset_status', None)),
+            RouteLoad('GET /asset_history/<id>', lambda rng: ('GET', f'/asset_history/{asset(rng)}', None)),
+            RouteLoad('GET /asset_history/<id>?limit=20', lambda rng: ('GET', f'/asset_history/{asset(rng)}?limit=20', None)),
+            RouteLoad('GET /underutilized_assets', lambda rng: ('GET', '/underutilized_assets', None)),
+            RouteLoad('GET /underutilized_assets?bottom=20', lambda rng: ('GET', '/underutilized_assets?bottom=20', None)),
+            RouteLoad('GET /returns_due_soon', lambda rng: ('GET', '/returns_due_soon?days_out=7', None)),
+            RouteLoad('GET /analytics?group_by=type,site', lambda rng: ('GET', '/analytics?group_by=type,site', None)),
+            RouteLoad('GET /analytics?interval=week', lambda rng: ('GET', '/analytics?group_by=type&interval=week', None)),
+            RouteLoad('POST /predict_breakdown', lambda rng: ('POST', '/predict_breakdown', record(rng))),
+            RouteLoad('POST /predict_breakdown/batch', lambda rng: ('POST', '/predict_breakdown/batch', batch(rng))),
+            RouteLoad('POST /predict_price', lambda rng: ('POST', '/predict_price', record(rng))),
+            RouteLoad('POST /optimize_price', lambda rng: ('POST', '/optimize_price', {'profile': record(rng), 'surface': False})),
+            RouteLoad('POST /forecast_demand', lambda rng: ('POST', '/forecast_demand', {'equipment_type': types[rng.integers(len(types))], 'periods': 30})),
+            RouteLoad('POST /detect_anomaly', lambda rng: ('POST', '/detect_anomaly', record(rng))),
+            RouteLoad('POST /detect_anomaly/batch', lambda rng: ('POST', '/detect_anomaly/batch', batch(rng))),
+            RouteLoad('GET /metrics', lambda rng: ('GET', '/metrics', None)),
+            RouteLoad('POST /events/telemetry', lambda rng: ('POST', '/events/telemetry', {'Equipment_ID': asset(rng), 'Operating_Hours': int(rng.integers(10, 180))})),
+            RouteLoad('POST /events/checkout', checkout),
+            RouteLoad('POST /events/checkin', checkin)]
+
+
+def sample_records(path, rows=20_000):
+    """Request payloads, asset IDs, equipment types and the latest checkout, from the head of the dataset the server loads."""
+    sample = pd.read_csv(path, nrows=rows)
+    records = json.loads(sample.to_json(orient='records'))
+    return records, sorted(sample['Equipment_ID'].unique()), sorted(sample['Type'].unique()), pd.Timestamp(sample['CheckOut_Date'].max())
+
+
+def count_rows(path):
+    """Data rows of a CSV, whether or not its last line ends in a newline."""
+    lines, last = 0, b'\n'
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 24), b''):
+            lines, last = lines + block.count(b'\n'), block[-1:]
+    return lines + (last != b'\n') - 1
+
+
+def memory_kb(pid, field, file='status'):
+    """A memory field of a process in kB: VmRSS or VmHWM (peak) from status, Pss from smaps_rollup; None where /proc lacks it."""
+    try:
+        with open(f'/proc/{pid}/{file}') as f:
+            return next(int(line.split()[1]) for line in f if line.startswith(field + ':'))
+    except (OSError, StopIteration):
+        return None
+
+
+def server_pids(pid):
+    """The server process and its direct children (gunicorn's workers)."""
+    children = []
+    for entry in os.listdir('/proc') if os.path.isdir('/proc') else []:
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                if int(f.read().rsplit(')', 1)[1].split()[1]) == pid: children.append(int(entry))
+        except (OSError, ValueError, IndexError):
+            continue
+    return [pid] + children
+
+
+def server_memory(pid):
+    """(total PSS, largest peak RSS of any one process) in MB; PSS splits pages the forked workers share, so it adds up."""
+    pids = server_pids(pid)
+    pss = [memory_kb(p, 'Pss', 'smaps_rollup') for p in pids]
+    peaks = [memory_kb(p, 'VmHWM') for p in pids]
+    return (sum(pss) / 1024 if None not in pss else None), (max(peaks) / 1024 if None not in peaks else None)
+
+
+def start_server(data_path, port, log_path, event_log, server_kind='dev', workers=1):
+    """Run the app in its own process and wait until it answers; returns (process, seconds to ready).
+
+    'dev' is the threaded Flask server `python app.py` runs; 'gunicorn' is the
+    preforking production mode of gunicorn.conf.py with `workers` workers.
+    """
+    env = dict(os.environ, RENTAL_DATA_PATH=os.path.abspath(data_path), RENTAL_EVENT_LOG=event_log)
+    if server_kind == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--bind', f'127.0.0.1:{port}', '--workers', str(workers), 'app:app']
+    else:
+        command = [sys.executable, '-c', f"import app; app.app.run(host='127.0.0.1', port={port}, threaded=True, use_reloader=False)"]
+    start = time.perf_counter()
+    with open(log_path, 'w') as log:
+        server = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+    while True:
+        if server.poll() is not None: raise RuntimeError(f"The server exited during startup; see {log_path}")
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection.request('GET', '/')
+            if connection.getresponse().status == 200: return server, time.perf_counter() - start
+        except OSError:
+            time.sleep(0.05)
+
+
+def drive(route, port, concurrency, duration, seed):
+    """Send `route` requests from `concurrency` threads for `duration` seconds; returns (latencies in s, statuses, wall seconds)."""
+    latencies, statuses, lock = [], collections.Counter(), threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(index):
+        rng = np.random.default_rng(seed + index)
+        connection, mine, codes = http.client.HTTPConnection('127.0.0.1', port, timeout=120), [], collections.Counter()
+        while time.perf_counter() < deadline:
+            request = route.make(rng)
+            if request is None: break
+            method, path, body = request
+            payload = json.dumps(body).encode() if body is not None else None
+            start = time.perf_counter()
+            try:
+                connection.request(method, path, body=payload, headers={'Content-Type': 'application/json'} if payload else {})
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection, status = http.client.HTTPConnection('127.0.0.1', port, timeout=120), 'error'
+            mine.append(time.perf_counter() - start)
+            codes[status] += 1
+        connection.close()
+        with lock:
+            latencies.extend(mine)
+            statuses.update(codes)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    return np.array(latencies), statuses, time.perf_counter() - start
+
+
+def summarize(latencies, statuses, wall):
+    ok = sum(count for status, count in statuses.items() if isinstance(status, int) and status < 400)
+    p50, p95, p99 = (np.percentile(latencies, [50, 95, 99]) * 1000).tolist() if len(latencies) else (None, None, None)
+    return {'requests': len(latencies), 'errors': len(latencies) - ok, 'statuses': {str(status): count for status, count in sorted(statuses.items(), key=str)},
+            'throughput_rps': len(latencies) / wall if wall else 0.0, 'mean_ms': float(latencies.mean() * 1000) if len(latencies) else None,
+            'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99, 'max_ms': float(latencies.max() * 1000) if len(latencies) else None}
+
+
+def compare(results, baseline, tolerance):
+    """Print each route's p95 and throughput against the baseline run; returns the routes whose p95 regressed."""
+    regressed = []
+    print(f"\n{'vs baseline':<40} {'p95 ms':>9} {'was':>9} {'change':>8} {'rps':>8} {'was':>8}")
+    for name, now in results['routes'].items():
+        before = baseline['routes'].get(name)
+        if not before or not before['p95_ms'] or not now['p95_ms']: continue
+        change = now['p95_ms'] / before['p95_ms'] - 1
+        if change > tolerance: regressed.append(name)
+        print(f"{name:<40} {now['p95_ms']:>9.2f} {before['p95_ms']:>9.2f} {change:>+8.0%} {now['throughput_rps']:>8.1f} {before['throughput_rps']:>8.1f}{'  REGRESSED' if change > tolerance else ''}")
+    for field in ('startup_s', 'peak_rss_mb', 'pss_mb'):
+        if results['server'].get(field) and baseline['server'].get(field):
+            print(f"{field:<40} {results['server'][field]:>9.2f} {baseline['server'][field]:>9.2f} {results['server'][field] / baseline['server'][field] - 1:>+8.0%}")
+    return regressed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load-test every backend route against a rental dataset.')
+    parser.add_argument('--data', default=DATA_PATH, help='clean rental CSV the server loads (default: the real one)')
+    parser.add_argument('--columnar', action='store_true', help="convert the CSV with convert_to_columnar.py first (if not already), so the server memory-maps it")
+    parser.add_argument('--concurrency', type=int, default=8, help='client threads per route (default: 8)')
+    parser.add_argument('--duration', type=float, default=10, help='seconds of load per route (default: 10)')
+    parser.add_argument('--routes', help='only the routes whose name contains this text')
+    parser.add_argument('--server', choices=['dev', 'gunicorn'], default='dev', help="Flask's threaded dev server (default) or gunicorn.conf.py")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='gunicorn workers (default: one per CPU)')
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the results as JSON here')
+    parser.add_argument('--baseline', help='an earlier --output file to compare against; exits 1 if a p95 regressed')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help=f'p95 growth allowed before it counts as a regression (default: {DEFAULT_TOLERANCE})')
+    args = parser.parse_args()
+
+    columnar_path = os.path.splitext(args.data)[0] + '.columnar'
+    if args.columnar and not os.path.exists(os.path.join(columnar_path, 'manifest.json')):
+        subprocess.run([sys.executable, 'convert_to_columnar.py', os.path.abspath(args.data), os.path.abspath(columnar_path)],
+                       cwd=os.path.join(BACKEND_DIR, '..', 'ml', 'scripts'), check=True, stdout=subprocess.DEVNULL)
+    records, equipment_ids, types, status_date = sample_records(args.data)
+    routes = [route for route in build_routes(records, equipment_ids, types, status_date) if not args.routes or args.routes in route.name]
+    dataset = {'path': os.path.abspath(args.data), 'rows': count_rows(args.data), 'csv_mb': os.path.getsize(args.data) / 2**20,
+               'format': 'columnar' if os.path.exists(os.path.join(columnar_path, 'manifest.json')) and os.path.getmtime(os.path.join(columnar_path, 'manifest.json')) >= os.path.getmtime(args.data) else 'csv'}
+
+    with tempfile.TemporaryDirectory() as scratch:
+        # A fresh event log each run, so the events routes never touch the real one
+        server, startup_s = start_server(args.data, args.port, os.path.join(scratch, 'server.log'), os.path.join(scratch, 'events.ndjson'), args.server, args.workers)
+        try:
+            time.sleep(1 if args.server == 'gunicorn' else 0)  # let every worker finish forking before counting their memory
+            ready_pss_mb, _ = server_memory(server.pid)
+            print(f"{dataset['rows']:,} rows ({dataset['format']}); {args.server} server" + (f" with {args.workers} workers" if args.server == 'gunicorn' else '') +
+                  f" ready in {startup_s:.2f}s" + (f" using {ready_pss_mb:.0f} MB" if ready_pss_mb else ''))
+            print(f"{'route':<40} {'requests':>9} {'errors':>7} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+            route_results = {}
+            for route in routes:
+                latencies, statuses, wall = drive(route, args.port, args.concurrency, args.duration, args.seed)
+                result = route_results[route.name] = summarize(latencies, statuses, wall)
+                print(f"{route.name:<40} {result['requests']:>9} {result['errors']:>7} {result['throughput_rps']:>8.1f} " +
+                      ' '.join(f"{result[p]:>9.2f}" if result[p] is not None else f"{'-':>9}" for p in ('p50_ms', 'p95_ms', 'p99_ms')))
+            pss_mb, peak_rss_mb = server_memory(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+
+    results = {'dataset': dataset, 'server': {'kind': args.server, 'workers': args.workers if args.server == 'gunicorn' else 1, 'startup_s': startup_s,
+                                              'ready_pss_mb': ready_pss_mb, 'pss_mb': pss_mb, 'peak_rss_mb': peak_rss_mb},
+               'settings': {'concurrency': args.concurrency, 'duration_s': args.duration, 'cpus': os.cpu_count(), 'python': platform.python_version()},
+               'routes': route_results}
+    if peak_rss_mb: print(f"{pss_mb:.0f} MB across the server's processes at the end (PSS); peak RSS of one process {peak_rss_mb:.0f} MB")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressed = compare(results, json.load(f), args.tolerance)
+        if regressed:
+            print(f"p95 regressed by more than {args.tolerance:.0%} on: {', '.join(regressed)}")
+            sys.exit(1)
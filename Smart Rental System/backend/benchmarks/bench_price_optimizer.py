@@ -0,0 +1,40 @@
+# Pricing a grid of rental terms: one /predict_price request per candidate against one /optimize_price request,
+# and the optimizer scoring every candidate against scoring one per group the model cannot tell apart.
+# Run from backend/benchmarks:  python bench_price_optimizer.py [max_days]
+import json
+import os
+import sys
+import numpy as np
+from common import BACKEND_DIR, load_app, time_call
+from price_optimizer import PriceOptimizer
+
+if __name__ == '__main__':
+    max_days = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    app = load_app()
+    client = app.app.test_client()
+    with open(os.path.join(BACKEND_DIR, '..', 'ml', 'scripts', 'sample_payload.json')) as f:
+        profile = json.load(f)
+    grid = {'Planned_Duration_Days': {'min': 1, 'max': max_days}, 'Rental_Duration_Days': {'min': 1, 'max': max_days}}
+    optimizer = app.price_optimizer
+    axes = optimizer.grid(grid)
+    candidates = int(np.prod([len(values) for values in axes.values()]))
+
+    one_ms = time_call(lambda: client.post('/predict_price', json=profile), repeat=200)
+    unbinned = PriceOptimizer(optimizer.model, optimizer.encoder, app.price_schema)
+    prices, scored = optimizer.score(profile, axes)
+    all_prices, _ = unbinned.score(profile, axes)
+    assert np.array_equal(prices, all_prices)
+    single = client.post('/predict_price', json={**profile, 'Planned_Duration_Days': 7, 'Rental_Duration_Days': 9, 'Overdue_Days': 2, 'GPS_Location': 'Site_C', 'Maintenance_Flag': 'Yes'})
+    index = (list(axes['Planned_Duration_Days']).index(7), list(axes['Rental_Duration_Days']).index(9), axes['GPS_Location'].index('Site_C'), axes['Maintenance_Flag'].index('Yes'))
+    assert round(float(prices[index]), 2) == single.get_json()['predicted_price_usd']
+
+    print(f"{candidates:,} candidates ({max_days} x {max_days} durations x {len(axes['GPS_Location'])} sites x {len(axes['Maintenance_Flag'])} flags)")
+    print(f"  one /predict_price request each:   {one_ms * candidates:10.1f} ms  ({one_ms:.3f} ms per request)")
+    print(f"  score every candidate:             {time_call(lambda: unbinned.score(profile, axes), repeat=5):10.1f} ms")
+    print(f"  score one per split interval:      {time_call(lambda: optimizer.score(profile, axes), repeat=5):10.1f} ms  ({scored:,} rows scored)")
+    print(f"  summarize with surfaces:           {time_call(lambda: optimizer.summarize(axes, prices), repeat=5):10.1f} ms")
+    for surface in (True, False):
+        body = {'profile': profile, 'grid': grid, 'surface': surface}
+        response = client.post('/optimize_price', json=body)
+        assert response.status_code == 200, response.get_json()
+        print(f"  POST /optimize_price surface={str(surface):<5}  {time_call(lambda: client.post('/optimize_price', json=body), repeat=5):10.1f} ms  ({len(response.data) / 1024:.0f} KB)")
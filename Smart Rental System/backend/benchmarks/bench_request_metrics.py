@@ -0,0 +1,52 @@
+# Measures what the /metrics instrumentation adds to a request: the hooks and spans on their own,
+# and whole requests with cProfile sampling off and on every request.
+# Run from backend/benchmarks:  python bench_request_metrics.py [requests]
+import json
+import sys
+import tempfile
+import time
+from common import load_clean_data, load_app
+from request_metrics import RequestMetrics
+
+
+def per_call_us(func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def instrumented_request(metrics, spans):
+    # What the before/after hooks and a handler's spans cost, around an empty handler
+    metrics.start_request('/predict_breakdown')
+    for name in spans:
+        with metrics.span(name): pass
+    metrics.finish_request('POST', 200)
+
+
+if __name__ == '__main__':
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    payload = json.loads(load_clean_data().iloc[[0]].to_json(orient='records', date_format='iso'))[0]
+    app = load_app()
+    client = app.app.test_client()
+    routes = [('/predict_breakdown', lambda: client.post('/predict_breakdown', json=payload)),
+              ('/predict_price', lambda: client.post('/predict_price', json=payload)),
+              ('/asset_status', lambda: client.get('/asset_status'))]
+
+    spans = ('stats', 'encode', 'model', 'serialize')
+    metrics = RequestMetrics()
+    hooks_us = per_call_us(lambda: instrumented_request(metrics, ()), n_requests * 10)
+    spans_us = per_call_us(lambda: instrumented_request(metrics, spans), n_requests * 10)
+    print(f"hooks alone: {hooks_us:6.2f} us/request   hooks + {len(spans)} spans: {spans_us:6.2f} us/request")
+
+    print(f"{'route':<20} {'profiling off us':>17} {'overhead %':>11} {'profiling on us':>16}")
+    with tempfile.TemporaryDirectory() as profile_dir:
+        app.metrics.profile_dir = profile_dir
+        for route, call in routes:
+            calls = n_requests if route != '/asset_status' else max(n_requests // 20, 10)
+            app.metrics.profile_sample_rate = 0.0
+            off_us = per_call_us(call, calls)
+            app.metrics.profile_sample_rate = 1.0
+            on_us = per_call_us(call, calls)
+            app.metrics.profile_sample_rate = 0.0
+            print(f"{route:<20} {off_us:>17.0f} {spans_us / off_us * 100:>11.2f} {on_us:>16.0f}")
@@ -0,0 +1,30 @@
+# Times the cached read endpoints three ways: recomputed (cache off), served from the response cache,
+# and answered 304 Not Modified to a poll that sends the ETag back.
+# Set RENTAL_DATA_PATH to benchmark a larger, generated history.
+# Run from backend/benchmarks:  python bench_response_cache.py [repeat]
+import sys
+from common import load_app, time_call
+
+URLS = ['/asset_status', '/asset_history/{equipment_id}', '/underutilized_assets', '/underutilized_assets?bottom=20', '/returns_due_soon?days_out=7',
+        '/analytics?group_by=type,site']
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    app = load_app()
+    client = app.app.test_client()
+    max_bytes = app.response_cache.max_bytes
+    # Any asset of the dataset loaded; generated ones number their assets differently
+    equipment_id = client.get('/underutilized_assets?bottom=1').get_json()['underutilized_assets'][0]['Equipment_ID']
+    print(f"{'url':<36} {'body KB':>8} {'recomputed ms':>14} {'cached ms':>10} {'304 ms':>8}")
+    for url in [url.format(equipment_id=equipment_id) for url in URLS]:
+        app.response_cache.max_bytes = 0
+        uncached = client.get(url)
+        recomputed_ms = time_call(lambda: client.get(url), repeat)
+        app.response_cache.max_bytes = max_bytes
+        cached = client.get(url)
+        assert cached.data == uncached.data and cached.headers['ETag'] == uncached.headers['ETag']
+        cached_ms = time_call(lambda: client.get(url), repeat * 10)
+        etag = cached.headers['ETag']
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+        not_modified_ms = time_call(lambda: client.get(url, headers={'If-None-Match': etag}), repeat * 10)
+        print(f"{url:<36} {len(cached.data) / 1024:>8.0f} {recomputed_ms:>14.2f} {cached_ms:>10.3f} {not_modified_ms:>8.3f}")
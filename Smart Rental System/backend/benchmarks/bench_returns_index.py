@@ -0,0 +1,36 @@
+# Compares the old per-request /returns_due_soon filtering with ReturnsIndex range queries.
+# Run from backend/benchmarks:  python bench_returns_index.py [copies ...]
+import sys
+from datetime import timedelta
+from common import load_clean_data, tile_history, time_call
+from returns_index import ReturnsIndex
+
+
+def legacy_returns_due_soon(df, latest_date, days_out, customer=None, site=None):
+    # The filtering in returns_due_soon() before the index, plus the new optional narrowing
+    active_rentals = df[df['CheckIn_Date'] > latest_date]
+    if customer is not None: active_rentals = active_rentals[active_rentals['Customer_ID'] == customer]
+    if site is not None: active_rentals = active_rentals[active_rentals['GPS_Location'] == site]
+    due_soon = active_rentals[(active_rentals['Planned_Return_Date'] >= latest_date) & (active_rentals['Planned_Return_Date'] <= latest_date + timedelta(days=days_out))]
+    overdue = active_rentals[active_rentals['Planned_Return_Date'] < latest_date]
+    return set(due_soon['Equipment_ID']), set(overdue['Equipment_ID'])
+
+
+if __name__ == '__main__':
+    copies_list = [int(arg) for arg in sys.argv[1:]] or [1, 10, 100]
+    base = load_clean_data()
+    latest_date = base['CheckOut_Date'].max()
+    sample = base[base['CheckIn_Date'] > latest_date].iloc[0]
+    print(f"{'rows':>10} {'active':>7} {'legacy ms':>10} {'build ms':>9} {'fleet 7d ms':>12} {'site 7d ms':>11} {'customer ms':>12}")
+    for copies in copies_list:
+        df = tile_history(base, copies)
+        legacy_ms = time_call(lambda: legacy_returns_due_soon(df, latest_date, 7))
+        build_ms = time_call(lambda: ReturnsIndex(df, latest_date), repeat=1)
+        index = ReturnsIndex(df, latest_date)
+        for days_out, customer, site in [(7, None, None), (30, None, 'Site_A'), (7, sample['Customer_ID'], None), (7, sample['Customer_ID'], sample['GPS_Location']), (-1, None, None)]:
+            due_soon, overdue = index.query(days_out, customer=customer, site=site)
+            assert ({r['Equipment_ID'] for r in due_soon}, {r['Equipment_ID'] for r in overdue}) == legacy_returns_due_soon(df, latest_date, days_out, customer, site)
+        fleet_ms = time_call(lambda: index.query(7), repeat=50)
+        site_ms = time_call(lambda: index.query(7, site='Site_A'), repeat=50)
+        customer_ms = time_call(lambda: index.query(7, customer=sample['Customer_ID']), repeat=50)
+        print(f"{len(df):>10} {len(index):>7} {legacy_ms:>10.2f} {build_ms:>9.1f} {fleet_ms:>12.3f} {site_ms:>11.3f} {customer_ms:>12.4f}")
@@ -0,0 +1,42 @@
+# Single-row latency (p50/p99) of the original models against the compiled tree engine.
+# Run from backend/benchmarks after ML/scripts/compile_tree_models.py:  python bench_tree_engine.py [calls]
+import os
+import sys
+import time
+import warnings
+import joblib
+import numpy as np
+from common import BACKEND_DIR
+from tree_engine import CompiledTreeEnsemble
+
+MODELS_DIR = os.path.join(BACKEND_DIR, '..', 'ml', 'models')
+warnings.filterwarnings('ignore', message='X does not have valid feature names')
+
+
+def latencies_us(predict, rows, calls):
+    samples = []
+    for i in range(calls):
+        row = rows[i % len(rows)][None, :]
+        start = time.perf_counter()
+        predict(row)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return np.percentile(samples, 50), np.percentile(samples, 99)
+
+
+if __name__ == '__main__':
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"{'model':<17} {'engine':<9} {'p50 us':>9} {'p99 us':>9} {'batch of 500 ms':>16}")
+    for name, method in [('rental_predictor', 'predict_proba'), ('price_predictor', 'predict')]:
+        compiled_path = os.path.join(MODELS_DIR, f'{name}_compiled.npz')
+        if not os.path.exists(compiled_path): continue
+        engine = CompiledTreeEnsemble.load(compiled_path)
+        model = joblib.load(os.path.join(MODELS_DIR, f'{name}.pkl'))
+        assert engine.max_holdout_error(model) <= 1e-9
+        for label, predictor in [('original', model), ('compiled', engine)]:
+            predict = getattr(predictor, method)
+            predict(engine.holdout[:1])
+            p50, p99 = latencies_us(predict, engine.holdout, calls)
+            start = time.perf_counter()
+            predict(engine.holdout)
+            batch_ms = (time.perf_counter() - start) * 1000
+            print(f"{name:<17} {label:<9} {p50:>9.1f} {p99:>9.1f} {batch_ms:>16.1f}")
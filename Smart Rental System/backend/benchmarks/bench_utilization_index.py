@@ -0,0 +1,34 @@
+# Compares the old per-request /underutilized_assets computation with UtilizationIndex queries.
+# Run from backend/benchmarks:  python bench_utilization_index.py [copies ...]
+import sys
+import pandas as pd
+from common import load_clean_data, tile_history, time_call
+from utilization_index import UtilizationIndex
+
+
+def legacy_underutilized(df, threshold):
+    # The body of underutilized_assets() before the index was introduced
+    avg_utilization = df.groupby('Equipment_ID')['Utilization_Rate'].mean().reset_index()
+    underutilized = avg_utilization[avg_utilization['Utilization_Rate'] < threshold]
+    last_known_details = df.sort_values('CheckOut_Date').groupby('Equipment_ID').last().reset_index()
+    result_df = pd.merge(underutilized, last_known_details[['Equipment_ID', 'Type', 'Model', 'GPS_Location']], on='Equipment_ID')
+    result_df.rename(columns={'Utilization_Rate': 'Average_Utilization_Rate'}, inplace=True)
+    result_df['Average_Utilization_Rate'] = result_df['Average_Utilization_Rate'].apply(lambda x: f"{x:.2%}")
+    return result_df.to_dict(orient='records')
+
+
+if __name__ == '__main__':
+    copies_list = [int(arg) for arg in sys.argv[1:]] or [1, 10, 50]
+    base = load_clean_data()
+    print(f"{'rows':>10} {'legacy ms':>10} {'build ms':>9} {'<70% ms':>8} {'<70% Crane@Site_A ms':>21} {'bottom 20 ms':>13}")
+    for copies in copies_list:
+        df = tile_history(base, copies)
+        legacy_ms = time_call(lambda: legacy_underutilized(df, 0.7), repeat=3)
+        build_ms = time_call(lambda: UtilizationIndex(df), repeat=1)
+        index = UtilizationIndex(df)
+        expected = legacy_underutilized(df, 0.7)
+        assert [{k: v for k, v in r.items() if k != 'Rental_Count'} for r in index.query(threshold=0.7)] == expected
+        threshold_ms = time_call(lambda: index.query(threshold=0.7), repeat=50)
+        filtered_ms = time_call(lambda: index.query(threshold=0.7, equipment_type='Crane', site='Site_A'), repeat=50)
+        bottom_ms = time_call(lambda: index.query(bottom=20), repeat=50)
+        print(f"{len(df):>10} {legacy_ms:>10.1f} {build_ms:>9.1f} {threshold_ms:>8.3f} {filtered_ms:>21.3f} {bottom_ms:>13.3f}")
@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import pandas as pd
+
+# Benchmarks import the backend modules directly, without starting the app
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+DATA_PATH = os.path.join(BACKEND_DIR, '..', 'ml', 'data', 'processed', 'rental_data_clean.csv')
+DATE_COLUMNS = ['CheckOut_Date', 'CheckIn_Date', 'Planned_Return_Date']
+
+
+def load_clean_data(path=DATA_PATH):
+    return pd.read_csv(path, parse_dates=DATE_COLUMNS)
+
+
+def tile_history(df, copies, days_per_copy=120):
+    """Grow the rental history without growing the fleet.
+
+    Each extra copy of the data is shifted `days_per_copy` further into the past,
+    so every asset gets `copies` rentals and the most recent rentals are unchanged.
+    """
+    frames = []
+    for i in range(copies):
+        shifted = df.copy()
+        offset = pd.Timedelta(days=days_per_copy * (copies - 1 - i))
+        for column in DATE_COLUMNS:
+            shifted[column] = shifted[column] - offset
+        frames.append(shifted)
+    return pd.concat(frames, ignore_index=True)
+
+
+def time_call(func, repeat=5):
+    """Best-of-`repeat` wall time of func() in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def load_app():
+    """Import the Flask app the way `python app.py` would, from the backend directory."""
+    os.chdir(BACKEND_DIR)
+    import app
+    return app
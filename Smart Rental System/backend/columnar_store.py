@@ -0,0 +1,45 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+
+# Written by ML/scripts/convert_to_columnar.py
+COLUMNAR_FORMAT = 'rental-columnar-v1'
+
+
+def column_values(series):
+    """A column's Categorical when it is dictionary-encoded, else its ndarray; indexing either never materialises text for other rows."""
+    return series.array if isinstance(series.dtype, pd.CategoricalDtype) else series.to_numpy()
+
+
+def load_columnar(path):
+    """Load a columnar rental dataset as a DataFrame that groups, sorts and compares like the CSV path.
+
+    Nothing is decoded: numeric columns are read-only memory maps of their
+    files, text columns are Categoricals over the memory-mapped codes and the
+    manifest's (sorted) dictionary, and dates map straight to datetime64[ns].
+    So loading reads nothing up front and every process that loads the same
+    files shares their pages. Text values are only materialised for the rows
+    a caller takes. Directories written before dictionaries were sorted and
+    dates stored in nanoseconds are still read, at the cost of copies.
+    """
+    with open(os.path.join(path, 'manifest.json')) as f:
+        manifest = json.load(f)
+    if manifest.get('format') != COLUMNAR_FORMAT:
+        raise ValueError(f"{path} is not in {COLUMNAR_FORMAT} format")
+    rows = manifest['rows']
+    columns = {}
+    for column in manifest['columns']:
+        file_path = os.path.join(path, column['file'])
+        data = np.memmap(file_path, dtype=column['dtype'], mode='r', shape=(rows,)) if rows else np.empty(0, dtype=column['dtype'])
+        if column['kind'] == 'category':
+            # Code -1 is a missing value, as read_csv would give NaN
+            values = pd.Categorical.from_codes(data, dtype=pd.CategoricalDtype(pd.Index(column['categories'], dtype=object)))
+            if column['categories'] != sorted(column['categories']): values = values.reorder_categories(sorted(column['categories']))
+            columns[column['name']] = values
+        elif column['kind'] == 'date':
+            columns[column['name']] = data.view('datetime64[ns]') if column.get('unit') == 'ns' else data.view('datetime64[D]').astype('datetime64[ns]')
+        else:
+            columns[column['name']] = data
+    return pd.DataFrame(columns, copy=False)
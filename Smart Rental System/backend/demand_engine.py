@@ -0,0 +1,45 @@
+import numpy as np
+
+
+class SeasonalTrendForecaster:
+    """Linear trend + day-of-week demand forecaster fitted by ML/scripts/seasonal_forecaster.py.
+
+    Holds the least-squares coefficients for every equipment type in one
+    (features x types) matrix, so a forecast is a matrix product plus the OLS
+    prediction interval. Returns records in the same shape as the Prophet path
+    of /forecast_demand.
+    """
+
+    def __init__(self, arrays):
+        self.types = [str(name) for name in arrays['types']]
+        self.coef = arrays['coef']
+        self.xtx_inv = arrays['xtx_inv']
+        self.sigma = arrays['sigma']
+        self.t_value = float(arrays['t_value'])
+        self.start_date = np.datetime64(str(arrays['start_date']), 'D')
+        self.last_date = np.datetime64(str(arrays['last_date']), 'D')
+        self.time_scale = float(arrays['time_scale'])
+        self._columns = {name: i for i, name in enumerate(self.types)}
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls({key: data[key] for key in data.files})
+
+    def __contains__(self, equipment_type):
+        return equipment_type in self._columns
+
+    def _design(self, dates):
+        # Must match seasonal_forecaster.design_matrix: [1, scaled time, Tuesday..Sunday]
+        t = (dates - self.start_date).astype(float) / self.time_scale
+        day_of_week = (dates.view('int64') + 3) % 7  # Monday = 0; 1970-01-01 was a Thursday
+        return np.column_stack([np.ones(len(dates)), t] + [(day_of_week == day).astype(float) for day in range(1, 7)])
+
+    def forecast(self, equipment_type, periods):
+        column = self._columns[equipment_type]
+        dates = self.last_date + np.arange(1, max(periods, 0) + 1)
+        X = self._design(dates)
+        yhat = X @ self.coef[:, column]
+        margin = self.t_value * self.sigma[column] * np.sqrt(1 + np.einsum('ij,jk,ik->i', X, self.xtx_inv, X))
+        return [{'ds': ds, 'yhat': y, 'yhat_lower': y - m, 'yhat_upper': y + m}
+                for ds, y, m in zip(np.datetime_as_string(dates, unit='D').tolist(), yhat.tolist(), margin.tolist())]
@@ -0,0 +1,154 @@
+import json
+import os
+import threading
+import warnings
+import numpy as np
+import pandas as pd
+
+
+# Columns that get_dummies one-hot encoded at training time (see ML/scripts/feature_schema.py)
+CATEGORICAL_FEATURES = ['Type', 'Model', 'GPS_Location', 'Maintenance_Flag']
+
+
+def schema_from_columns(columns, categorical_features=CATEGORICAL_FEATURES):
+    """Rebuild a feature schema from a get_dummies column list, for models trained before schemas existed."""
+    categorical = {feature: {} for feature in categorical_features}
+    numeric = []
+    for slot, column in enumerate(columns):
+        feature = next((f for f in categorical_features if column.startswith(f + '_')), None)
+        if feature is None: numeric.append(column)
+        else: categorical[feature][column[len(feature) + 1:]] = slot
+    return {'columns': list(columns), 'numeric_columns': numeric, 'categorical_columns': categorical}
+
+
+def load_feature_schema(path, fallback_columns):
+    if not os.path.exists(path):
+        print(f"No feature schema at {path}, deriving it from the built-in column list.")
+        return schema_from_columns(fallback_columns)
+    with open(path) as f:
+        return json.load(f)
+
+
+def check_feature_schema(schema, model):
+    """Raise if the model was fitted on a different column layout than the schema describes."""
+    expected = getattr(model, 'feature_names_in_', None)  # scikit-learn
+    if expected is None: expected = getattr(model, 'feature_name_', None)  # LightGBM
+    if expected is None: return
+    if list(expected) != schema['columns']:
+        missing = [c for c in expected if c not in schema['columns']]
+        extra = [c for c in schema['columns'] if c not in list(expected)]
+        raise ValueError(f"feature schema does not match the model (missing: {missing}, unexpected: {extra}, or the order differs)")
+
+
+class _ArrayInputs:
+    """Silences scikit-learn's missing-feature-names warning around model calls fed an encoded array.
+
+    The encoders guarantee the column order, so models are fed plain arrays
+    rather than DataFrames. catch_warnings() swaps the process-wide filter
+    list, so overlapping calls (request and loader threads) share one
+    context: the first to enter installs the filter and the last to leave
+    restores the filters, and the warning is only hidden while a call runs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+        self._context = None
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        with self._lock:
+            if self._active == 0:
+                self._context = warnings.catch_warnings()
+                self._context.__enter__()
+                warnings.filterwarnings('ignore', message='X does not have valid feature names')
+            self._active += 1
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self._active -= 1
+            if self._active == 0:
+                self._context.__exit__(None, None, None)
+                self._context = None
+
+
+# with array_inputs(): model.predict(encoded_rows)
+array_inputs = _ArrayInputs()
+
+
+class RowEncoder:
+    """Encodes one JSON record into a preallocated (1 x columns) row, without pandas.
+
+    Gives the same row as `pd.get_dummies(pd.DataFrame(record, index=[0]))
+    .reindex(columns=columns, fill_value=0)`. The returned array is reused by the
+    next call on the same thread, so use it before encoding again.
+    """
+
+    def __init__(self, schema):
+        self.columns = schema['columns']
+        self.slots = {column: i for i, column in enumerate(self.columns)}
+        self.category_slots = {feature: {category: slot for category, slot in categories.items() if slot is not None} for feature, categories in schema['categorical_columns'].items()}
+        self._local = threading.local()
+
+    def encode(self, record):
+        row = getattr(self._local, 'row', None)
+        if row is None:
+            row = self._local.row = np.zeros((1, len(self.columns)))
+        else:
+            row.fill(0.0)
+        for key, value in record.items():
+            if isinstance(value, str):
+                slot = self.category_slots.get(key, {}).get(value)
+                if slot is not None: row[0, slot] = 1.0
+            elif value is not None and key in self.slots:
+                row[0, self.slots[key]] = value
+        return row
+
+
+class FeatureLayout:
+    """Fixed column layout of a model trained on pd.get_dummies output.
+
+    Encodes a batch of records into one float matrix with the same result as
+    `pd.get_dummies(frame).reindex(columns=columns, fill_value=0)` applied per
+    record: numeric values go to the slot named after their key, a string value
+    sets the slot `<key>_<value>` to 1, and anything else (missing keys, nulls,
+    unknown or dropped categories) stays 0.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.slots = {column: i for i, column in enumerate(self.columns)}
+
+    def encode_frame(self, frame):
+        matrix = np.zeros((len(frame), len(self.columns)))
+        for key in frame.columns:
+            values = frame[key]
+            if not pd.api.types.is_numeric_dtype(values):
+                is_text = values.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+                if is_text.any():
+                    rows = np.flatnonzero(is_text)
+                    codes, categories = pd.factorize(values.to_numpy()[rows])
+                    category_slots = np.array([self.slots.get(f'{key}_{category}', -1) for category in categories])[codes]
+                    known = category_slots >= 0
+                    matrix[rows[known], category_slots[known]] = 1.0
+                values = pd.to_numeric(values.where(~is_text), errors='coerce')
+            if key in self.slots and values.dtype.kind in 'biuf':
+                # Missing values leave the slot alone, so they read as 0 like an absent key
+                values = values.to_numpy(dtype=float)
+                present = ~np.isnan(values)
+                matrix[present, self.slots[key]] = values[present]
+        return matrix
+
+
+def numeric_matrix(frame, features):
+    """(rows x features) float matrix of the given features, NaN where a value is missing or not numeric."""
+    matrix = np.full((len(frame), len(features)), np.nan)
+    for j, feature in enumerate(features):
+        if feature in frame.columns:
+            values = frame[feature]
+            if not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(values.where(values.map(lambda value: not isinstance(value, str))), errors='coerce')
+            matrix[:, j] = values.to_numpy(dtype=float)
+    return matrix
@@ -0,0 +1,92 @@
+import numpy as np
+
+
+class OnlineFeatureStats:
+    """Keeps breakdown_stats and the per-type anomaly detectors current as rentals are checked in.
+
+    Starts from the per-type running moments (count, mean, M2) that
+    ML/scripts/compute_feature_stats.py saves alongside those pickles, and folds
+    single rentals in or out with Chan's pairwise update, which for one row is
+    Welford's. After each change the 'mean'/'std' dicts the endpoints read are
+    swapped for new ones, with the global stats merged over all types, so
+    predict_breakdown() and detect_anomaly() see new rentals without a retrain.
+    Only types that already have a detector get their detector updated.
+    """
+
+    def __init__(self, features, groups, count, mean, m2, breakdown_stats=None, anomaly_detectors=None, scorer=None):
+        self.features = list(features)
+        self.groups = list(groups)
+        self.count, self.mean, self.m2 = (np.array(array, dtype=float) for array in (count, mean, m2))
+        self.breakdown_stats = breakdown_stats
+        self.anomaly_detectors = anomaly_detectors
+        self.scorer = scorer
+
+    @classmethod
+    def load(cls, path, **targets):
+        with np.load(path) as data:
+            return cls([str(f) for f in data['features']], [str(g) for g in data['groups']], data['count'], data['mean'], data['m2'], **targets)
+
+    def replace(self, old=None, new=None):
+        """Take a rental's previous values out (if given) and fold its current values in (if given)."""
+        changed = set()
+        for rental, sign in ((old, -1.0), (new, 1.0)):
+            if rental is None: continue
+            group = self._group(rental.get('Type') or '')
+            values = np.array([rental.get(feature) for feature in self.features], dtype=float)
+            present = ~np.isnan(values)
+            self._combine(group, np.where(present, sign, 0.0), np.where(present, values, 0.0))
+            changed.add(self.groups[group])
+        if changed: self._publish(changed)
+
+    def stats(self, group=None):
+        """{'mean': ..., 'std': ...} for one type, or over every rental when group is None."""
+        if group is None:
+            count, mean, m2 = self._total()
+        else:
+            i = self.groups.index(group)
+            count, mean, m2 = self.count[i], self.mean[i], self.m2[i]
+        std = np.sqrt(np.divide(m2, count - 1, out=np.full_like(count, np.nan), where=count > 1))
+        return {'mean': dict(zip(self.features, np.where(count > 0, mean, np.nan).tolist())), 'std': dict(zip(self.features, std.tolist()))}
+
+    def _combine(self, group, count, mean):
+        # Chan et al. with a one-row (M2 = 0) side whose count is +1 to add it or -1 to remove it
+        total = self.count[group] + count
+        weight = np.divide(count, total, out=np.zeros_like(total), where=total != 0)
+        delta = mean - self.mean[group]
+        m2 = self.m2[group] + delta ** 2 * self.count[group] * weight
+        mean = self.mean[group] + delta * weight
+        # An emptied feature starts again from zero; removals never leave a negative M2 from rounding
+        self.mean[group] = np.where(total > 0, mean, 0.0)
+        self.m2[group] = np.where(total > 1, np.maximum(m2, 0.0), 0.0)
+        self.count[group] = total
+
+    def _total(self):
+        count, mean, m2 = (np.zeros(len(self.features)) for _ in range(3))
+        for i in range(len(self.groups)):
+            total = count + self.count[i]
+            weight = np.divide(self.count[i], total, out=np.zeros_like(total), where=total > 0)
+            delta = self.mean[i] - mean
+            m2 = m2 + self.m2[i] + delta ** 2 * count * weight
+            mean = mean + delta * weight
+            count = total
+        return count, mean, m2
+
+    def _publish(self, groups):
+        # New dicts are swapped in whole, so a request never reads a mix of old and new values
+        if self.breakdown_stats is not None:
+            self._swap(self.breakdown_stats, self.stats())
+        for group in groups:
+            if self.anomaly_detectors is None or group not in self.anomaly_detectors: continue
+            self._swap(self.anomaly_detectors[group], self.stats(group))
+            if self.scorer is not None: self.scorer.update_type(group, self.anomaly_detectors[group])
+
+    @staticmethod
+    def _swap(target, stats):
+        for key in ('mean', 'std'):
+            target[key] = {feature: stats[key].get(feature, value) for feature, value in target[key].items()}
+
+    def _group(self, label):
+        if label not in self.groups:
+            self.groups.append(label)
+            self.count, self.mean, self.m2 = (np.vstack([array, np.zeros((1, len(self.features)))]) for array in (self.count, self.mean, self.m2))
+        return self.groups.index(label)
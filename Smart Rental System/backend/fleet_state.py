@@ -0,0 +1,91 @@
+from bisect import bisect_left, insort
+import pandas as pd
+
+
+# Columns of the last rental that the /asset_status response is built from
+LAST_RENTAL_COLUMNS = ['Equipment_ID', 'Type', 'Model', 'Equipment_Age_Years', 'GPS_Location', 'Customer_ID', 'CheckOut_Date', 'Planned_Return_Date', 'CheckIn_Date', 'Operating_Hours', 'Utilization_Rate', 'Breakdowns']
+
+
+def _day(date):
+    return pd.Timestamp(date).toordinal()
+
+
+class FleetState:
+    """In-memory fleet snapshot: one pre-formatted status record per Equipment_ID.
+
+    Built once from the rental history, then kept current with apply_rental()
+    and set_latest_date() so /asset_status never has to touch the full history.
+    The latest rentals are also kept sorted by check-in day, since moving the
+    reference date only changes the status of assets checked in between the
+    old and the new date.
+    """
+
+    def __init__(self, latest_date):
+        self.latest_date = latest_date
+        self._last_rentals = {}  # Equipment_ID -> raw fields of its latest rental
+        self._records = {}       # Equipment_ID -> formatted status record
+        self._snapshot = None    # cached list of records, sorted by Equipment_ID
+        self._by_checkin = []    # (check-in day, Equipment_ID) of every latest rental with a check-in date
+
+    @classmethod
+    def from_frame(cls, df, latest_date):
+        state = cls(latest_date)
+        # Stable sort so that, for equal CheckOut_Dates, the later row in the file wins; only the two key columns are sorted
+        latest = df[['Equipment_ID', 'CheckOut_Date']].sort_values('CheckOut_Date', kind='stable').drop_duplicates('Equipment_ID', keep='last')
+        for rental in df.loc[latest.index, LAST_RENTAL_COLUMNS].to_dict(orient='records'):
+            state._last_rentals[rental['Equipment_ID']] = rental
+            state._records[rental['Equipment_ID']] = state._format(rental)
+        # Sorted once here rather than inserted into one rental at a time
+        state._by_checkin = sorted((_day(rental['CheckIn_Date']), equipment_id) for equipment_id, rental in state._last_rentals.items() if not pd.isna(rental['CheckIn_Date']))
+        return state
+
+    def __len__(self):
+        return len(self._records)
+
+    def apply_rental(self, rental):
+        """Fold one rental (a mapping of column -> value) into the snapshot.
+
+        The rental replaces the stored one if it is at least as recent, which also
+        covers updates to the current rental (e.g. a check-in).
+        """
+        current = self._last_rentals.get(rental['Equipment_ID'])
+        if current is not None and rental['CheckOut_Date'] < current['CheckOut_Date']:
+            return False
+        self._store({column: rental[column] for column in LAST_RENTAL_COLUMNS})
+        return True
+
+    def set_latest_date(self, latest_date):
+        """Re-derive Active/Idle against a new reference date, for the assets checked in between it and the old one."""
+        if latest_date == self.latest_date:
+            return
+        first_day, last_day = sorted(_day(date) for date in (self.latest_date, latest_date))
+        self.latest_date = latest_date
+        # (day,) sorts before every (day, Equipment_ID): these span check-in days first_day + 1 .. last_day
+        changed = self._by_checkin[bisect_left(self._by_checkin, (first_day + 1,)):bisect_left(self._by_checkin, (last_day + 1,))]
+        for _, equipment_id in changed:
+            self._records[equipment_id] = self._format(self._last_rentals[equipment_id])
+        if changed: self._snapshot = None
+
+    def snapshot(self):
+        if self._snapshot is None:
+            self._snapshot = [self._records[equipment_id] for equipment_id in sorted(self._records)]
+        return self._snapshot
+
+    def _store(self, rental):
+        equipment_id = rental['Equipment_ID']
+        previous = self._last_rentals.get(equipment_id)
+        if previous is not None and not pd.isna(previous['CheckIn_Date']):
+            del self._by_checkin[bisect_left(self._by_checkin, (_day(previous['CheckIn_Date']), equipment_id))]
+        if not pd.isna(rental['CheckIn_Date']): insort(self._by_checkin, (_day(rental['CheckIn_Date']), equipment_id))
+        self._last_rentals[equipment_id] = rental
+        self._records[equipment_id] = self._format(rental)
+        self._snapshot = None
+
+    def _format(self, rental):
+        status = 'Idle'; customer_id = 'N/A'; planned_return = 'N/A'; last_returned_on = 'N/A'
+        # A rental checked out through /events/checkout has no CheckIn_Date until it is checked in
+        if pd.isna(rental['CheckIn_Date']) or self.latest_date < rental['CheckIn_Date']:
+            status = 'Active'; customer_id = rental['Customer_ID']; planned_return = rental['Planned_Return_Date'].strftime('%Y-%m-%d')
+        else:
+            last_returned_on = rental['CheckIn_Date'].strftime('%Y-%m-%d')
+        return {'Equipment_ID': rental['Equipment_ID'], 'Status': status, 'Type': rental['Type'], 'Model': rental['Model'], 'Equipment_Age_Years': rental['Equipment_Age_Years'], 'Last_Known_Location': rental['GPS_Location'], 'Current_Customer_ID': customer_id, 'Planned_Return_Date': planned_return, 'Last_Returned_On': last_returned_on, 'Last_Operating_Hours': rental['Operating_Hours'], 'Last_Utilization_Rate': f"{rental['Utilization_Rate']:.2%}", 'Breakdowns_on_Last_Rental': rental['Breakdowns']}
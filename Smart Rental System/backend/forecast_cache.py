@@ -0,0 +1,82 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+import joblib
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def forecast_records(model, periods):
+    """The next `periods` days of a Prophet model's forecast, formatted for the API."""
+    future = model.make_future_dataframe(periods=periods, include_history=False)
+    forecast = model.predict(future)[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
+    forecast['ds'] = forecast['ds'].dt.strftime('%Y-%m-%d')
+    return forecast.to_dict(orient='records')
+
+
+class ForecastCache:
+    """Demand forecasts per equipment type, computed when the model is loaded.
+
+    Requests up to `max_horizon` days are slices of the precomputed forecast;
+    longer horizons are computed once and kept in a bounded LRU. Every entry is
+    tied to the model pickle it came from: when the file's mtime changes and its
+    hash differs, the model is reloaded and its forecasts recomputed.
+    """
+
+    def __init__(self, max_horizon=90, max_entries=32):
+        self.max_horizon = max_horizon
+        self.max_entries = max_entries
+        self._models = {}           # equipment type -> {'path', 'mtime', 'digest', 'model', 'forecast'}
+        self._long = OrderedDict()  # (equipment type, digest, periods) -> records, least recently used first
+        self._lock = threading.Lock()
+
+    def __contains__(self, equipment_type):
+        return equipment_type in self._models
+
+    def add(self, equipment_type, path):
+        """Load the model at `path`, precompute its forecast and return the model."""
+        entry = self._load(path, os.stat(path).st_mtime_ns, file_digest(path))
+        with self._lock:
+            self._models[equipment_type] = entry
+        return entry['model']
+
+    def get(self, equipment_type, periods):
+        entry = self._current(equipment_type)
+        if periods <= self.max_horizon:
+            return entry['forecast'][:max(periods, 0)]
+        key = (equipment_type, entry['digest'], periods)
+        with self._lock:
+            if key in self._long:
+                self._long.move_to_end(key)
+                return self._long[key]
+        records = forecast_records(entry['model'], periods)
+        with self._lock:
+            self._long[key] = records
+            while len(self._long) > self.max_entries:
+                self._long.popitem(last=False)
+        return records
+
+    def _load(self, path, mtime, digest):
+        model = joblib.load(path)
+        return {'path': path, 'mtime': mtime, 'digest': digest, 'model': model, 'forecast': forecast_records(model, self.max_horizon)}
+
+    def _current(self, equipment_type):
+        entry = self._models[equipment_type]
+        mtime = os.stat(entry['path']).st_mtime_ns
+        if mtime == entry['mtime']:
+            return entry
+        digest = file_digest(entry['path'])
+        if digest == entry['digest']:
+            entry['mtime'] = mtime  # touched but unchanged
+            return entry
+        print(f"Demand forecaster for {equipment_type} changed on disk, reloading.")
+        entry = self._load(entry['path'], mtime, digest)
+        with self._lock:
+            self._models[equipment_type] = entry
+            for key in [key for key in self._long if key[0] == equipment_type]:
+                del self._long[key]
+        return entry
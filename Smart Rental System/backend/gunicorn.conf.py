@@ -0,0 +1,25 @@
+# Production serving: gunicorn -c gunicorn.conf.py app:app   (run from backend/, Linux/macOS)
+#
+# The app is imported once in the master, which loads every model and index (concurrently, see
+# ArtifactLoader), and the workers are forked from it afterwards, so they share those objects
+# copy-on-write instead of each loading its own. Rental events are appended to one shared event log
+# under a file lock, and every worker applies the others' events from it before answering a request.
+# Each worker keeps its own response cache and /metrics counters.
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+# More than one thread per worker switches gunicorn to its threaded worker; handlers already serialise on data_lock
+threads = int(os.environ.get('WORKER_THREADS', 1))
+preload_app = True
+# /asset_status and friends on a large history can take seconds the first time, before they are cached
+timeout = int(os.environ.get('WORKER_TIMEOUT', 120))
+accesslog = os.environ.get('ACCESS_LOG')
+
+
+def when_ready(server):
+    # Everything loaded so far is moved out of the collector's reach, so collections in the workers never
+    # write to (and so copy) the pages holding the preloaded models and indexes
+    gc.freeze()
@@ -0,0 +1,294 @@
+import json
+import math
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+try:
+    import fcntl
+except ImportError:  # Windows: the dev server runs a single process, which needs no lock
+    fcntl = None
+
+
+# Fields a telemetry event (or a check-in) may report for the asset's current rental
+TELEMETRY_COLUMNS = ['Operating_Hours', 'Idle_Hours', 'Fuel_Consumed_Liters', 'Distance_Traveled_km', 'Load_Cycles', 'Breakdowns', 'Engine_Temp_Max', 'Hydraulic_Pressure_Max', 'GPS_Location', 'Maintenance_Flag']
+# Asset attributes a checkout copies from the asset's previous rental unless given
+ASSET_COLUMNS = ['Type', 'Model', 'Manufacture_Year', 'GPS_Location', 'Maintenance_Flag']
+OVERDUE_FINE_PER_DAY_USD = 100
+# Event dates must fall between the first rental's checkout and this long after the current reference date
+MAX_DAYS_AHEAD = 366
+# Larger numbers are rejected rather than overflowing the int64 columns (and lose no precision as floats)
+MAX_NUMBER = 2 ** 53
+
+
+class RentalEventError(ValueError):
+    """An event that cannot be applied; `status` is the HTTP status to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class EventLog:
+    """Append-only NDJSON log of accepted rental events.
+
+    Events are written once they have been applied and replayed on startup,
+    so ingested events survive a restart. The log extends the CSV the backend
+    loads; start a new log whenever that CSV is regenerated. `offset` is how
+    far this process has read or written, so replay() only returns events
+    appended since, including those written by other workers sharing the log.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = None
+
+    def append(self, event, data):
+        """Write one event; callers replay() up to the end of the log first (under lock() when workers share it)."""
+        if self._file is None: self._file = open(self.path, 'ab')
+        line = (json.dumps({'event': event, 'logged_at': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'data': data}) + '\n').encode()
+        self._file.write(line)
+        self._file.flush()
+        self.offset += len(line)
+
+    def replay(self):
+        """Yield (event, data) for every complete line after `offset`, moving `offset` past each."""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) <= self.offset: return
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            for line in f:
+                if not line.endswith(b'\n'): return  # still being written; read again next time
+                self.offset += len(line)
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a line cut short by a crash mid-write
+                yield entry['event'], entry['data']
+
+    @contextmanager
+    def lock(self):
+        """Exclusive across the processes sharing the log (a no-op where fcntl is unavailable, i.e. a single process)."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.path + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def derive_rental_fields(rental):
+    """Recompute the columns preprocessing derives from the raw ones (see ML/notebooks/eda.ipynb)."""
+    derived = {'Planned_Duration_Days': (rental['Planned_Return_Date'] - rental['CheckOut_Date']).days,
+               'Equipment_Age_Years': rental['CheckOut_Date'].year - rental['Manufacture_Year'],
+               'Utilization_Rate': rental['Operating_Hours'] / (rental['Operating_Hours'] + rental['Idle_Hours'] + 1e-6),
+               'Fuel_Efficiency_L_per_hr': round(rental['Fuel_Consumed_Liters'] / rental['Operating_Hours'], 2) if rental['Operating_Hours'] else 0.0}
+    if pd.isna(rental['CheckIn_Date']):
+        derived.update(Rental_Duration_Days=0, Overdue_Days=0, Overdue_Fine_USD=0)
+    else:
+        derived['Rental_Duration_Days'] = (rental['CheckIn_Date'] - rental['CheckOut_Date']).days
+        derived['Overdue_Days'] = max(derived['Rental_Duration_Days'] - derived['Planned_Duration_Days'], 0)
+        derived['Overdue_Fine_USD'] = derived['Overdue_Days'] * OVERDUE_FINE_PER_DAY_USD
+    derived['Total_Bill_USD'] = rental['Rental_Cost_USD'] + derived['Overdue_Fine_USD']
+    return derived
+
+
+class LiveRentals:
+    """Applies checkout, check-in and telemetry events to the history and every index built from it.
+
+    Each event touches one rental: the table row and asset summary are updated
+    in place, the asset is re-ranked in the utilization index and the returns
+    index re-sorts its active rentals. Moving the reference date re-derives
+    Active/Idle for the fleet. A rental counts towards the feature stats (if
+    given) once it has a check-in date, as every row of the clean CSV does,
+    and towards the analytics cube (if given) from its checkout. `version`
+    counts the events applied, so anything derived from the data can tell it
+    is out of date. Callers serialise events and reads with a lock.
+
+    Every field is checked before anything changes, and event dates must lie
+    between `first_date` (the first rental's checkout) and MAX_DAYS_AHEAD
+    days past the reference date, so a rejected event leaves no trace and a
+    logged one always replays.
+    """
+
+    def __init__(self, asset_index, fleet_state, utilization_index, returns_index, latest_date, log=None, stats=None, cube=None, first_date=None):
+        self.asset_index = asset_index
+        self.table = asset_index.table
+        self.fleet_state = fleet_state
+        self.utilization_index = utilization_index
+        self.returns_index = returns_index
+        self.latest_date = latest_date
+        self.first_date = first_date if first_date is not None else latest_date
+        self.log = log
+        self.stats = stats
+        self.cube = cube
+        self.version = 0
+
+    def sync(self):
+        """Apply the events other processes appended to the log since this one last read it; returns how many."""
+        if self.log is None: return 0
+        log, self.log, applied = self.log, None, 0
+        try:
+            for event, data in log.replay():
+                try:
+                    self.apply(event, data); applied += 1
+                except Exception:
+                    pass  # rejected here as it was where it was logged, or an older log's bad event
+        finally:
+            self.log = log
+        return applied
+
+    def apply(self, event, data):
+        """Apply one event, then log it; returns the row position of the rental it created or changed."""
+        handlers = {'checkout': self.checkout, 'checkin': self.checkin, 'telemetry': self.telemetry}
+        if event not in handlers: raise RentalEventError(f"Unknown event type '{event}'.")
+        position = handlers[event](data)
+        self.version += 1
+        return position
+
+    def checkout(self, data):
+        equipment_id = self._equipment_id(data)
+        last = self._last_rental(equipment_id)
+        if last is not None and self._is_open(last[1]):
+            raise RentalEventError(f'{equipment_id} is already checked out to {last[1]["Customer_ID"]}.', status=409)
+        rental = {'Equipment_ID': equipment_id, 'CheckIn_Date': pd.NaT, 'Rental_Status': 'Active'}
+        for column in ASSET_COLUMNS:
+            value = data.get(column, last[1][column] if last is not None else None)
+            if value is None: raise RentalEventError(f'{column} is required for an asset with no rental history.')
+            if column != 'Manufacture_Year' and not isinstance(value, str): raise RentalEventError(f'{column} must be a string.')
+            rental[column] = value
+        if not data.get('Customer_ID'): raise RentalEventError('Customer_ID is required.')
+        rental['Customer_ID'] = str(data['Customer_ID'])
+        rental['CheckOut_Date'] = self._date(data.get('CheckOut_Date'), 'CheckOut_Date', default=self.latest_date)
+        # A rental dated before the asset's last one would sit behind it in the history and could never be checked in
+        if last is not None and rental['CheckOut_Date'] < max(last[1]['CheckOut_Date'], last[1]['CheckIn_Date']):
+            raise RentalEventError(f"CheckOut_Date is before the end of {equipment_id}'s last rental.", status=409)
+        if self.cube is not None and not self.cube.covers(rental['CheckOut_Date']):
+            first, last = self.cube.date_range()
+            raise RentalEventError(f"CheckOut_Date must be within {self.cube.max_extend_days} days of the analytics range, {first.strftime('%Y-%m-%d')} to {last.strftime('%Y-%m-%d')}.")
+        rental['Planned_Return_Date'] = self._date(data.get('Planned_Return_Date'), 'Planned_Return_Date')
+        if rental['Planned_Return_Date'] < rental['CheckOut_Date']: raise RentalEventError('Planned_Return_Date is before CheckOut_Date.')
+        rental['Rental_Cost_USD'] = self._number(data.get('Rental_Cost_USD', 0), 'Rental_Cost_USD', integer=True)
+        rental['Manufacture_Year'] = self._number(rental['Manufacture_Year'], 'Manufacture_Year', integer=True)
+        if rental['Manufacture_Year'] > rental['CheckOut_Date'].year: raise RentalEventError('Manufacture_Year is after CheckOut_Date.')
+        for column in TELEMETRY_COLUMNS:
+            if column not in rental: rental[column] = self._telemetry_value(column, data.get(column, 0))
+        rental.update(derive_rental_fields(rental))
+
+        self._advance(rental['CheckOut_Date'])
+        position = self.asset_index.add_rental(rental)
+        self._update_aggregates(None, self._refresh(equipment_id, position))
+        self._log('checkout', data, CheckOut_Date=rental['CheckOut_Date'])
+        return position
+
+    def checkin(self, data):
+        equipment_id = self._equipment_id(data)
+        last = self._last_rental(equipment_id)
+        if last is None: raise RentalEventError(f'No rental history for ID: {equipment_id}', status=404)
+        if not self._is_open(last[1]): raise RentalEventError(f'{equipment_id} is not checked out.', status=409)
+        position, rental = last
+        before = dict(rental)
+        rental['CheckIn_Date'] = self._date(data.get('CheckIn_Date'), 'CheckIn_Date', default=self.latest_date)
+        if rental['CheckIn_Date'] < rental['CheckOut_Date']: raise RentalEventError('CheckIn_Date is before CheckOut_Date.')
+        changes = self._telemetry_changes(data)
+        rental.update(changes)
+        changes.update(derive_rental_fields(rental), CheckIn_Date=rental['CheckIn_Date'])
+        changes['Rental_Status'] = 'Overdue' if changes['Overdue_Days'] > 0 else 'Closed'
+
+        self._advance(rental['CheckIn_Date'])
+        self.asset_index.update_rental(position, changes)
+        self._update_aggregates(before, self._refresh(equipment_id, position))
+        self._log('checkin', data, CheckIn_Date=rental['CheckIn_Date'])
+        return position
+
+    def telemetry(self, data):
+        """Update the readings of the asset's latest rental; the values replace, not add to, the stored ones."""
+        equipment_id = self._equipment_id(data)
+        last = self._last_rental(equipment_id)
+        if last is None: raise RentalEventError(f'No rental history for ID: {equipment_id}', status=404)
+        position, rental = last
+        changes = self._telemetry_changes(data)
+        if not changes: raise RentalEventError(f'No telemetry fields given. Expected any of: {", ".join(TELEMETRY_COLUMNS)}.')
+        before = dict(rental)
+        rental.update(changes)
+        derived = derive_rental_fields(rental)
+        changes.update({column: derived[column] for column in ['Utilization_Rate', 'Fuel_Efficiency_L_per_hr']})
+
+        self.asset_index.update_rental(position, changes)
+        self._update_aggregates(before, self._refresh(equipment_id, position))
+        self._log('telemetry', data)
+        return position
+
+    def _refresh(self, equipment_id, position):
+        rental = self.table.row(position)
+        self.fleet_state.apply_rental(rental)
+        self.returns_index.set_rental(rental)
+        positions = self.asset_index.positions(equipment_id)
+        self.utilization_index.update_asset(equipment_id, float(np.nanmean(self.table.take('Utilization_Rate', positions))), len(positions), rental['Type'], rental['Model'], rental['GPS_Location'])
+        return rental
+
+    def _update_aggregates(self, before, after):
+        if self.stats is not None:
+            self.stats.replace(*(rental if rental is not None and not pd.isna(rental['CheckIn_Date']) else None for rental in (before, after)))
+        if self.cube is not None:
+            self.cube.replace(before, after)
+
+    def _advance(self, date):
+        if date <= self.latest_date: return
+        self.latest_date = date
+        self.fleet_state.set_latest_date(date)
+        self.returns_index.set_latest_date(date)
+
+    def _log(self, event, data, **resolved):
+        # Defaults resolved against the current state are written out, so a replay gives the same result
+        if self.log is not None:
+            self.log.append(event, dict(data, **{key: value.strftime('%Y-%m-%d') for key, value in resolved.items()}))
+
+    def _is_open(self, rental):
+        return pd.isna(rental['CheckIn_Date']) or rental['CheckIn_Date'] > self.latest_date
+
+    def _last_rental(self, equipment_id):
+        if equipment_id not in self.asset_index: return None
+        position = int(self.asset_index.positions(equipment_id)[-1])
+        return position, self.table.row(position)
+
+    def _telemetry_changes(self, data):
+        return {column: self._telemetry_value(column, data[column]) for column in TELEMETRY_COLUMNS if column in data}
+
+    def _telemetry_value(self, column, value):
+        if column in ('GPS_Location', 'Maintenance_Flag'):
+            if not isinstance(value, str): raise RentalEventError(f'{column} must be a string.')
+            return value
+        return self._number(value, column, integer=column != 'Fuel_Consumed_Liters')
+
+    @staticmethod
+    def _equipment_id(data):
+        if not isinstance(data, dict) or not isinstance(data.get('Equipment_ID'), str) or not data['Equipment_ID']:
+            raise RentalEventError('Equipment_ID is required.')
+        return data['Equipment_ID']
+
+    @staticmethod
+    def _number(value, column, integer=False):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or (isinstance(value, float) and not math.isfinite(value)) or value < 0:
+            raise RentalEventError(f'{column} must be a non-negative number.')
+        if value > MAX_NUMBER: raise RentalEventError(f'{column} must be at most {MAX_NUMBER}.')
+        if integer and value != int(value): raise RentalEventError(f'{column} must be a whole number.')
+        return int(value) if integer else float(value)
+
+    def _date(self, value, column, default=None):
+        if value is None:
+            if default is None: raise RentalEventError(f'{column} is required.')
+            return default
+        try:
+            date = pd.Timestamp(value).normalize()
+        except (ValueError, TypeError):
+            raise RentalEventError(f'{column} must be a YYYY-MM-DD date.')
+        first, last = self.first_date.normalize(), self.latest_date.normalize() + pd.Timedelta(days=MAX_DAYS_AHEAD)
+        if pd.isna(date) or not first <= date <= last:
+            raise RentalEventError(f"{column} must be between {first.strftime('%Y-%m-%d')} and {last.strftime('%Y-%m-%d')}.")
+        return date.as_unit('ns')
@@ -0,0 +1,127 @@
+import numpy as np
+from feature_encoding import array_inputs
+
+# The rental terms /optimize_price varies, in the order the price surface is laid out
+GRID_AXES = ['Planned_Duration_Days', 'Rental_Duration_Days', 'GPS_Location', 'Maintenance_Flag']
+DURATION_AXES = GRID_AXES[:2]
+CATEGORY_AXES = GRID_AXES[2:]
+DEFAULT_DURATIONS = list(range(1, 31))
+# objective -> (per-day rate or total price, highest first)
+OBJECTIVES = {'max_price_per_day': ('price_per_day', True), 'min_price_per_day': ('price_per_day', False),
+              'max_price': ('price', True), 'min_price': ('price', False)}
+
+
+class PriceOptimizer:
+    """Prices every combination of rental terms for one equipment profile with a single model call.
+
+    The candidate grid is the product of the planned and actual rental
+    durations, the sites and the maintenance flag; Overdue_Days follows from
+    the two durations as it does in the data (days kept past the planned
+    return). Candidates are encoded from the profile's row against the price
+    model's columns and scored in one predict call. With the compiled engine
+    loaded, candidates whose durations fall between the same pair of the
+    model's split points are told apart from nothing, so only one of each is
+    scored and the rest share its price (exactly the same value).
+    """
+
+    def __init__(self, model, encoder, schema, engine=None, max_candidates=100_000):
+        self.model, self.encoder = model, encoder
+        self.max_candidates = max_candidates
+        self.categories = {axis: list(schema['categorical_columns'].get(axis, {})) for axis in CATEGORY_AXES}
+        self.float32_inputs = engine is not None and engine.float32_inputs
+        self._split_points = {column: engine.split_points(slot) for column, slot in encoder.slots.items()} if engine is not None else None
+
+    def grid(self, options=None):
+        """Axis values from the request's `grid` object, checked; an axis left out spans its default range.
+
+        A duration axis is a list of whole days, one value, or {"min", "max", "step"};
+        a category axis is a list of known values or one value.
+        """
+        options = options or {}
+        unknown = sorted(set(options) - set(GRID_AXES))
+        if unknown: raise ValueError(f"Unknown grid axes: {', '.join(unknown)}; expected some of {', '.join(GRID_AXES)}")
+        axes = {}
+        for axis in DURATION_AXES:
+            values = options.get(axis, DEFAULT_DURATIONS)
+            if isinstance(values, dict): values = self._day_range(axis, values)
+            elif not isinstance(values, (list, range)): values = [values]
+            if len(values) > self.max_candidates: raise ValueError(f"{axis} has {len(values):,} values; at most {self.max_candidates:,} are allowed")
+            values = np.array(values, dtype=float)
+            if values.size == 0 or not np.all((values >= 1) & (values == np.round(values))):
+                raise ValueError(f"{axis} needs one or more whole numbers of days, each at least 1")
+            axes[axis] = values.astype(np.int64)
+        for axis in CATEGORY_AXES:
+            values = options.get(axis, self.categories[axis])
+            values = values if isinstance(values, list) else [values]
+            invalid = [value for value in values if value not in self.categories[axis]]
+            if not values or invalid: raise ValueError(f"Invalid {axis}: {invalid or 'none given'}; expected some of {', '.join(self.categories[axis])}")
+            axes[axis] = values
+        candidates = int(np.prod([len(axes[axis]) for axis in GRID_AXES]))
+        if candidates > self.max_candidates: raise ValueError(f"The grid has {candidates:,} candidates; at most {self.max_candidates:,} are allowed")
+        return axes
+
+    def _day_range(self, axis, spec):
+        """The range a {"min", "max", "step"} duration axis spans; min and step default to 1."""
+        if 'max' not in spec: raise ValueError(f'{axis} needs a "max" when given as {{"min", "max", "step"}}')
+        try:
+            start, stop, step = int(spec.get('min', 1)), int(spec['max']), int(spec.get('step', 1))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f'{axis} "min", "max" and "step" must be whole numbers of days')
+        if step < 1: raise ValueError(f'{axis} "step" must be at least 1')
+        # Counted rather than taken from len(), which overflows on a huge range
+        count = max((stop - start) // step + 1, 0)
+        if count > self.max_candidates: raise ValueError(f"{axis} has {count:,} values; at most {self.max_candidates:,} are allowed")
+        return range(start, stop + 1, step)
+
+    def score(self, profile, axes):
+        """Predicted price of every candidate, shaped (planned, rental, sites, flags), and how many rows the model scored."""
+        shape = tuple(len(axes[axis]) for axis in GRID_AXES)
+        planned_index, rental_index, site_index, flag_index = (index.ravel() for index in np.indices(shape))
+        planned, rental = axes['Planned_Duration_Days'][planned_index], axes['Rental_Duration_Days'][rental_index]
+        durations = {'Planned_Duration_Days': planned, 'Rental_Duration_Days': rental, 'Overdue_Days': np.maximum(rental - planned, 0)}
+        # One key per group of candidates the model cannot tell apart; only the first of each group is encoded and scored
+        key = np.zeros(len(planned), dtype=np.int64)
+        for part in [site_index, flag_index] + [self._bins(column, values) for column, values in durations.items()]:
+            key = key * (int(part.max()) + 1) + part
+        _, first, group = np.unique(key, return_index=True, return_inverse=True)
+        rows = np.repeat(self.encoder.encode(profile), len(first), axis=0)
+        for column, values in durations.items():
+            if column in self.encoder.slots: rows[:, self.encoder.slots[column]] = values[first]
+        for axis, index in (('GPS_Location', site_index), ('Maintenance_Flag', flag_index)):
+            category_slots = self.encoder.category_slots.get(axis, {})
+            rows[:, list(category_slots.values())] = 0.0
+            slots = np.array([category_slots.get(value, -1) for value in axes[axis]])[index[first]]
+            has_slot = slots >= 0  # the category get_dummies dropped is all zeros
+            rows[np.flatnonzero(has_slot), slots[has_slot]] = 1.0
+        with array_inputs():
+            prices = self.model.predict(rows)
+        return prices[group.ravel()].reshape(shape), len(first)
+
+    def _bins(self, column, values):
+        """Which interval between the model's split points on `column` each value falls in; the values' ranks without an engine."""
+        if column not in self.encoder.slots: return np.zeros(len(values), dtype=np.int64)
+        if self._split_points is None: return np.unique(values, return_inverse=True)[1].ravel()
+        if self.float32_inputs: values = values.astype(np.float32)
+        return np.searchsorted(self._split_points[column], values.astype(np.float64))
+
+    def summarize(self, axes, prices, objective='max_price_per_day', top=10, surface=True):
+        """The response body: the grid, the price and per-day rate surfaces, and the `top` best candidates for `objective`."""
+        if objective not in OBJECTIVES: raise ValueError(f"Invalid objective: {objective}; expected one of {', '.join(OBJECTIVES)}")
+        # The rate is over the days the asset was actually out, which is what the price covers
+        per_day = prices / axes['Rental_Duration_Days'][None, :, None, None]
+        measure, highest_first = OBJECTIVES[objective]
+        ranked = (per_day if measure == 'price_per_day' else prices).ravel()
+        order = np.argsort(-ranked if highest_first else ranked, kind='stable')[:max(int(top), 0)]
+        best = []
+        for planned_i, rental_i, site_i, flag_i in zip(*(index.tolist() for index in np.unravel_index(order, prices.shape))):
+            planned, rental = int(axes['Planned_Duration_Days'][planned_i]), int(axes['Rental_Duration_Days'][rental_i])
+            best.append({'Planned_Duration_Days': planned, 'Rental_Duration_Days': rental, 'Overdue_Days': max(rental - planned, 0),
+                         'GPS_Location': axes['GPS_Location'][site_i], 'Maintenance_Flag': axes['Maintenance_Flag'][flag_i],
+                         'predicted_price_usd': round(float(prices[planned_i, rental_i, site_i, flag_i]), 2),
+                         'price_per_day_usd': round(float(per_day[planned_i, rental_i, site_i, flag_i]), 2)})
+        result = {'candidates': int(prices.size), 'axes': GRID_AXES, 'grid': {axis: np.asarray(axes[axis]).tolist() for axis in GRID_AXES},
+                  'objective': objective, 'best': best}
+        if surface:
+            result['price_surface'] = np.round(prices, 2).tolist()
+            result['price_per_day_surface'] = np.round(per_day, 2).tolist()
+        return result
@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+
+
+class RentalTable:
+    """The rental history as column arrays, one row per rental.
+
+    The rows loaded at startup stay in the frame's own arrays, which may be
+    read-only memory maps (see columnar_store.py); a column is copied only the
+    first time one of its loaded rows is updated. Categorical columns are kept
+    as their codes plus a lookup array of values, so a text value is only
+    materialised for the rows taken. Rentals added later go to a
+    separate tail whose capacity doubles when full, so appending is amortised
+    O(1). frame() returns the current rows as a DataFrame, rebuilt only after a
+    change.
+    """
+
+    def __init__(self, df):
+        self.columns = list(df.columns)
+        self._base, self._categories, self._category_codes = {}, {}, {}
+        for column in self.columns:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                self._base[column] = values.array.codes
+                # Code -1, a missing value, picks the trailing NaN; new values are inserted before it
+                self._categories[column] = np.append(values.cat.categories.to_numpy(dtype=object), np.nan)
+                self._category_codes[column] = {value: code for code, value in enumerate(self._categories[column][:-1].tolist())}
+            else:
+                self._base[column] = values.to_numpy()
+        self._base_size = len(df)
+        self._owned = set()  # base columns already copied, safe to write in place
+        # Rentals added later hold plain values, also for categorical columns
+        self._tail = {column: np.empty(0, dtype=object) if column in self._categories else array[:0].copy() for column, array in self._base.items()}
+        self._tail_size = 0
+        self._frame = None
+
+    def __len__(self):
+        return self._base_size + self._tail_size
+
+    def take(self, column, positions):
+        """Values of one column at the given row positions."""
+        return self.take_columns(positions, [column])[column]
+
+    def take_columns(self, positions, columns=None):
+        """{column: values at the given row positions} for `columns` (default: all)."""
+        positions = np.asarray(positions, dtype=np.intp)
+        columns = self.columns if columns is None else columns
+        if len(positions) == 0 or positions.max() < self._base_size:
+            return {column: self._take_base(column, positions) for column in columns}
+        in_base = positions < self._base_size
+        base_positions, tail_positions = positions[in_base], positions[~in_base] - self._base_size
+        taken = {}
+        for column in columns:
+            values = taken[column] = np.empty(len(positions), dtype=self._tail[column].dtype)
+            values[in_base] = self._take_base(column, base_positions)
+            values[~in_base] = self._tail[column][tail_positions]
+        return taken
+
+    def _take_base(self, column, positions):
+        values = self._base[column][positions]
+        return self._categories[column][values] if column in self._categories else values
+
+    def row(self, position):
+        """One rental as a column -> value dict, with dates as pd.Timestamp (NaT when unset)."""
+        arrays, index = (self._base, position) if position < self._base_size else (self._tail, position - self._base_size)
+        row = {}
+        for column, array in arrays.items():
+            value = array[index]
+            if arrays is self._base and column in self._categories: value = self._categories[column][value]
+            row[column] = pd.Timestamp(value) if array.dtype.kind == 'M' else (value.item() if isinstance(value, np.generic) else value)
+        return row
+
+    def append(self, record):
+        """Add a rental and return its row position. Columns missing from `record` get an empty value."""
+        if self._tail_size == len(next(iter(self._tail.values()))):
+            self._grow()
+        for column, array in self._tail.items():
+            array[self._tail_size] = self._coerce(array, record[column]) if column in record else self._empty(array)
+        self._tail_size += 1
+        self._frame = None
+        return len(self) - 1
+
+    def update(self, position, values):
+        if position < self._base_size:
+            arrays, index = self._base, position
+            for column in values:
+                if column not in self._owned:
+                    # Copy on first write: never modify the caller's frame or a read-only memory map. Codes are
+                    # widened, since a new value may need a code the narrow on-disk type cannot hold
+                    self._base[column] = np.array(self._base[column], dtype=np.int32 if column in self._categories else None)
+                    self._owned.add(column)
+        else:
+            arrays, index = self._tail, position - self._base_size
+        for column, value in values.items():
+            if arrays is self._base and column in self._categories:
+                arrays[column][index] = self._code(column, value)
+            else:
+                arrays[column][index] = self._coerce(arrays[column], value)
+        self._frame = None
+
+    def frame(self):
+        if self._frame is None:
+            base_rows = np.arange(self._base_size)
+            self._frame = pd.DataFrame({column: np.concatenate([self._take_base(column, base_rows), self._tail[column][:self._tail_size]]) for column in self.columns})
+        return self._frame
+
+    def _code(self, column, value):
+        if pd.isna(value): return -1
+        codes = self._category_codes[column]
+        if value not in codes:
+            codes[value] = len(codes)
+            self._categories[column] = np.insert(self._categories[column], len(codes) - 1, value)
+        return codes[value]
+
+    def _grow(self):
+        capacity = max(2 * self._tail_size, 1024)
+        for column, array in self._tail.items():
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[:self._tail_size] = array[:self._tail_size]
+            self._tail[column] = grown
+
+    @staticmethod
+    def _coerce(array, value):
+        # NumPy date arrays take datetime64 values, not pd.NaT
+        if array.dtype.kind == 'M': return np.datetime64('NaT') if pd.isna(value) else pd.Timestamp(value).to_datetime64()
+        return value
+
+    @staticmethod
+    def _empty(array):
+        kind = array.dtype.kind
+        if kind == 'M': return np.datetime64('NaT')
+        if kind == 'f': return np.nan
+        if kind in 'biu': return 0
+        return None
@@ -0,0 +1,134 @@
+import bisect
+import cProfile
+import math
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+
+# Histogram bucket upper bounds in seconds: Prometheus' defaults, extended down to 100us for the in-handler spans
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Latency histogram per label set, rendered in the Prometheus text format.
+
+    observe() is one bisect and three additions under a lock; the cumulative
+    bucket counts Prometheus expects are only summed up in render().
+    """
+
+    def __init__(self, name, description, label_names, buckets=LATENCY_BUCKETS):
+        self.name, self.description = name, description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [count per bucket (last is +Inf), sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, labels, seconds):
+        bucket = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None: series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bucket] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def render(self):
+        with self._lock:
+            series = sorted((labels, (list(counts), total, count)) for labels, (counts, total, count) in self._series.items())
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} histogram']
+        for labels, (counts, total, count) in series:
+            label_text = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == math.inf else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label_text},le="{le}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {total!r}')
+            lines.append(f'{self.name}_count{{{label_text}}} {count}')
+        return lines
+
+
+class _Span:
+    # A plain class rather than @contextmanager: no generator to create and resume on every span
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics, name):
+        self.metrics, self.name = metrics, name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        metrics = self.metrics
+        metrics.spans.observe((getattr(metrics._local, 'route', ''), self.name), time.perf_counter() - self.start)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class RequestMetrics:
+    """Per-route request latency, named spans inside the handlers, and sampled cProfile dumps.
+
+    The app calls start_request()/finish_request() around every request and
+    wraps hot steps in `with metrics.span('encode'):`; spans are labelled with
+    the route of the request running on the same thread. When
+    profile_sample_rate is above zero, that fraction of requests also runs
+    under cProfile and the stats are written to profile_dir as .prof files
+    (read them with pstats or snakeviz). One request is profiled at a time;
+    requests sampled while another is being profiled just run normally.
+    """
+
+    def __init__(self, profile_sample_rate=0.0, profile_dir='profiles'):
+        self.requests = Histogram('rental_api_request_duration_seconds', 'Time to handle a request, by route, method and status.', ('route', 'method', 'status'))
+        self.spans = Histogram('rental_api_span_duration_seconds', 'Time spent in a named step of a request handler.', ('route', 'span'))
+        self.profile_sample_rate = profile_sample_rate
+        self.profile_dir = profile_dir
+        self.profiles_written = 0
+        self._local = threading.local()
+        self._profiling = threading.Lock()
+
+    def start_request(self, route):
+        local = self._local
+        local.route, local.profiler = route, None
+        if self.profile_sample_rate > 0 and random.random() < self.profile_sample_rate and self._profiling.acquire(blocking=False):
+            local.profiler = cProfile.Profile()
+            local.profiler.enable()
+        local.start = time.perf_counter()
+
+    def finish_request(self, method, status):
+        """Record the request started on this thread; a second call for the same request does nothing."""
+        local = self._local
+        if getattr(local, 'start', None) is None: return None
+        elapsed = time.perf_counter() - local.start
+        local.start = None
+        self.requests.observe((local.route, method, str(status)), elapsed)
+        if local.profiler is not None:
+            local.profiler.disable()
+            try:
+                self._dump_profile(local.profiler, local.route, elapsed)
+            finally:
+                local.profiler = None
+                self._profiling.release()
+        return elapsed
+
+    def span(self, name):
+        """Context manager timing the block it wraps as `name`, under the current request's route."""
+        return _Span(self, name)
+
+    def render(self):
+        """Everything recorded so far, in the Prometheus text exposition format."""
+        lines = self.requests.render() + self.spans.render()
+        lines += ['# HELP rental_api_profiles_written_total Sampled requests whose cProfile stats were written.',
+                  '# TYPE rental_api_profiles_written_total counter', f'rental_api_profiles_written_total {self.profiles_written}']
+        return '\n'.join(lines) + '\n'
+
+    def _dump_profile(self, profiler, route, elapsed):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', route).strip('_') or 'root'
+        path = os.path.join(self.profile_dir, f"{datetime.now():%Y%m%dT%H%M%S%f}_{slug}_{elapsed * 1000:.1f}ms.prof")
+        profiler.dump_stats(path)
+        self.profiles_written += 1
@@ -0,0 +1,66 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class CachedResponse:
+    """An encoded response body and its ETag, valid for one dataset version."""
+    __slots__ = ('version', 'body', 'etag')
+
+    def __init__(self, version, body):
+        self.version, self.body = version, body
+        # From the bytes themselves, so every worker and every restart serving the same data agrees on it
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """Encoded JSON bodies of the read endpoints, keyed on route and normalized query, bounded by total size.
+
+    Each entry records the dataset version it was computed at; a lookup at any
+    other version is a miss and drops the entry, so bumping the version (on
+    every applied rental event) invalidates everything at once without a sweep.
+    Least recently used entries are evicted once the bodies held exceed
+    `max_bytes`; a body larger than that on its own is not kept at all.
+    """
+
+    def __init__(self, max_bytes=64 * 2**20):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits, self.misses, self.evictions = 0, 0, 0
+        self._entries = OrderedDict()  # key -> CachedResponse, least recently used first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(path, args):
+        """Cache key for a request path and its query (a Werkzeug MultiDict); parameter order and empty values do not matter."""
+        return path, tuple(sorted((name, value) for name, value in args.items(multi=True) if value != ''))
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if entry is not None: self._discard(key)
+            self.misses += 1
+            return None
+
+    def put(self, key, version, body):
+        """Store `body` for `key` as computed at `version`, and return the entry (stored or not)."""
+        entry = CachedResponse(version, body)
+        if len(body) > self.max_bytes: return entry
+        with self._lock:
+            if key in self._entries: self._discard(key)
+            self._entries[key] = entry
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+        return entry
+
+    def _discard(self, key):
+        self.size -= len(self._entries.pop(key).body)
@@ -0,0 +1,111 @@
+from bisect import bisect_left, insort
+import pandas as pd
+
+
+RETURN_COLUMNS = ['Equipment_ID', 'Type', 'Model', 'Customer_ID', 'GPS_Location', 'Planned_Return_Date']
+
+
+def _day(date):
+    return pd.Timestamp(date).toordinal()
+
+
+class ReturnsIndex:
+    """Active rentals (no CheckIn_Date yet, or one after the reference date) sorted by Planned_Return_Date.
+
+    The same ordering is kept per customer and per site, so "due within N days"
+    and "already overdue" are both range slices for the whole fleet, one
+    customer or one site. Each ordering is a sorted list of (planned day,
+    sequence, rental key), where the sequence is the order a rental was first
+    seen in and breaks ties. set_rental() moves one rental within the three
+    lists it sits in, and set_latest_date() drops the rentals checked in by the
+    new date from a list sorted by check-in date, so an event never re-sorts
+    the active rentals.
+    """
+
+    def __init__(self, df, latest_date):
+        self.latest_date = latest_date
+        self._entries = {}      # (Equipment_ID, CheckOut_Date) -> (sort key, check-in sort key or None, formatted record)
+        self._all = []          # sort keys of every active rental
+        self._by_customer = {}  # Customer_ID -> sort keys of its active rentals
+        self._by_site = {}      # GPS_Location -> sort keys of its active rentals
+        self._by_checkin = []   # (check-in day, sequence, rental key) of the active rentals already given a check-in date
+        self._sequence = 0
+        checkin_dates = df['CheckIn_Date']
+        active = df.loc[checkin_dates.isna() | (checkin_dates > latest_date), RETURN_COLUMNS + ['CheckOut_Date', 'CheckIn_Date']]
+        for rental in active.to_dict(orient='records'):
+            self._add((rental['Equipment_ID'], rental['CheckOut_Date']), rental, insert=False)
+        # Built unsorted and sorted once, rather than inserted into one rental at a time
+        for keys in [self._all, self._by_checkin, *self._by_customer.values(), *self._by_site.values()]:
+            keys.sort()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _is_active(self, checkin_date):
+        return pd.isna(checkin_date) or checkin_date > self.latest_date
+
+    def _add(self, key, rental, sequence=None, insert=True):
+        if sequence is None:
+            sequence, self._sequence = self._sequence, self._sequence + 1
+        record = dict({column: rental[column] for column in RETURN_COLUMNS}, Planned_Return_Date=rental['Planned_Return_Date'].strftime('%Y-%m-%d'))
+        sort_key = (_day(rental['Planned_Return_Date']), sequence, key)
+        checkin_key = None if pd.isna(rental['CheckIn_Date']) else (_day(rental['CheckIn_Date']), sequence, key)
+        self._entries[key] = (sort_key, checkin_key, record)
+        add = insort if insert else list.append
+        add(self._all, sort_key)
+        add(self._by_customer.setdefault(record['Customer_ID'], []), sort_key)
+        add(self._by_site.setdefault(record['GPS_Location'], []), sort_key)
+        if checkin_key is not None: add(self._by_checkin, checkin_key)
+
+    def _remove(self, key):
+        sort_key, checkin_key, record = self._entries.pop(key)
+        for keys in (self._all, self._by_customer[record['Customer_ID']], self._by_site[record['GPS_Location']]):
+            del keys[bisect_left(keys, sort_key)]
+        if not self._by_customer[record['Customer_ID']]: del self._by_customer[record['Customer_ID']]
+        if not self._by_site[record['GPS_Location']]: del self._by_site[record['GPS_Location']]
+        if checkin_key is not None: del self._by_checkin[bisect_left(self._by_checkin, checkin_key)]
+        return sort_key[1]
+
+    def set_rental(self, rental):
+        """Add, update or drop one rental (a mapping with at least RETURN_COLUMNS and the checkout/check-in dates)."""
+        key = (rental['Equipment_ID'], rental['CheckOut_Date'])
+        if key not in self._entries:
+            if self._is_active(rental['CheckIn_Date']): self._add(key, rental)
+            return
+        sequence = self._remove(key)
+        # An updated rental keeps its place among rentals due the same day
+        if self._is_active(rental['CheckIn_Date']): self._add(key, rental, sequence)
+
+    def set_latest_date(self, latest_date):
+        """Move the reference date; rentals checked in on or before it stop being active."""
+        self.latest_date = latest_date
+        last_day = _day(latest_date)
+        while self._by_checkin and self._by_checkin[0][0] <= last_day:
+            self._remove(self._by_checkin[0][2])
+
+    def query(self, days_out, customer=None, site=None):
+        """Return (due_soon, overdue) record lists for the optional customer/site.
+
+        due_soon covers Planned_Return_Date in [latest_date, latest_date + days_out];
+        overdue is every active rental whose planned return is already past.
+        """
+        if customer is not None:
+            keys = self._by_customer.get(customer, [])
+        elif site is not None:
+            keys = self._by_site.get(site, [])
+        else:
+            keys = self._all
+        start = _day(self.latest_date)
+        # (day,) sorts before every (day, sequence, key), so these find the first rental due on that day
+        lo = bisect_left(keys, (start,))
+        hi = max(bisect_left(keys, (start + days_out + 1,)), lo)
+
+        def selected(begin, end):
+            records = ((sort_key[0], self._entries[sort_key[2]][2]) for sort_key in keys[begin:end])
+            if customer is not None and site is not None:
+                records = ((day, record) for day, record in records if record['GPS_Location'] == site)
+            return records
+
+        due_soon = [record for _, record in selected(lo, hi)]
+        overdue = [dict(record, Days_Overdue=start - day) for day, record in selected(0, lo)]
+        return due_soon, overdue
@@ -0,0 +1,76 @@
+# Streams telemetry through the per-type anomaly detectors and writes the anomalies as NDJSON.
+# Run from backend/:  python score_anomalies.py telemetry.csv [--output anomalies.ndjson] [--all]
+# Input is CSV (by extension) or NDJSON; '-' reads NDJSON from stdin.
+import argparse
+import json
+import os
+import sys
+import time
+import joblib
+import pandas as pd
+from anomaly_scoring import AnomalyScorer
+
+EQUIPMENT_TYPES = ['Bulldozer', 'Crane', 'DumpTruck', 'Excavator', 'Loader']
+ANOMALY_FEATURES = ['Operating_Hours','Idle_Hours','Fuel_Consumed_Liters','Fuel_Efficiency_L_per_hr','Load_Cycles','Utilization_Rate']
+
+
+def load_scorer(models_dir, threshold):
+    detectors = {}
+    for equipment in EQUIPMENT_TYPES:
+        path = os.path.join(models_dir, f'anomaly_detector_{equipment}.pkl')
+        if os.path.exists(path): detectors[equipment] = joblib.load(path)
+        else: print(f"No anomaly detector for {equipment} at {path}, its rows will be reported as unknown.", file=sys.stderr)
+    return AnomalyScorer(detectors, ANOMALY_FEATURES, threshold=threshold)
+
+
+def iter_chunks(path, chunk_rows):
+    if path != '-' and path.lower().endswith('.csv'):
+        wanted = set(ANOMALY_FEATURES) | {'Equipment_ID', 'Type'}
+        yield from pd.read_csv(path, usecols=lambda column: column in wanted, dtype={'Equipment_ID': str, 'Type': str}, chunksize=chunk_rows)
+        return
+    stream = sys.stdin if path == '-' else open(path)
+    try:
+        records = []
+        for line in stream:
+            if line.strip(): records.append(json.loads(line))
+            if len(records) == chunk_rows:
+                yield pd.DataFrame(records); records = []
+        if records: yield pd.DataFrame(records)
+    finally:
+        if stream is not sys.stdin: stream.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score telemetry for per-type z-score anomalies.')
+    parser.add_argument('input', help="CSV or NDJSON telemetry file, or '-' for NDJSON on stdin")
+    parser.add_argument('--output', default='-', help='NDJSON output file (default: stdout)')
+    parser.add_argument('--models-dir', default=os.path.join('..', 'ml', 'models'))
+    parser.add_argument('--threshold', type=float, default=3.0, help='|z| above this is anomalous (default: 3.0)')
+    parser.add_argument('--chunk-rows', type=int, default=100000)
+    parser.add_argument('--all', action='store_true', help='write every row, not only anomalous and unknown-type rows')
+    args = parser.parse_args()
+
+    scorer = load_scorer(args.models_dir, args.threshold)
+    out = sys.stdout if args.output == '-' else open(args.output, 'w')
+    start, rows, anomalies, unknown = time.perf_counter(), 0, 0, 0
+    try:
+        for frame in iter_chunks(args.input, args.chunk_rows):
+            codes, z_scores, anomalous = scorer.score_frame(frame)
+            flagged = anomalous.any(axis=1)
+            anomalies += int(flagged.sum()); unknown += int((codes < 0).sum())
+            equipment_ids = frame['Equipment_ID'].tolist() if 'Equipment_ID' in frame.columns else [None] * len(frame)
+            # Only the rows worth reporting leave NumPy
+            for i in (range(len(frame)) if args.all else (flagged | (codes < 0)).nonzero()[0].tolist()):
+                record = {'row': rows + i, 'Equipment_ID': equipment_ids[i] if isinstance(equipment_ids[i], str) else None}
+                if codes[i] < 0: record['error'] = 'Invalid or missing equipment_Type.'
+                else: record.update(equipment_type=scorer.types[codes[i]], is_anomaly=bool(flagged[i]), anomalies=scorer.offending(z_scores[i], anomalous[i]))
+                out.write(json.dumps(record) + '\n')
+            rows += len(frame)
+    finally:
+        if out is not sys.stdout: out.close()
+    elapsed = time.perf_counter() - start
+    print(f"Scored {rows} rows in {elapsed:.2f} s ({rows / max(elapsed, 1e-9) * 60:,.0f} rows/min): {anomalies} anomalous, {unknown} with unknown type.", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
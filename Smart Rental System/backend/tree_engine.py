@@ -0,0 +1,82 @@
+import numpy as np
+
+
+class CompiledTreeEnsemble:
+    """Pure-NumPy inference over a tree ensemble exported by ML/scripts/compile_tree_models.py.
+
+    All trees live in one set of contiguous node arrays. Inference walks every
+    (row, tree) pair one level per step until all of them sit on a leaf, so one
+    row or a whole batch costs the same handful of vector operations per level.
+    Mirrors the scikit-learn/LightGBM call surface used by the backend.
+    """
+
+    def __init__(self, arrays):
+        self.kind = str(arrays['kind'])
+        self.feature = arrays['feature'].astype(np.intp)
+        self.threshold = arrays['threshold']
+        self.left = arrays['left'].astype(np.intp)
+        self.right = arrays['right'].astype(np.intp)
+        self.value = arrays['value']
+        self.missing_left = arrays['missing_left']
+        self.roots = arrays['roots'].astype(np.intp)
+        self.max_depth = int(arrays['max_depth'])
+        self.feature_names = [str(name) for name in arrays['feature_names']]
+        self.float32_inputs = bool(arrays['float32_inputs'])
+        self.nan_as_zero = bool(arrays['nan_as_zero'])
+        self.holdout = arrays['holdout']
+        self.is_leaf = self.left == np.arange(len(self.left))
+        # children[2 * node + went_right] is the next node, so one gather replaces a where()
+        self.children = np.column_stack([self.left, self.right]).ravel()
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls({key: data[key] for key in data.files})
+
+    def _leaf_values(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if self.float32_inputs: X = X.astype(np.float32).astype(np.float64)
+        if self.nan_as_zero: X = np.nan_to_num(X, nan=0.0)
+        n_rows, n_features = X.shape
+        flat_X = X.ravel()
+        row_offsets = np.repeat(np.arange(n_rows) * n_features, len(self.roots))
+        nodes = np.tile(self.roots, n_rows)
+        has_missing = np.isnan(flat_X).any()
+        for depth in range(self.max_depth):
+            # Checking for "all on a leaf" costs about one level, so only do it every few levels
+            if depth % 4 == 3 and self.is_leaf[nodes].all(): break
+            values = flat_X[row_offsets + self.feature[nodes]]
+            went_right = values > self.threshold[nodes]
+            if has_missing: went_right = (went_right | np.isnan(values)) & ~(np.isnan(values) & self.missing_left[nodes])
+            nodes = self.children[2 * nodes + went_right]
+        return self.value[nodes].reshape(n_rows, len(self.roots))
+
+    def _raw(self, X):
+        leaf_values = self._leaf_values(X)
+        # Accumulate tree by tree, in the same order as the original libraries
+        if len(leaf_values) < 64:
+            total = np.array([sum(row) for row in leaf_values.tolist()])
+        else:
+            total = np.zeros(len(leaf_values))
+            for tree in range(leaf_values.shape[1]):
+                total += leaf_values[:, tree]
+        return total / leaf_values.shape[1] if self.kind == 'forest_classifier' else total
+
+    def predict_proba(self, X):
+        positive = self._raw(X)
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, X):
+        if self.kind == 'forest_classifier':
+            return (self._raw(X) > 0.5).astype(int)
+        return self._raw(X)
+
+    def split_points(self, feature):
+        """Sorted distinct thresholds the ensemble compares column `feature` against; values between two of them score alike."""
+        return np.unique(self.threshold[~self.is_leaf & (self.feature == feature)])
+
+    def max_holdout_error(self, model):
+        """Largest absolute difference from the original model's outputs on the stored holdout rows."""
+        if self.kind == 'forest_classifier':
+            return float(np.max(np.abs(self.predict_proba(self.holdout)[:, 1] - model.predict_proba(self.holdout)[:, 1])))
+        return float(np.max(np.abs(self.predict(self.holdout) - model.predict(self.holdout))))
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+
+class UtilizationIndex:
+    """Per-asset average utilization kept sorted, for threshold and top/bottom-N queries.
+
+    Every array below is parallel and ordered by ascending average utilization,
+    so "below a threshold" is a binary search plus a slice. Type and site are
+    stored as integer codes so the optional filters are cheap vector compares.
+    """
+
+    def __init__(self, df):
+        usage = df.groupby('Equipment_ID', observed=True)['Utilization_Rate'].agg(['mean', 'size'])
+        latest = df[['Equipment_ID', 'CheckOut_Date']].sort_values('CheckOut_Date', kind='stable').drop_duplicates('Equipment_ID', keep='last')
+        last_known = df.loc[latest.index, ['Equipment_ID', 'Type', 'Model', 'GPS_Location']].set_index('Equipment_ID')
+        # Plain values even from a Categorical frame (columnar_store.py), since update_asset() adds new types and sites
+        usage = usage.join(last_known[['Type', 'Model', 'GPS_Location']].astype(object))
+        usage['id_rank'] = np.arange(len(usage))  # groupby output is sorted by Equipment_ID
+        usage = usage.sort_values('mean', kind='stable')
+
+        self.equipment_ids = usage.index.to_numpy()
+        self.avg_utilization = usage['mean'].to_numpy()
+        self.rental_counts = usage['size'].to_numpy()
+        self.models = usage['Model'].to_numpy()
+        self.id_rank = usage['id_rank'].to_numpy()
+        self.type_codes, self.types = pd.factorize(usage['Type'])
+        self.site_codes, self.sites = pd.factorize(usage['GPS_Location'])
+        self._avg_by_id = dict(zip(self.equipment_ids, self.avg_utilization))  # finds an asset again in update_asset()
+
+    def __len__(self):
+        return len(self.equipment_ids)
+
+    def update_asset(self, equipment_id, avg_utilization, rental_count, equipment_type, model, site):
+        """Set one asset's average and last-known attributes, moving it to its new sorted position."""
+        if equipment_type not in self.types: self.types = self.types.append(pd.Index([equipment_type]))
+        if site not in self.sites: self.sites = self.sites.append(pd.Index([site]))
+        values = {'equipment_ids': equipment_id, 'avg_utilization': avg_utilization, 'rental_counts': rental_count, 'models': model, 'type_codes': self.types.get_loc(equipment_type), 'site_codes': self.sites.get_loc(site)}
+        old_avg = self._avg_by_id.get(equipment_id)
+        self._avg_by_id[equipment_id] = avg_utilization
+        if old_avg is None:
+            at = int(np.searchsorted(self.avg_utilization, avg_utilization, side='right'))
+            for name, value in values.items():
+                setattr(self, name, np.insert(getattr(self, name), at, value))
+            # A new Equipment_ID shifts the ranks of the IDs after it
+            self.id_rank = np.argsort(np.argsort(self.equipment_ids, kind='stable'), kind='stable')
+            return
+        # Existing asset: shift the entries between its old and new position by one, in place
+        old = int(np.searchsorted(self.avg_utilization, old_avg, side='left'))
+        while self.equipment_ids[old] != equipment_id: old += 1
+        new = int(np.searchsorted(self.avg_utilization, avg_utilization, side='right'))
+        if new > old: new -= 1
+        values['id_rank'] = self.id_rank[old]
+        for name, value in values.items():
+            array = getattr(self, name)
+            if new < old: array[new + 1:old + 1] = array[new:old].copy()
+            elif new > old: array[old:new] = array[old + 1:new + 1].copy()
+            array[new] = value
+
+    def query(self, threshold=None, equipment_type=None, site=None, min_rentals=0, top=None, bottom=None):
+        """Assets with average utilization below `threshold`, after the optional filters.
+
+        By default results are ordered by Equipment_ID. `bottom`/`top` instead return
+        the N least/most utilized matching assets, ordered from the extreme inwards.
+        """
+        stop = len(self) if threshold is None else int(np.searchsorted(self.avg_utilization, threshold, side='left'))
+        selected = np.ones(stop, dtype=bool)
+        if equipment_type is not None:
+            selected &= self.type_codes[:stop] == self._code(self.types, equipment_type)
+        if site is not None:
+            selected &= self.site_codes[:stop] == self._code(self.sites, site)
+        if min_rentals > 0:
+            selected &= self.rental_counts[:stop] >= min_rentals
+        positions = np.flatnonzero(selected)
+
+        if bottom is not None:
+            positions = positions[:bottom]
+        elif top is not None:
+            positions = positions[::-1][:top]
+        else:
+            positions = positions[np.argsort(self.id_rank[positions])]
+        return [{'Equipment_ID': self.equipment_ids[i], 'Average_Utilization_Rate': f"{self.avg_utilization[i]:.2%}", 'Type': self.types[self.type_codes[i]], 'Model': self.models[i], 'GPS_Location': self.sites[self.site_codes[i]], 'Rental_Count': int(self.rental_counts[i])} for i in positions]
+
+    @staticmethod
+    def _code(categories, value):
+        # -1 never matches a stored code, so an unknown category selects nothing
+        return categories.get_loc(value) if value in categories else -1